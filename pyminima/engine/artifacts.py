@@ -0,0 +1,189 @@
+import base64
+import io
+import itertools
+import os
+import queue
+import re
+import threading
+import time
+
+from pyminima.logs.logger_utils import initialize_logger
+
+DROP_POLICIES = ("drop_newest", "drop_oldest", "block")
+IMAGE_FORMATS = ("png", "webp")
+
+_STOP = object()
+
+
+class ArtifactWriter:
+    """
+    Writes screenshots and page-source dumps on a background thread.
+
+    The action thread only enqueues the raw payload (the base64 screenshot returned by
+    the driver, or the page source). Decoding, image encoding/compression and disk I/O
+    happen on the writer thread. The queue is bounded: when it is full, `drop_policy`
+    decides whether the new artifact is dropped ('drop_newest'), the oldest queued one
+    is dropped ('drop_oldest'), or the caller waits up to `block_timeout` ('block').
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_queue: int = 32,
+        image_format: str = "png",
+        drop_policy: str = "drop_newest",
+        block_timeout: float = 0.005,
+        quality: int = 80,
+    ) -> None:
+        """
+        Initializes the writer. The directory and the thread are created on first use.
+
+        Args:
+            root (str): Directory where artifacts are written.
+            max_queue (int): Maximum number of artifacts waiting to be written. Default is 32.
+            image_format (str): 'png' or 'webp'. Default is 'png'.
+            drop_policy (str): 'drop_newest', 'drop_oldest' or 'block'. Default is 'drop_newest'.
+            block_timeout (float): Maximum seconds a 'block' submit may wait. Default is 5ms.
+            quality (int): WebP quality (1-100). Default is 80.
+
+        Raises:
+            ValueError: If the image format or the drop policy is not supported.
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported artifact image format: {image_format}")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unsupported artifact drop policy: {drop_policy}")
+
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.root = root
+        self.image_format = image_format
+        self.drop_policy = drop_policy
+        self.block_timeout = block_timeout
+        self.quality = quality
+        self.stats = {"queued": 0, "written": 0, "dropped": 0, "failed": 0}
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._sequence = itertools.count(1)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit_screenshot(self, label: str, png_base64: str) -> bool:
+        """
+        Queues a screenshot, as returned by `driver.get_screenshot_as_base64()`.
+
+        Args:
+            label (str): A short description used in the file name.
+            png_base64 (str): The base64-encoded PNG screenshot.
+
+        Returns:
+            bool: Whether the screenshot was queued.
+        """
+        return self._submit("screenshot", label, png_base64)
+
+    def submit_text(self, label: str, text: str, extension: str = "html") -> bool:
+        """
+        Queues a text artifact such as a page-source dump.
+
+        Args:
+            label (str): A short description used in the file name.
+            text (str): The content to write.
+            extension (str): The file extension. Default is 'html'.
+
+        Returns:
+            bool: Whether the artifact was queued.
+        """
+        return self._submit(extension, label, text)
+
+    def close(self, timeout: float = 10) -> None:
+        """
+        Writes every queued artifact and stops the writer thread.
+
+        Args:
+            timeout (float): Maximum seconds to wait for pending artifacts. Default is 10 seconds.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        self.logger.debug(f"Artifact writer closed. Stats: {self.stats}")
+
+    def _submit(self, kind: str, label: str, payload: str) -> bool:
+        self._ensure_thread()
+        name = f"{next(self._sequence):04d}-{_slugify(label)}"
+        item = (kind, name, payload)
+        try:
+            if self.drop_policy == "block":
+                self._queue.put(item, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(item)
+        except queue.Full:
+            if self.drop_policy != "drop_oldest":
+                self._count("dropped")
+                return False
+            try:
+                self._queue.get_nowait()
+                self._count("dropped")
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self._count("dropped")
+                return False
+        self._count("queued")
+        return True
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                os.makedirs(self.root, exist_ok=True)
+                self._thread = threading.Thread(
+                    target=self._run, name="minima-artifacts", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            kind, name, payload = item
+            try:
+                if kind == "screenshot":
+                    self._write_screenshot(name, payload)
+                else:
+                    path = os.path.join(self.root, f"{name}.{kind}")
+                    with open(path, "w", encoding="utf-8") as artifact:
+                        artifact.write(payload)
+                self._count("written")
+            except Exception as e:
+                self._count("failed")
+                self.logger.error(f"Failed to write artifact '{name}'. Error: {e}")
+
+    def _write_screenshot(self, name: str, png_base64: str) -> None:
+        png = base64.b64decode(png_base64)
+        path = os.path.join(self.root, f"{name}.{self.image_format}")
+        if self.image_format == "png":
+            with open(path, "wb") as artifact:
+                artifact.write(png)
+            return
+
+        from PIL import Image
+
+        with Image.open(io.BytesIO(png)) as image:
+            image.save(path, format="WEBP", quality=self.quality, method=4)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+
+def _slugify(label: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", label).strip("-")[:80] or "artifact"
+
+
+def session_artifacts_dir(root: str, session_id: str) -> str:
+    """
+    Builds the per-session artifact directory: `<root>/<timestamp>-<session id prefix>`.
+    """
+    return os.path.join(root, f"{time.strftime('%Y%m%d-%H%M%S')}-{session_id[:8]}")
@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+
+from pyminima.logs.logger_utils import initialize_logger
+
+ENTRIES_DIR = "entries"
+OBJECTS_DIR = "objects"
+
+
+class ResponseStore:
+    """
+    Content-addressed, size-bounded on-disk store of HTTP responses.
+
+    Bodies are stored once per SHA-256 digest under `objects/`, so the same bundle
+    fetched from several URLs costs disk space only once. Each "METHOD URL" key has its
+    own entry file under `entries/` with the digest, status and headers, written
+    atomically when the response is stored: sessions sharing the directory never
+    overwrite each other's entries, and a session that crashes keeps what it stored.
+    An entry file's modification time is its last use; when the stored bodies exceed
+    `max_bytes`, the least recently used entries are evicted.
+    """
+
+    def __init__(self, root: str, max_bytes: int) -> None:
+        """
+        Opens (or creates) a store rooted at the given directory.
+
+        Args:
+            root (str): The store directory.
+            max_bytes (int): The maximum total size of stored bodies, in bytes.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "evicted": 0,
+            "bytes_saved": 0,
+        }
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(self.root, OBJECTS_DIR), exist_ok=True)
+        os.makedirs(os.path.join(self.root, ENTRIES_DIR), exist_ok=True)
+        self._index: dict[str, dict] = self._load_entries()
+        self._refs = Counter(entry["digest"] for entry in self._index.values())
+        self._sizes = {entry["digest"]: entry["size"] for entry in self._index.values()}
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def get(
+        self, method: str, url: str
+    ) -> tuple[int, list[dict[str, str]], bytes] | None:
+        """
+        Looks up a stored response, including ones stored by other sessions since this
+        store was opened.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full request URL.
+
+        Returns:
+            tuple[int, list[dict[str, str]], bytes] | None: Status, headers and body, or None on a miss.
+        """
+        key = self._key(method, url)
+        with self._lock:
+            entry = self._index.get(key) or self._adopt(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            try:
+                with open(self._object_path(entry["digest"]), "rb") as blob:
+                    body = blob.read()
+            except FileNotFoundError:
+                self._drop(key)
+                self.stats["misses"] += 1
+                return None
+            self._index[key] = self._index.pop(key)
+            self._touch(key)
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += len(body)
+            return entry["status"], entry["headers"], body
+
+    def put(
+        self,
+        method: str,
+        url: str,
+        status: int,
+        headers: list[dict[str, str]],
+        body: bytes,
+    ) -> None:
+        """
+        Stores a response, writing the body only if its digest is not stored yet.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full request URL.
+            status (int): The HTTP status code.
+            headers (list[dict[str, str]]): The response headers, as name/value pairs that
+                describe the decoded body (see `pyminima.engine.network.header_list`).
+            body (bytes): The response body.
+        """
+        if len(body) > self.max_bytes:
+            return
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+        with self._lock:
+            key = self._key(method, url)
+            if key in self._index:
+                self._drop(key)
+            if digest not in self._sizes:
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                self._atomic_write(object_path, body)
+                self._sizes[digest] = len(body)
+            self._refs[digest] += 1
+            entry = {
+                "key": key,
+                "digest": digest,
+                "size": len(body),
+                "status": status,
+                "headers": headers,
+            }
+            self._atomic_write(self._entry_path(key), json.dumps(entry).encode())
+            self._index[key] = entry
+            self.stats["stored"] += 1
+            self._evict()
+
+    def flush(self) -> None:
+        """
+        Logs a summary of the store. Entries are already on disk: each one is written
+        when it is stored.
+        """
+        self.logger.info(
+            f"Response cache: {len(self._index)} entries, {self.total_bytes} bytes, "
+            f"hit ratio {self.hit_ratio:.1%}, stats {self.stats}"
+        )
+
+    def _evict(self) -> None:
+        total = self.total_bytes
+        if total <= self.max_bytes:
+            return
+        for key in list(self._index):
+            total -= self._drop(key)
+            self.stats["evicted"] += 1
+            if total <= self.max_bytes:
+                break
+
+    def _drop(self, key: str) -> int:
+        """Removes an entry and, if unreferenced, its body. Returns the bytes freed."""
+        digest = self._index.pop(key)["digest"]
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+        self._refs[digest] -= 1
+        if self._refs[digest] > 0:
+            return 0
+        del self._refs[digest]
+        freed = self._sizes.pop(digest, 0)
+        try:
+            os.remove(self._object_path(digest))
+        except FileNotFoundError:
+            pass
+        return freed
+
+    def _load_entries(self) -> dict[str, dict]:
+        """Reads every entry file, least recently used first."""
+        directory = os.path.join(self.root, ENTRIES_DIR)
+        entries = []
+        for name in os.listdir(directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                used = os.path.getmtime(path)
+            except FileNotFoundError:
+                continue
+            entry = self._read_entry(path)
+            if entry is not None:
+                entries.append((used, entry))
+        entries.sort(key=lambda item: item[0])
+        return {entry["key"]: entry for _, entry in entries}
+
+    def _adopt(self, key: str) -> dict | None:
+        """Loads an entry stored by another session, if there is one."""
+        entry = self._read_entry(self._entry_path(key))
+        if entry is None:
+            return None
+        if entry["digest"] not in self._sizes:
+            self._sizes[entry["digest"]] = entry["size"]
+        self._refs[entry["digest"]] += 1
+        self._index[key] = entry
+        return entry
+
+    @staticmethod
+    def _read_entry(path: str) -> dict | None:
+        try:
+            with open(path, encoding="utf-8") as entry_file:
+                return json.load(entry_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _touch(self, key: str) -> None:
+        try:
+            os.utime(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _entry_path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.root, ENTRIES_DIR, f"{digest}.json")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, OBJECTS_DIR, digest[:2], digest)
+
+    @staticmethod
+    def _key(method: str, url: str) -> str:
+        return f"{method.upper()} {url}"
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
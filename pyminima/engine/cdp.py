@@ -0,0 +1,181 @@
+import itertools
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+from urllib.request import urlopen
+
+import websocket
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class CDPError(Exception):
+    """
+    Exception raised when a Chrome DevTools Protocol command returns an error.
+    """
+
+    def __init__(self, method: str, error: dict):
+        self.method = method
+        self.error = error
+        super().__init__(
+            f"CDP command '{method}' failed: {error.get('message', error)}"
+        )
+
+
+class CDPSession:
+    """
+    Minimal Chrome DevTools Protocol client attached to one page target.
+
+    Selenium's `execute_cdp_cmd` can only send commands; features such as request
+    interception also need CDP events. This client keeps its own websocket to the
+    target, reads it on a background thread and runs event handlers on a small thread
+    pool, so handlers can issue further commands (or sleep) without stalling the reader.
+    """
+
+    def __init__(self, ws_url: str, max_workers: int = 16) -> None:
+        """
+        Opens the websocket connection to the given DevTools target.
+
+        Args:
+            ws_url (str): The target's `webSocketDebuggerUrl`.
+            max_workers (int): Number of threads used to run event handlers. Default is 16.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._ws = websocket.create_connection(ws_url, suppress_origin=True)
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._pending: dict[int, tuple[str, Future]] = {}
+        self._handlers: dict[str, list[Callable[[dict], None]]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="minima-cdp"
+        )
+        self._closed = False
+        self._reader = threading.Thread(
+            target=self._read_loop, name="minima-cdp-reader", daemon=True
+        )
+        self._reader.start()
+
+    @classmethod
+    def attach(cls, driver: WebDriver) -> "CDPSession":
+        """
+        Attaches to the page target behind the driver's current window.
+
+        Args:
+            driver (WebDriver): A Chromium-based WebDriver session.
+
+        Returns:
+            CDPSession: A connected session.
+
+        Raises:
+            NotImplementedError: If the driver does not expose a DevTools debugger address.
+        """
+        chrome_options = next(
+            (
+                value
+                for key, value in driver.capabilities.items()
+                if key.endswith("chromeOptions") and isinstance(value, dict)
+            ),
+            {},
+        )
+        debugger_address = chrome_options.get("debuggerAddress")
+        if not debugger_address:
+            raise NotImplementedError(
+                "This feature requires a Chromium-based browser exposing the DevTools protocol."
+            )
+
+        with urlopen(f"http://{debugger_address}/json/list") as response:
+            targets = json.loads(response.read())
+        pages = [target for target in targets if target.get("type") == "page"]
+        current = driver.current_window_handle
+        target = next((page for page in pages if page["id"] == current), None)
+        if target is None:
+            target = pages[0]
+        return cls(target["webSocketDebuggerUrl"])
+
+    def send(
+        self, method: str, params: dict | None = None, timeout: float = 10
+    ) -> dict:
+        """
+        Sends a CDP command and waits for its result.
+
+        Args:
+            method (str): The CDP method name (e.g. 'Fetch.enable').
+            params (dict | None): The command parameters.
+            timeout (float): Maximum time in seconds to wait for the result. Default is 10 seconds.
+
+        Returns:
+            dict: The command result.
+
+        Raises:
+            CDPError: If the browser answers with an error.
+        """
+        message_id = next(self._ids)
+        future: Future = Future()
+        self._pending[message_id] = (method, future)
+        payload = json.dumps(
+            {"id": message_id, "method": method, "params": params or {}}
+        )
+        try:
+            with self._send_lock:
+                self._ws.send(payload)
+            return future.result(timeout)
+        finally:
+            # A reply arriving after a timeout finds no waiter and is dropped.
+            self._pending.pop(message_id, None)
+
+    def on(self, event: str, handler: Callable[[dict], None]) -> None:
+        """
+        Registers a handler for a CDP event. Handlers receive the event params.
+
+        Args:
+            event (str): The CDP event name (e.g. 'Fetch.requestPaused').
+            handler (Callable[[dict], None]): The callback to run on the handler thread pool.
+        """
+        self._handlers.setdefault(event, []).append(handler)
+
+    def close(self) -> None:
+        """
+        Closes the websocket and stops the handler thread pool.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._ws.close()
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _read_loop(self) -> None:
+        while not self._closed:
+            try:
+                raw = self._ws.recv()
+            except Exception:
+                break
+            if not raw:
+                continue
+            message = json.loads(raw)
+            if "id" in message:
+                method, future = self._pending.pop(message["id"], (None, None))
+                if future is None:
+                    continue
+                if "error" in message:
+                    future.set_exception(CDPError(method, message["error"]))
+                else:
+                    future.set_result(message.get("result", {}))
+            else:
+                for handler in self._handlers.get(message.get("method"), []):
+                    self._executor.submit(
+                        self._run_handler, handler, message.get("params", {})
+                    )
+
+        for _, future in self._pending.values():
+            future.set_exception(ConnectionError("CDP connection closed."))
+        self._pending.clear()
+
+    def _run_handler(self, handler: Callable[[dict], Any], params: dict) -> None:
+        try:
+            handler(params)
+        except Exception as e:
+            if not self._closed:
+                self.logger.error(f"CDP event handler failed. Error: {e}")
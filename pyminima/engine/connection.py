@@ -0,0 +1,103 @@
+from selenium.webdriver.remote.client_config import ClientConfig
+
+from pyminima.engine.deadline import install_deadline_pools
+from pyminima.logs.logger_utils import initialize_logger
+from pyminima.settings.settings import config
+
+
+def pool_manager_arguments() -> dict:
+    """
+    Returns the urllib3 PoolManager arguments built from the HTTP settings, in the nested
+    form expected by Selenium's `ClientConfig.init_args_for_pool_manager`.
+    """
+    return {
+        "init_args_for_pool_manager": {
+            "num_pools": config.http_pool_connections,
+            "maxsize": config.http_pool_maxsize,
+            "block": config.http_pool_block,
+        }
+    }
+
+
+def build_client_config(remote_server_addr: str) -> ClientConfig:
+    """
+    Builds a Selenium ClientConfig for a remote WebDriver server from the HTTP settings.
+
+    Args:
+        remote_server_addr (str): The WebDriver server URL.
+
+    Returns:
+        ClientConfig: The client configuration.
+    """
+    return ClientConfig(
+        remote_server_addr,
+        keep_alive=config.http_keep_alive,
+        timeout=config.http_timeout,
+        init_args_for_pool_manager=pool_manager_arguments(),
+    )
+
+
+def remote_client_config(command_executor: object) -> ClientConfig | None:
+    """
+    Returns the ClientConfig of a driver's remote connection, or None if the connection
+    does not keep one (the public `client_config` property only exists in newer Selenium).
+
+    Args:
+        command_executor (object): The driver's `command_executor` (a Selenium RemoteConnection).
+    """
+    return getattr(command_executor, "client_config", None) or getattr(
+        command_executor, "_client_config", None
+    )
+
+
+def connection_manager(command_executor: object) -> object:
+    """
+    Returns the urllib3 pool manager a driver's remote connection sends its requests
+    through: the shared one with keep-alive, otherwise a new one (see `configure_connection`).
+
+    Args:
+        command_executor (object): The driver's `command_executor` (a Selenium RemoteConnection).
+    """
+    client_config = remote_client_config(command_executor)
+    manager = getattr(command_executor, "_conn", None)
+    if manager is not None and client_config is not None and client_config.keep_alive:
+        return manager
+    return command_executor._get_connection_manager()
+
+
+def configure_connection(command_executor: object) -> None:
+    """
+    Applies the HTTP settings (keep-alive, timeout and pool size) to the remote connection
+    of a driver started by Selenium, replacing its connection pool, and makes it honour
+    command deadlines.
+
+    Local drivers create their RemoteConnection internally with Selenium's defaults: no
+    request timeout and one pooled socket per host, so concurrent commands on a session
+    open and discard extra connections (and leave them in TIME_WAIT).
+
+    The pool is replaced through Selenium internals; if they are missing, the connection
+    is left with Selenium's defaults and a warning is logged.
+
+    Args:
+        command_executor (object): The driver's `command_executor` (a Selenium RemoteConnection).
+    """
+    client_config = remote_client_config(command_executor)
+    build_manager = getattr(command_executor, "_get_connection_manager", None)
+    if client_config is None or build_manager is None:
+        initialize_logger("Connection").warning(
+            "The driver connection does not expose a client config and pool manager: "
+            "HTTP settings and command deadlines are not applied."
+        )
+        return
+    client_config.keep_alive = config.http_keep_alive
+    client_config.timeout = config.http_timeout
+    client_config.init_args_for_pool_manager = pool_manager_arguments()
+
+    # Without keep-alive Selenium builds a pool manager per request and ignores `_conn`;
+    # the old one is only cleared, so Selenium's close() still finds it.
+    previous = getattr(command_executor, "_conn", None)
+    if config.http_keep_alive:
+        command_executor._conn = build_manager()
+    install_deadline_pools(command_executor)
+    if previous is not None:
+        previous.clear()
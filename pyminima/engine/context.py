@@ -1,10 +1,24 @@
+import atexit
+import os
+import threading
 from contextvars import ContextVar
 from functools import wraps
+from typing import Callable
+from urllib.parse import urlsplit
 
+from pyminima.engine.cache import ResponseStore
 from pyminima.engine.controller import BrowserController
+from pyminima.engine.metrics import registry
+from pyminima.engine.storage_state import StateCache, origin_of
+from pyminima.settings.settings import config
 
 current_session: ContextVar[BrowserController] = ContextVar("current_session")
 
+ISOLATION_MODES = ("browser", "context")
+# Browsers kept running for `isolation="context"` sessions, one per thread and configuration.
+_shared_browsers: dict[tuple, BrowserController] = {}
+_shared_browsers_lock = threading.Lock()
+
 
 def browser_session(
     url: str,
@@ -12,6 +26,17 @@ def browser_session(
     maximize: bool = False,
     headless: bool = False,
     kill_browser: bool = True,
+    fixtures: str | None = None,
+    har: str | None = None,
+    har_mode: str = "replay",
+    latency: float = 0.0,
+    cache: str | None = None,
+    profile: str | None = None,
+    remote_url: str | None = None,
+    state: str | None = None,
+    setup: Callable[[], None] | None = None,
+    user: str = "default",
+    isolation: str | None = None,
 ):
     """
     A decorator that manages a browser session using the BrowserController, with support for configuring
@@ -27,6 +52,24 @@ def browser_session(
         maximize (bool): Whether to start the browser maximized. Default is False.
         headless (bool): Whether to run the browser in headless mode. Default is False.
         kill_browser (bool): Whether to close the browser after the function completes. Default is True.
+        fixtures (str | None): Directory whose files are served in place of the URL's origin. Default is None.
+        har (str | None): HAR file to replay or record. Default is None.
+        har_mode (str): 'replay' (misses reach the network), 'offline' (misses fail) or 'record'. Default is 'replay'.
+        latency (float): Artificial latency in seconds added to every request. Default is 0.
+        cache (str | None): 'record' stores every response in the on-disk cache at `config.cache_path`;
+            'replay' serves responses from it and stores the missing ones. Default is None.
+        profile (str | None): Browser performance profile ('default', 'ci' or 'dense'). Default is
+            `config.browser_profile`.
+        remote_url (str | None): Remote WebDriver server to run the session on. Default is `config.remote_url`.
+        state (str | None): Storage-state file written by `Browser.save_state`, restored before the
+            first navigation. Default is None.
+        setup (Callable[[], None] | None): Expensive setup (usually a login) whose resulting storage
+            state is cached on disk per `user` and origin for `config.state_ttl` seconds. While the
+            cache is fresh, the state is restored and `setup` is skipped. Default is None.
+        user (str): The user the cached state belongs to. Default is 'default'.
+        isolation (str | None): 'browser' starts a new browser for the session; 'context' runs it in a
+            new incognito-style browser context of a browser shared by the thread's sessions
+            (Chromium only). Default is `config.isolation`.
 
     Returns:
         Callable: The wrapped function with the browser session management.
@@ -46,22 +89,158 @@ def browser_session(
             Returns:
                 Any: The result of the decorated function.
             """
-            driver_session = BrowserController(
-                browser_type=browser_type,
-                maximize=maximize,
-                headless=headless,
-                kill_browser=kill_browser,
-            )
+            mode = (isolation or config.isolation).lower()
+            if mode not in ISOLATION_MODES:
+                raise ValueError(f"Unsupported isolation mode: {mode}")
+            if mode == "context":
+                driver_session = _shared_browser(
+                    browser_type, maximize, headless, profile, remote_url
+                ).new_context()
+            else:
+                driver_session = BrowserController(
+                    browser_type=browser_type,
+                    maximize=maximize,
+                    headless=headless,
+                    kill_browser=kill_browser,
+                    profile=profile,
+                    remote_url=remote_url,
+                )
             token = current_session.set(driver_session)
             try:
+                _configure_network(
+                    driver_session, url, fixtures, har, har_mode, latency, cache
+                )
+                pending_setup = _restore_state(driver_session, url, state, setup, user)
                 driver_session.open_url(url)
+                if pending_setup:
+                    setup()
+                    pending_setup.put(user, origin_of(url), driver_session.save_state())
                 return func(*args, **kwargs)
+            except Exception:
+                driver_session.capture_failure(func.__name__)
+                raise
             finally:
                 if kill_browser:
                     driver_session.close_browser()
+                else:
+                    driver_session.artifacts.close()
+                if config.metrics_export:
+                    _export_metrics()
 
                 current_session.reset(token)
 
         return wrapper
 
     return decorator
+
+
+def _shared_browser(
+    browser_type: str,
+    maximize: bool,
+    headless: bool,
+    profile: str | None,
+    remote_url: str | None,
+) -> BrowserController:
+    """
+    Returns the calling thread's running browser for the given configuration, starting it on
+    first use. Shared browsers are closed when the process exits.
+    """
+    key = (threading.get_ident(), browser_type, maximize, headless, profile, remote_url)
+    with _shared_browsers_lock:
+        browser = _shared_browsers.get(key)
+        if browser is None:
+            browser = BrowserController(
+                browser_type=browser_type,
+                maximize=maximize,
+                headless=headless,
+                profile=profile,
+                remote_url=remote_url,
+            )
+            _shared_browsers[key] = browser
+    return browser
+
+
+@atexit.register
+def close_shared_browsers() -> None:
+    """
+    Closes the browsers started for `isolation="context"` sessions.
+    """
+    with _shared_browsers_lock:
+        browsers = list(_shared_browsers.values())
+        _shared_browsers.clear()
+    for browser in browsers:
+        try:
+            browser.close_browser()
+        except Exception as e:
+            browser.logger.warning(f"Failed to close shared browser. Error: {e}")
+
+
+def _configure_network(
+    driver_session: BrowserController,
+    url: str,
+    fixtures: str | None,
+    har: str | None,
+    har_mode: str,
+    latency: float,
+    cache: str | None,
+) -> None:
+    """
+    Applies the session-level interception options of `browser_session` before the first navigation.
+    """
+    if fixtures:
+        parts = urlsplit(url)
+        driver_session.network.serve_fixtures(
+            fixtures, f"{parts.scheme}://{parts.netloc}/"
+        )
+    if har:
+        if har_mode == "record":
+            driver_session.network.record_har(har)
+        elif har_mode in ("replay", "offline"):
+            driver_session.network.replay_har(har, offline=har_mode == "offline")
+        else:
+            raise ValueError(f"Unsupported HAR mode: {har_mode}")
+    if latency:
+        driver_session.network.set_latency(latency)
+    if cache:
+        store = ResponseStore(config.cache_path, config.cache_max_bytes)
+        driver_session.network.use_cache(store, cache)
+
+
+def _restore_state(
+    driver_session: BrowserController,
+    url: str,
+    state: str | None,
+    setup: Callable[[], None] | None,
+    user: str,
+) -> StateCache | None:
+    """
+    Restores the session's starting storage state. Returns the state cache to fill when
+    `setup` must run because no fresh cached state exists.
+
+    Raises:
+        ValueError: If `setup` is given for a URL without an http(s) origin.
+    """
+    if state:
+        driver_session.restore_state(state)
+    if not setup:
+        return None
+    origin = origin_of(url)
+    if origin is None:
+        raise ValueError(f"Cached setup needs an http(s) URL, got: {url}")
+    cache = StateCache(config.state_path, config.state_ttl)
+    cached = cache.get(user, origin)
+    if cached is None:
+        return cache
+    driver_session.restore_state(cached)
+    return None
+
+
+def _export_metrics() -> None:
+    """
+    Writes the process-wide metrics registry to `config.artifacts_path` at session end.
+    """
+    extension = "json" if config.metrics_export == "json" else "prom"
+    registry.export(
+        os.path.join(config.artifacts_path, f"metrics.{extension}"),
+        config.metrics_export,
+    )
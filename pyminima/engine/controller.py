@@ -1,18 +1,80 @@
+import asyncio
+import copy
+import json
 import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from platform import system
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchWindowException, TimeoutException
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.remote.file_detector import UselessFileDetector
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
+from pyminima.engine.artifacts import ArtifactWriter, session_artifacts_dir
+from pyminima.engine.connection import build_client_config, configure_connection
+from pyminima.engine.deadline import Deadline, current_deadline
+from pyminima.engine.downloads import Download, DownloadWatcher, describe
+from pyminima.engine.health import (
+    DRIVER_CRASHES,
+    DRIVER_ERRORS,
+    DRIVER_RECOVERIES,
+    DRIVER_RECOVERY_DURATION,
+    DRIVER_RECOVERY_FAILURES,
+    driver_exited,
+    is_crash,
+    probe_driver,
+    run_with_deadline,
+)
+from pyminima.engine.locators import compile_locator
+from pyminima.engine.metrics import registry
+from pyminima.engine.network import NetworkInterceptor
+from pyminima.engine.readiness import (
+    DOCUMENT_ID_SCRIPT,
+    ELEMENT_READINESS_LEVELS,
+    PAGE_LOAD_STRATEGIES,
+    READINESS_LEVELS,
+    READINESS_TRACKER_SCRIPT,
+    READINESS_WAIT_SCRIPT,
+)
+from pyminima.engine.retry import mark_applied
+from pyminima.engine.scripts import ScriptRegistry
+from pyminima.engine.storage_state import (
+    STORAGE_RESTORE_SCRIPT,
+    STORAGE_SNAPSHOT_SCRIPT,
+    cookie_from_cdp,
+    cookie_matches,
+    cookie_to_cdp,
+    live_cookies,
+    origin_of,
+    read_state,
+    write_state,
+)
+from pyminima.engine.uploads import upload_to_remote
+from pyminima.input.keyboard import KeyboardController, KeySequence
+from pyminima.input.mouse import Mouse, Point
 from pyminima.logs.logger_utils import initialize_logger
+from pyminima.settings.browser_profiles import BROWSER_PROFILES
+from pyminima.settings.exceptions import (
+    BrowserWaitForPageLoadException,
+    CommandTimeoutException,
+    ElementNotStableException,
+)
 from pyminima.settings.settings import config
 
 FIREFOX_BIN_LINUX = os.path.join(
@@ -30,6 +92,17 @@ CHROME_BIN_WINDOWS = os.path.join(
     "C:\\", "Program Files", "Google", "Chrome", "Application", "chrome.exe"
 )
 
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+
+def _new_download_dir() -> str:
+    """
+    Returns the path of a new download directory under `config.download_path`. The
+    directory is not created: the browser creates it on its first download, and
+    `expect_download` before watching it.
+    """
+    return os.path.abspath(os.path.join(config.download_path, uuid.uuid4().hex))
+
 
 class BrowserController:
     """
@@ -43,6 +116,8 @@ class BrowserController:
         maximize: bool,
         headless: bool,
         kill_browser: bool = True,
+        profile: str | None = None,
+        remote_url: str | None = None,
     ) -> None:
         """
         Initializes the BrowserController with the specified browser configuration.
@@ -51,33 +126,646 @@ class BrowserController:
             browser_type (str): The type of browser to use. Supported values: 'firefox' and 'chrome'. Default is 'firefox'.
             maximize (bool): Whether to maximize the browser window on startup. Default is False.
             headless (bool): Whether to run the browser in headless mode. Default is False.
+            profile (str | None): Performance profile ('default', 'ci' or 'dense'). Default is `config.browser_profile`.
+            remote_url (str | None): URL of a remote WebDriver server (e.g. Selenium Grid) to use instead of
+                a local driver. Default is `config.remote_url`.
+
+        Raises:
+            ValueError: If the profile is not supported.
         """
         self.logger = initialize_logger(self.__class__.__name__)
         self.os_type = system()
         self.browser_type = browser_type.lower() or config.browser_type
+        self.profile_name = (profile or config.browser_profile).lower()
+        if self.profile_name not in BROWSER_PROFILES:
+            raise ValueError(f"Unsupported browser profile: {self.profile_name}")
+        self.profile = BROWSER_PROFILES[self.profile_name]
+        self.remote_url = remote_url or config.remote_url
         self.maximize = maximize or config.maximize_browser
-        self.headless = headless or config.headless_mode
+        self.headless = headless or config.headless_mode or self.profile["headless"]
         self.kill_browser = kill_browser
+        self.last_url: str | None = None
+        self.visited_origins: dict[str, None] = {}
+        self._restored_state: dict | None = None
+        self.recoveries = 0
+        self.parent: BrowserController | None = None
+        self.browser_context_id: str | None = None
+        self._active_deadlines: set[Deadline] = set()
+        self._deadlines_lock = threading.Lock()
+        # Downloads land on the driver's host: they are only tracked for local drivers.
+        self.download_dir = None if self.remote_url else _new_download_dir()
+        # Where driver.get returns; open_url waits for the rest of the readiness level.
+        self.page_load_strategy = PAGE_LOAD_STRATEGIES.get(
+            config.page_wait_until, "normal"
+        )
         self.driver = self._initialize_driver()
-        self.original_window = self.driver.current_window_handle
+        self._bind_driver()
+        self.artifacts = ArtifactWriter(
+            session_artifacts_dir(config.artifacts_path, self.session_id or ""),
+            max_queue=config.artifact_queue_size,
+            image_format=config.artifact_format,
+            drop_policy=config.artifact_drop_policy,
+        )
         print(self.original_window)
 
-    def open_url(self, url: str) -> None:
+    def _bind_driver(self) -> None:
+        """
+        (Re)creates the state tied to the current driver: HTTP connection pool, session id,
+        input devices and window handle.
+        """
+        configure_connection(self.driver.command_executor)
+        self.session_id = self.driver.session_id
+        self.keyboard = KeyboardController(self.driver)
+        self.mouse = Mouse(self.driver)
+        self._network: NetworkInterceptor | None = None
+        self._script_timeout = DEFAULT_SCRIPT_TIMEOUT
+        self.original_window = self.driver.current_window_handle
+        self.supports_cdp = self._register_readiness_tracker()
+        self.scripts = ScriptRegistry(self.driver, self.supports_cdp)
+
+    @contextmanager
+    def deadline(self, seconds: float | None = None) -> Iterator[Deadline]:
+        """
+        Context manager giving every driver command issued inside it one shared time budget.
+        Nested deadlines never extend the enclosing one.
+
+        Args:
+            seconds (float | None): The budget in seconds, or None for cancellation only. Default is None.
+
+        Yields:
+            Deadline: The deadline, whose `cancel()` may be called from any thread.
+        """
+        deadline = Deadline(seconds, parent=current_deadline.get())
+        token = current_deadline.set(deadline)
+        with self._deadlines_lock:
+            self._active_deadlines.add(deadline)
+        try:
+            yield deadline
+        finally:
+            with self._deadlines_lock:
+                self._active_deadlines.discard(deadline)
+            current_deadline.reset(token)
+
+    def cancel(self) -> None:
+        """
+        Cancels every command in flight on this session, aborting their HTTP requests.
+        Safe to call from any thread.
+        """
+        with self._deadlines_lock:
+            deadlines = list(self._active_deadlines)
+        for deadline in deadlines:
+            deadline.cancel()
+        self.logger.warning(f"Cancelled {len(deadlines)} pending command(s)")
+
+    async def run_async(
+        self, func: Callable, *args: Any, timeout: float | None = None, **kwargs: Any
+    ) -> Any:
+        """
+        Runs a blocking call (e.g. `Button(id="save").click`) on a worker thread under a deadline.
+        Cancelling the awaiting task cancels the deadline, so the driver request is aborted
+        instead of left running.
+
+        Args:
+            func (Callable): The blocking call.
+            *args (Any): Positional arguments for the call.
+            timeout (float | None): The budget in seconds. Default is None.
+            **kwargs (Any): Keyword arguments for the call.
+
+        Returns:
+            Any: The result of the call.
+        """
+        pending: list[Deadline] = []
+
+        def run() -> Any:
+            with self.deadline(timeout) as deadline:
+                pending.append(deadline)
+                return func(*args, **kwargs)
+
+        try:
+            return await asyncio.to_thread(run)
+        except asyncio.CancelledError:
+            for deadline in pending:
+                deadline.cancel()
+            raise
+
+    def _locator(self, xpath: str) -> tuple[str, str]:
+        """
+        Returns the Selenium locator used to look up an XPath: a native ID/CSS lookup when it
+        finds the same elements (see `compile_locator`) and `config.native_locators` is on.
+        """
+        if config.native_locators:
+            return compile_locator(xpath)
+        return By.XPATH, xpath
+
+    def _wait(self, timeout: float) -> WebDriverWait:
+        """
+        Returns a WebDriverWait whose timeout is clamped to the remaining deadline, if any.
+        """
+        deadline = current_deadline.get()
+        if deadline is not None:
+            timeout = deadline.clamp(timeout)
+        return WebDriverWait(self.driver, timeout)
+
+    @property
+    def network(self) -> NetworkInterceptor:
+        """
+        Returns the session's request interceptor, creating it on first use.
+        Interception relies on the DevTools protocol and is only available on Chromium-based browsers.
+
+        Raises:
+            NotImplementedError: If the browser does not support request interception.
+        """
+        if self._network is None:
+            if self.browser_type != "chrome":
+                raise NotImplementedError(
+                    f"Request interception is not supported on '{self.browser_type}'."
+                )
+            self._network = NetworkInterceptor(self)
+        return self._network
+
+    def _register_readiness_tracker(self) -> bool:
+        """
+        Registers the fetch/XHR tracker to run on every new document, where the browser
+        supports it (Chromium, via CDP). Elsewhere the readiness wait injects it on demand.
+
+        Returns:
+            bool: Whether the driver accepts CDP commands.
+        """
+        if self.browser_type != "chrome":
+            return False
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": READINESS_TRACKER_SCRIPT},
+            )
+        except WebDriverException as e:
+            self.logger.debug(f"Readiness tracker not registered. Error: {e}")
+            return False
+        return True
+
+    def open_url(
+        self, url: str, wait_until: str | None = None, timeout: float | None = None
+    ) -> None:
         """
-        Opens the specified URL in the browser.
+        Opens the specified URL in the browser and waits until the page is ready.
+
+        The browser's page load strategy is chosen from `config.page_wait_until` when the
+        driver is created, so `driver.get` itself returns at that level: a lower
+        `wait_until` for one call is a minimum and still waits as long as the configured one.
 
         Args:
             url (str): The URL to open in the browser.
+            wait_until (str | None): Readiness level: 'none', 'domcontentloaded', 'load' or 'networkidle'.
+                Default is `config.page_wait_until`.
+            timeout (float | None): Maximum seconds to wait for readiness. Default is `config.page_load_timeout`.
+
+        Raises:
+            BrowserWaitForPageLoadException: If the page is not ready within the timeout.
         """
         self.logger.info(f"Open url: {url} ")
+        wait_until = wait_until or config.page_wait_until
+        previous_document = None
+        if self.page_load_strategy == "none" and wait_until != "none":
+            # driver.get returns before the new document replaces the current one. The wait
+            # gives a navigation `config.navigation_grace_ms` to start, then checks the current
+            # document, so same-document navigations (hash changes) do not wait the timeout.
+            previous_document = self.driver.execute_script(DOCUMENT_ID_SCRIPT)
         self.driver.get(url)
+        self.last_url = url
+        origin = origin_of(url)
+        if origin:
+            self.visited_origins[origin] = None
+        self.wait_for_page(wait_until, timeout, previous_document)
+
+    def save_state(self, path: str | None = None) -> dict:
+        """
+        Takes a snapshot of the session's cookies, localStorage and sessionStorage, so a later
+        session can start already logged in (see `restore_state`).
+
+        On Chromium, all cookies and the localStorage of every origin opened with `open_url`
+        are read through CDP. Elsewhere, WebDriver only exposes the current document's origin.
+        sessionStorage is tab-scoped and always comes from the current document.
+
+        Args:
+            path (str | None): File to write the snapshot to (readable by its owner only). Default is None.
+
+        Returns:
+            dict: The snapshot: `saved_at`, `cookies` and one `origins` entry per origin.
+        """
+        current = self.driver.execute_script(STORAGE_SNAPSHOT_SCRIPT)
+        origins = {}
+        if origin_of(current["origin"]):
+            origins[current["origin"]] = current
+        if self.supports_cdp:
+            cookies = [
+                cookie_from_cdp(cookie)
+                for cookie in self.driver.execute_cdp_cmd(
+                    "Storage.getCookies", self._context_scope()
+                )["cookies"]
+            ]
+            for origin in self.visited_origins:
+                if origin not in origins:
+                    origins[origin] = {
+                        "origin": origin,
+                        "localStorage": self._read_local_storage(origin),
+                        "sessionStorage": {},
+                    }
+        else:
+            cookies = self.driver.get_cookies()
+
+        state = {
+            "saved_at": time.time(),
+            "cookies": cookies,
+            "origins": list(origins.values()),
+        }
+        if path:
+            write_state(path, state)
+        self.logger.info(
+            f"Saved storage state: {len(cookies)} cookies, {len(origins)} origins"
+        )
+        return state
+
+    def restore_state(self, state: dict | str) -> None:
+        """
+        Restores a snapshot taken by `save_state`, in bulk, before the session's first navigation.
+
+        On Chromium, all cookies are set with one CDP command and storage is seeded by a script
+        that runs when a document of a snapshot origin is created (once per origin and tab).
+        Elsewhere, WebDriver can only write to the current document's origin, so each snapshot
+        origin is opened once to set its cookies and storage.
+
+        Args:
+            state (dict | str): The snapshot, or the path of a file written by `save_state`.
+
+        Raises:
+            FileNotFoundError: If the snapshot file does not exist.
+        """
+        if isinstance(state, str):
+            state = read_state(state)
+        self._restored_state = state
+        cookies = live_cookies(state.get("cookies", []))
+        origins = state.get("origins", [])
+        if self.supports_cdp:
+            self.driver.execute_cdp_cmd(
+                "Storage.setCookies",
+                {
+                    "cookies": [cookie_to_cdp(cookie) for cookie in cookies],
+                    **self._context_scope(),
+                },
+            )
+            seeded = [
+                entry
+                for entry in origins
+                if entry.get("localStorage") or entry.get("sessionStorage")
+            ]
+            if seeded:
+                self.driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument",
+                    {"source": STORAGE_RESTORE_SCRIPT % json.dumps(seeded)},
+                )
+        else:
+            pending = list(cookies)
+            for entry in origins:
+                self.driver.get(entry["origin"])
+                for cookie in [
+                    c for c in pending if cookie_matches(c, entry["origin"])
+                ]:
+                    self.driver.add_cookie(cookie)
+                    pending.remove(cookie)
+                self.driver.execute_script(
+                    STORAGE_RESTORE_SCRIPT % "arguments[0]", [entry]
+                )
+            if pending:
+                self.logger.warning(
+                    f"{len(pending)} cookies not restored: no snapshot origin for their domain"
+                )
+        self.logger.info(
+            f"Restored storage state: {len(cookies)} cookies, {len(origins)} origins"
+        )
+
+    def _context_scope(self) -> dict[str, str]:
+        """
+        CDP parameters scoping a browser-wide command (such as the Storage cookie commands)
+        to this session's browser context; empty for the default context.
+        """
+        if self.browser_context_id is None:
+            return {}
+        return {"browserContextId": self.browser_context_id}
+
+    def _read_local_storage(self, origin: str) -> dict[str, str]:
+        """
+        Reads the localStorage of any origin through CDP, without navigating to it.
+        """
+        try:
+            self.driver.execute_cdp_cmd("DOMStorage.enable", {})
+            result = self.driver.execute_cdp_cmd(
+                "DOMStorage.getDOMStorageItems",
+                {"storageId": {"securityOrigin": origin, "isLocalStorage": True}},
+            )
+        except WebDriverException as e:
+            self.logger.debug(f"localStorage of {origin} not read. Error: {e}")
+            return {}
+        return dict(result.get("entries", []))
+
+    def wait_for_page(
+        self,
+        wait_until: str | None = None,
+        timeout: float | None = None,
+        previous_document: str | None = None,
+        navigation_grace_ms: float | None = None,
+    ) -> None:
+        """
+        Waits, in one in-page polling loop, until the document reaches a readiness level:
+        'domcontentloaded' (DOM parsed), 'load' (readyState complete and two animation frames
+        rendered) or 'networkidle' (load, plus no fetch/XHR in flight for `config.network_idle_ms`).
+
+        Args:
+            wait_until (str | None): The readiness level. Default is `config.page_wait_until`.
+            timeout (float | None): Maximum seconds to wait. Default is `config.page_load_timeout`.
+            previous_document (str | None): Id of the document a click was performed on; the wait
+                first gives a navigation the chance to replace it. Default is None.
+            navigation_grace_ms (float | None): How long a navigation is given to start and replace
+                `previous_document` before that document is checked itself (e.g. after a hash change),
+                in milliseconds. Default is `config.navigation_grace_ms`.
+
+        Raises:
+            ValueError: If the readiness level is not supported.
+            BrowserWaitForPageLoadException: If the page is not ready within the timeout.
+            WebDriverException: If the driver returns no readiness state.
+        """
+        wait_until = wait_until or config.page_wait_until
+        if wait_until not in READINESS_LEVELS:
+            raise ValueError(f"Unsupported readiness level: {wait_until}")
+        if wait_until == "none":
+            return
+
+        timeout = timeout or config.page_load_timeout
+        expires_at = time.monotonic() + timeout
+        self._ensure_script_timeout(timeout)
+        while True:
+            remaining = expires_at - time.monotonic()
+            if remaining <= 0:
+                raise BrowserWaitForPageLoadException(timeout)
+            try:
+                state = self.driver.execute_async_script(
+                    READINESS_WAIT_SCRIPT,
+                    wait_until,
+                    remaining * 1000,
+                    config.network_idle_ms,
+                    previous_document,
+                    navigation_grace_ms or config.navigation_grace_ms,
+                )
+            except (JavascriptException, TimeoutException) as e:
+                # The document was replaced while the script was waiting: poll the new one.
+                self.logger.debug(f"Readiness wait interrupted, retrying. Error: {e}")
+                continue
+            if state is None:
+                raise WebDriverException("The readiness wait returned no state.")
+            if state["ready"]:
+                return
+            raise BrowserWaitForPageLoadException(timeout)
+
+    def is_healthy(self, timeout: float | None = None) -> bool:
+        """
+        Probes the driver: the driver process must be running and the page must answer a
+        trivial script within the timeout, so dead and hung browsers are both detected quickly.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait for the probe. Default is `config.health_check_timeout`.
+
+        Returns:
+            bool: Whether the browser session is usable.
+        """
+        return probe_driver(self.driver, timeout or config.health_check_timeout)
+
+    def recover(self) -> None:
+        """
+        Replaces a dead or hung browser with a new one, restores the storage state the session
+        started from (if any) and reopens the last URL.
+        Page state, open tabs and request interception routes are not restored.
+
+        Raises:
+            Exception: If the new browser cannot be started or the last URL cannot be opened.
+        """
+        self.logger.warning(f"Recovering browser session {self.session_id}")
+        with registry.time(DRIVER_RECOVERY_DURATION, browser=self.browser_type):
+            if self._network is not None:
+                # Closes the DevTools websocket and its reader thread.
+                run_with_deadline(self._network.stop, config.health_check_timeout)
+                self._network = None
+            run_with_deadline(self.driver.quit, config.health_check_timeout)
+            try:
+                self.driver = self._initialize_driver()
+                self._bind_driver()
+                if self._restored_state:
+                    self.restore_state(self._restored_state)
+                if self.last_url:
+                    self.driver.get(self.last_url)
+            except Exception:
+                registry.increment(DRIVER_RECOVERY_FAILURES, browser=self.browser_type)
+                raise
+        self.recoveries += 1
+        registry.increment(DRIVER_RECOVERIES, browser=self.browser_type)
+        self.logger.info(f"Browser session recovered as {self.session_id}")
+
+    def recover_from(self, error: Exception) -> bool:
+        """
+        Called when a command fails. If the browser is gone and `config.auto_recover` allows
+        it, restarts it so the caller can retry the command. Browser contexts are never
+        restarted, as their browser is shared.
+
+        The browser counts as gone when the error reports a lost session or the driver
+        process has exited. Only a command the driver did not answer within its deadline
+        leads to a probe (see `is_healthy`); ordinary failures such as missing elements,
+        expired waits or stale references never do.
+
+        Args:
+            error (Exception): The exception raised by the failed command.
+
+        Returns:
+            bool: Whether the browser was restarted and the command should be retried.
+        """
+        if not isinstance(error, DRIVER_ERRORS) or self.parent is not None:
+            return False
+        if not is_crash(error) and not driver_exited(self.driver):
+            if not isinstance(error, CommandTimeoutException) or self.is_healthy():
+                return False
+        registry.increment(DRIVER_CRASHES, browser=self.browser_type)
+        self.logger.error(
+            f"Browser session {self.session_id} is not responding: {error}"
+        )
+        if not config.auto_recover or self.recoveries >= config.max_recoveries:
+            return False
+        try:
+            self.recover()
+        except Exception as e:
+            self.logger.error(f"Failed to recover browser session. Error: {e}")
+            return False
+        return True
+
+    @contextmanager
+    def expect_download(self, timeout: float | None = None) -> Iterator[Download]:
+        """
+        Waits, when the block exits, for a download started inside it to complete in the
+        session's download directory. Partial files (`.crdownload`, `.part`) are waited for.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait after the block. Default is `config.download_timeout`.
+
+        Yields:
+            Download: Filled in with the file's path, size and SHA-256 digest when the block exits.
+
+        Raises:
+            NotImplementedError: If the session runs on a remote driver.
+            DownloadTimeoutException: If no download completes within the timeout.
+        """
+        if self.download_dir is None:
+            raise NotImplementedError(
+                "Download tracking is only available for local drivers."
+            )
+        os.makedirs(self.download_dir, exist_ok=True)
+        watcher = DownloadWatcher(self.download_dir)
+        download = Download()
+        yield download
+        path = watcher.wait(timeout or config.download_timeout)
+        describe(path, download)
+        self.logger.info(f"Downloaded {download.path} ({download.size} bytes)")
+
+    def new_context(self) -> "BrowserController":
+        """
+        Creates an isolated, incognito-style browser context (own cookies, storage and cache)
+        inside this browser, opened in a new window, and returns a controller bound to it.
+
+        A context costs milliseconds and tens of MB, where a new browser costs seconds and
+        hundreds of MB. Contexts share this browser's WebDriver session, which drives one
+        window at a time: use them one after the other, not from concurrent threads.
+        `close_browser()` on the returned controller disposes of the context only.
+
+        Returns:
+            BrowserController: A controller for the new context.
+
+        Raises:
+            NotImplementedError: If the browser does not support CDP browser contexts.
+        """
+        if not self.supports_cdp:
+            raise NotImplementedError(
+                f"Browser contexts are not supported on '{self.browser_type}'."
+            )
+        handles = set(self.driver.window_handles)
+        context_id = self.driver.execute_cdp_cmd("Target.createBrowserContext", {})[
+            "browserContextId"
+        ]
+        self.driver.execute_cdp_cmd(
+            "Target.createTarget",
+            {"url": "about:blank", "browserContextId": context_id},
+        )
+        (window,) = set(self.driver.window_handles) - handles
+        self.driver.switch_to.window(window)
+        download_dir = _new_download_dir() if self.download_dir else None
+        if download_dir:
+            self.driver.execute_cdp_cmd(
+                "Browser.setDownloadBehavior",
+                {
+                    "behavior": "allow",
+                    "browserContextId": context_id,
+                    "downloadPath": download_dir,
+                },
+            )
+
+        context = copy.copy(self)
+        context.parent = self
+        context.browser_context_id = context_id
+        context.original_window = window
+        context.download_dir = download_dir
+        context.last_url = None
+        context.visited_origins = {}
+        context._restored_state = None
+        context.recoveries = 0
+        context._network = None
+        context._active_deadlines = set()
+        context._deadlines_lock = threading.Lock()
+        context._register_readiness_tracker()
+        context.scripts = ScriptRegistry(self.driver, self.supports_cdp)
+        context.artifacts = ArtifactWriter(
+            session_artifacts_dir(config.artifacts_path, context_id),
+            max_queue=config.artifact_queue_size,
+            image_format=config.artifact_format,
+            drop_policy=config.artifact_drop_policy,
+        )
+        self.logger.debug(f"Created browser context {context_id}")
+        return context
 
     def close_browser(self) -> None:
         """
-        Closes the browser and ends the WebDriver session.
+        Closes the browser and ends the WebDriver session. For a controller created by
+        `new_context`, disposes of the context and leaves the browser running. The
+        session's download directory is removed if it is empty.
         """
+        if self._network is not None:
+            self._network.stop()
+        if self.parent is not None:
+            self.logger.debug(f"Disposing browser context {self.browser_context_id}")
+            self.driver.execute_cdp_cmd(
+                "Target.disposeBrowserContext",
+                {"browserContextId": self.browser_context_id},
+            )
+            self.driver.switch_to.window(self.parent.original_window)
+            self.artifacts.close()
+            self._remove_download_dir()
+            return
         self.logger.debug("Killing browser session")
         self.driver.quit()
+        self.artifacts.close()
+        self._remove_download_dir()
+
+    def _remove_download_dir(self) -> None:
+        """
+        Removes the session's download directory if nothing was downloaded into it.
+        Downloaded files are left in place.
+        """
+        if self.download_dir is None:
+            return
+        try:
+            os.rmdir(self.download_dir)
+        except OSError:
+            pass
+
+    def capture_screenshot(self, label: str) -> None:
+        """
+        Takes a screenshot and hands it to the background artifact writer.
+        Only the screenshot command runs on the calling thread; decoding, encoding and disk I/O do not.
+
+        Args:
+            label (str): A short description used in the artifact file name.
+        """
+        self.artifacts.submit_screenshot(label, self.driver.get_screenshot_as_base64())
+
+    def capture_failure(self, label: str) -> None:
+        """
+        Captures a screenshot and a page-source dump after a failure, if enabled in settings.
+        Errors are logged and swallowed, since the browser may be the reason for the failure.
+
+        Args:
+            label (str): A short description used in the artifact file names.
+        """
+        if not config.capture_on_failure:
+            return
+        try:
+            self.capture_screenshot(f"failure-{label}")
+            self.artifacts.submit_text(f"failure-{label}", self.driver.page_source)
+            self.logger.info(f"Failure artifacts queued for: {label}")
+        except Exception as e:
+            self.logger.warning(f"Could not capture failure artifacts. Error: {e}")
+
+    def after_action(self, label: str) -> None:
+        """
+        Hook run after every UI element action. Captures a screenshot when per-action capture is enabled.
+
+        Args:
+            label (str): The action name (e.g. 'Button.click').
+        """
+        if config.capture_each_action:
+            self.capture_screenshot(label)
 
     def accept_alert(self, timeout: int = 5) -> None:
         """
@@ -91,7 +779,7 @@ class BrowserController:
         """
         try:
             self.logger.debug(f"Waiting for alert for {timeout} seconds.")
-            WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            self._wait(timeout).until(EC.alert_is_present())
             alert = self.driver.switch_to.alert
             alert_text = alert.text
             self.logger.info(f"Accepting alert with text: '{alert_text}'")
@@ -157,45 +845,148 @@ class BrowserController:
                 "Cannot close the tab as it is the only one open. Use `close_browser()` to end the session."
             )
 
-    def find_element(self, xpath: str, timeout: int = 10) -> Any:
+    def find_element(
+        self, xpath: str, timeout: int = 10, wait_for: str = "clickable"
+    ) -> Any:
         """
         Locates and returns a web element based on the given XPath.
 
         Args:
             xpath (str): The XPath locator string for the desired element.
             timeout (int): The maximum time (in seconds) to wait for the element to be located. Default is 10 seconds.
+            wait_for (str): 'clickable' (visible and enabled) or 'stable' (clickable, and neither
+                moving nor covered; see `wait_for_stable`). Default is 'clickable'.
 
         Returns:
             Any: The located WebElement.
 
         Raises:
             TimeoutException: If the element is not found within the given time.
+            ElementNotStableException: If the element does not become stable within the given time.
         """
+        if wait_for not in ELEMENT_READINESS_LEVELS:
+            raise ValueError(f"Unsupported element readiness level: {wait_for}")
         self.logger.debug(f"Searching for a element using the following xpath: {xpath}")
         self.wait_for_element(xpath)
-        return WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable((By.XPATH, xpath))
+        element = self._wait(timeout).until(
+            EC.element_to_be_clickable(self._locator(xpath))
         )
+        if wait_for == "stable":
+            self.wait_for_stable(element, xpath, timeout)
+        return element
+
+    def wait_for_stable(self, element: Any, xpath: str, timeout: float = 10) -> None:
+        """
+        Waits in the page until the element is stable: its bounding box is unchanged across
+        two animation frames and no other element covers its center. Returns as soon as it
+        is, so elements that are already still cost one round trip and about two frames.
+
+        Args:
+            element (Any): The WebElement to wait for.
+            xpath (str): The element's XPath, for the error message.
+            timeout (float): Maximum time (in seconds) to wait. Default is 10 seconds.
+
+        Raises:
+            ElementNotStableException: If the element is still moving, covered or detached
+                from the document when the timeout expires.
+        """
+        self._ensure_script_timeout(timeout)
+        status = self.scripts.call_async("waitStable", element, timeout * 1000)
+        if status != "stable":
+            raise ElementNotStableException(xpath, timeout, status)
 
-    def click_element(self, xpath: str, timeout: int = 10) -> None:
+    def click_element(
+        self,
+        xpath: str,
+        timeout: int = 10,
+        wait_until: str | None = None,
+        wait_for: str | None = None,
+    ) -> None:
         """
         Clicks on the element specified by the given XPath.
 
         Args:
             xpath (str): The XPath locator string for the element to be clicked.
             timeout (int): The maximum time (in seconds) to wait for the element to be located. Default is 10 seconds.
+            wait_until (str | None): Readiness level to wait for after the click, for clicks that
+                navigate or load content (see `wait_for_page`). Default is None (no wait).
+            wait_for (str | None): Element readiness level to wait for before the click ('clickable'
+                or 'stable', see `find_element`). Default is `config.element_wait_for`.
 
         Raises:
             TimeoutException: If the element is not found within the given time.
+            BrowserWaitForPageLoadException: If the page is not ready within the timeout.
         """
         self.logger.debug(f"Click a element using the following xpath: {xpath}")
+        element = self.find_element(xpath, timeout, wait_for or config.element_wait_for)
+        if not wait_until or wait_until == "none":
+            self.scripts.call("click", element)
+            return
+        previous_document = self.scripts.call("clickAndMark", element)
+        self.wait_for_page(wait_until, timeout, previous_document)
+
+    def hover_element(
+        self, xpath: str, timeout: int = 10, wait_for: str | None = None
+    ) -> None:
+        """
+        Moves the pointer over the element specified by the given XPath.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            timeout (int): Maximum time (in seconds) to wait for the element to be located. Default is 10 seconds.
+            wait_for (str | None): Element readiness level ('clickable' or 'stable', see `find_element`).
+                Default is `config.element_wait_for`.
+        """
+        element = self.find_element(xpath, timeout, wait_for or config.element_wait_for)
+        self.mouse.hover(element)
+
+    def hover_path(self, xpath: str, points: list[Point], timeout: int = 10) -> None:
+        """
+        Moves the pointer through a sequence of points over an element in a single actions command.
+
+        Args:
+            xpath (str): The XPath locator string for the element.
+            points (list[Point]): (x, y) offsets from the element center.
+            timeout (int): Maximum time (in seconds) to wait for the element to be located. Default is 10 seconds.
+        """
+        self.logger.debug(
+            f"Hovering along {len(points)} point(s) over element: {xpath}"
+        )
         element = self.find_element(xpath, timeout)
-        self.driver.execute_script("arguments[0].click();", element)
+        self.mouse.hover_path(element, points)
+
+    def draw_on_element(
+        self, xpath: str, points: list[Point], timeout: int = 10
+    ) -> None:
+        """
+        Presses the pointer on the first point, moves through the others and releases on the last,
+        all in a single actions command. Intended for canvas drawing and smooth drag paths.
 
-    def hover_element(self, xpath: str, timeout: int = 10) -> None:
+        Args:
+            xpath (str): The XPath locator string for the element to draw on.
+            points (list[Point]): (x, y) offsets from the element center.
+            timeout (int): Maximum time (in seconds) to wait for the element to be located. Default is 10 seconds.
+        """
+        self.logger.debug(f"Drawing {len(points)} point(s) on element: {xpath}")
         element = self.find_element(xpath, timeout)
-        hover = ActionChains(self.driver).move_to_element(element)
-        hover.perform()
+        self.mouse.draw(element, points)
+
+    def multi_select_elements(
+        self, xpaths: list[str], modifier: str = "ctrl", timeout: int = 10
+    ) -> None:
+        """
+        Clicks several elements while holding a modifier key, in a single actions command.
+
+        Args:
+            xpaths (list[str]): The XPath locator strings for the elements to click, in order.
+            modifier (str): The modifier key to hold (e.g. 'ctrl', 'shift'). Default is 'ctrl'.
+            timeout (int): Maximum time (in seconds) to wait for each element to be located. Default is 10 seconds.
+        """
+        self.logger.debug(
+            f"Multi-selecting {len(xpaths)} element(s) holding '{modifier}'."
+        )
+        elements = [self.find_element(xpath, timeout) for xpath in xpaths]
+        self.mouse.multi_select(elements, modifier)
 
     def unhover_element(self, timeout: int = 10) -> None:
         """
@@ -206,10 +997,10 @@ class BrowserController:
         """
         self.logger.debug("Unhovering by moving mouse to the body element.")
         try:
-            body_element = WebDriverWait(self.driver, timeout).until(
+            body_element = self._wait(timeout).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            ActionChains(self.driver).move_to_element(body_element).perform()
+            self.mouse.hover(body_element)
         except Exception as e:
             self.logger.error(
                 f"Failed to move mouse to body element to unhover. Error: {e}"
@@ -217,7 +1008,11 @@ class BrowserController:
             raise
 
     def drag_and_drop(
-        self, source_xpath: str, target_xpath: str, timeout: int = 10
+        self,
+        source_xpath: str,
+        target_xpath: str,
+        timeout: int = 10,
+        wait_for: str | None = None,
     ) -> None:
         """
         Performs a drag-and-drop action from a source element to a target element.
@@ -231,36 +1026,19 @@ class BrowserController:
             source_xpath (str): The XPath locator for the element to drag.
             target_xpath (str): The XPath locator for the element to drop onto.
             timeout (int): Maximum time to wait for the elements.
+            wait_for (str | None): Element readiness level for both elements ('clickable' or 'stable',
+                see `find_element`). Default is `config.element_wait_for`.
         """
+        wait_for = wait_for or config.element_wait_for
         try:
-            source_element = self.find_element(source_xpath, timeout)
-            target_element = self.find_element(target_xpath, timeout)
+            source_element = self.find_element(source_xpath, timeout, wait_for)
+            target_element = self.find_element(target_xpath, timeout, wait_for)
 
             if self.browser_type == "firefox":
                 self.logger.debug(
                     f"Performing drag and drop for Firefox using JavaScript from '{source_xpath}' to '{target_xpath}'."
                 )
-                dnd_script = """
-                    const source = arguments[0];
-                    const target = arguments[1];
-
-                    const dataTransfer = new DataTransfer();
-                    const dragStartEvent = new DragEvent('dragstart', { dataTransfer: dataTransfer, bubbles: true, cancelable: true });
-                    source.dispatchEvent(dragStartEvent);
-
-                    const dragEnterEvent = new DragEvent('dragenter', { dataTransfer: dataTransfer, bubbles: true, cancelable: true });
-                    target.dispatchEvent(dragEnterEvent);
-
-                    const dragOverEvent = new DragEvent('dragover', { dataTransfer: dataTransfer, bubbles: true, cancelable: true });
-                    target.dispatchEvent(dragOverEvent);
-
-                    const dropEvent = new DragEvent('drop', { dataTransfer: dataTransfer, bubbles: true, cancelable: true });
-                    target.dispatchEvent(dropEvent);
-
-                    const dragEndEvent = new DragEvent('dragend', { bubbles: true, cancelable: true });
-                    source.dispatchEvent(dragEndEvent);
-                """
-                self.driver.execute_script(dnd_script, source_element, target_element)
+                self.scripts.call("dragAndDrop", source_element, target_element)
                 self.logger.info(
                     "Drag and drop action completed successfully via JavaScript."
                 )
@@ -268,9 +1046,7 @@ class BrowserController:
                 self.logger.debug(
                     f"Performing drag and drop for '{self.browser_type}' using ActionChains from '{source_xpath}' to '{target_xpath}'."
                 )
-                ActionChains(self.driver).drag_and_drop(
-                    source_element, target_element
-                ).perform()
+                self.mouse.drag_and_drop(source_element, target_element)
                 self.logger.info(
                     "Drag and drop action completed successfully via ActionChains."
                 )
@@ -278,6 +1054,19 @@ class BrowserController:
             self.logger.error(f"Drag and drop action failed. Error: {e}")
             raise
 
+    def type_sequence(self, sequence: KeySequence | str) -> None:
+        """
+        Sends a key sequence to the focused element using a single W3C actions command.
+
+        Args:
+            sequence (KeySequence | str): The sequence to perform. Plain strings are typed as text.
+        """
+        if isinstance(sequence, str):
+            self.logger.debug(f"Typing {len(sequence)} character(s) as a key sequence.")
+        else:
+            self.logger.debug(f"Performing key sequence with {len(sequence)} step(s).")
+        self.keyboard.type_sequence(sequence)
+
     def enter_text_safely(self, xpath: str, text: str, timeout: int = 10) -> None:
         """
         Enters the specified text into a text input field safely by focusing on the element before interacting.
@@ -293,9 +1082,11 @@ class BrowserController:
         self.logger.debug(f"Enter text safely: {text} into element with XPath: {xpath}")
         element = self.find_element(xpath, timeout)
 
-        self.driver.execute_script("arguments[0].focus();", element)
+        self.scripts.call("focus", element)
 
         element.clear()
+        # Keys may be typed before send_keys fails (and may submit a form): not retried.
+        mark_applied()
         element.send_keys(text)
 
     def set_element_value(self, xpath: str, value: str, timeout: int = 10) -> None:
@@ -312,12 +1103,8 @@ class BrowserController:
             f"Setting value '{value}' for element with XPath: {xpath} using JavaScript."
         )
         element = self.find_element(xpath, timeout)
-        # Set the value and then dispatch a 'change' event to ensure any listeners are triggered.
-        self.driver.execute_script(
-            "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('change'));",
-            element,
-            value,
-        )
+        # Sets the value and then dispatches a 'change' event to ensure any listeners are triggered.
+        self.scripts.call("setValue", element, value)
 
     def scroll_to_element(self, xpath: str, timeout: int = 10) -> None:
         """
@@ -332,7 +1119,7 @@ class BrowserController:
         """
         self.logger.debug(f"Scrolling to a element using the following xpath: {xpath}")
         element = self.find_element(xpath, timeout)
-        self.driver.execute_script("arguments[0].scrollIntoView();", element)
+        self.scripts.call("scrollIntoView", element)
 
     def wait_for_element(self, xpath: str, timeout: int = 10) -> Any:
         """
@@ -349,9 +1136,213 @@ class BrowserController:
             TimeoutException: If the element is not found within the given time.
         """
         self.logger.debug(f"Wait for a element using the following xpath: {xpath}")
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located((By.XPATH, xpath))
+        return self._wait(timeout).until(
+            EC.visibility_of_element_located(self._locator(xpath))
+        )
+
+    def resolve_all(
+        self, xpaths: list[str], timeout: int = 10, visible: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        Resolves many XPaths with a single in-page script that polls until all of them are
+        ready or the timeout expires, instead of one WebDriverWait loop per locator.
+
+        Args:
+            xpaths (list[str]): The XPath locator strings to resolve.
+            timeout (int): Maximum time (in seconds) to wait for all elements. Default is 10 seconds.
+            visible (bool): Whether an element must be visible to be ready. Default is True.
+
+        Returns:
+            list[dict[str, Any]]: One entry per XPath, in order, with the keys 'xpath',
+                'element' (the WebElement or None) and 'status' ('ready', 'hidden', 'missing' or 'invalid').
+        """
+        self.logger.debug(f"Resolving {len(xpaths)} locator(s) in one script call.")
+        self._ensure_script_timeout(timeout)
+        results = self.scripts.call_async("resolveAll", xpaths, timeout * 1000, visible)
+        return [
+            {"xpath": xpath, "element": result["element"], "status": result["status"]}
+            for xpath, result in zip(xpaths, results)
+        ]
+
+    def find_elements_now(self, xpath: str) -> list:
+        """
+        Returns the elements currently matching the XPath, without waiting: a single
+        `find_elements` command (the session's implicit wait is never set, so it is zero).
+
+        Args:
+            xpath (str): The XPath locator string.
+
+        Returns:
+            list: The matching WebElements, possibly empty.
+        """
+        return self.driver.find_elements(*self._locator(xpath))
+
+    def is_element_visible(self, xpath: str) -> bool:
+        """
+        Tells, without waiting, whether the first element matching the XPath is displayed.
+
+        Args:
+            xpath (str): The XPath locator string.
+
+        Returns:
+            bool: Whether the element exists and is displayed.
+        """
+        elements = self.find_elements_now(xpath)
+        if not elements:
+            return False
+        try:
+            return elements[0].is_displayed()
+        except StaleElementReferenceException:
+            return False
+
+    def first_of(
+        self, xpaths: list[str], timeout: int = 10, visible: bool = True
+    ) -> tuple[int, Any] | None:
+        """
+        Waits for whichever of several XPaths is ready first, in one in-page polling loop.
+        When several are ready in the same poll, the earliest in the list wins.
+
+        Args:
+            xpaths (list[str]): The XPath locator strings to race.
+            timeout (int): Maximum time (in seconds) to wait. Default is 10 seconds.
+            visible (bool): Whether an element must be visible to be ready. Default is True.
+
+        Returns:
+            tuple[int, Any] | None: The index of the winning XPath and its WebElement, or None
+                if none was ready within the timeout.
+        """
+        self.logger.debug(f"Waiting for the first of {len(xpaths)} locator(s).")
+        self._ensure_script_timeout(timeout)
+        result = self.scripts.call_async("firstOf", xpaths, timeout * 1000, visible)
+        if result is None:
+            return None
+        return result["index"], result["element"]
+
+    def start_watch(
+        self,
+        xpath: str,
+        attributes: list[str] | None,
+        text: bool,
+        timeout: int = 10,
+        max_buffer: int = 1000,
+    ) -> str:
+        """
+        Installs an in-page MutationObserver on the element identified by the given XPath.
+
+        Args:
+            xpath (str): The XPath locator string for the element to watch.
+            attributes (list[str] | None): Attribute names to watch; an empty list watches all, None none.
+            text (bool): Whether to report changes to the element's text content.
+            timeout (int): Maximum time (in seconds) to wait for the element to be located. Default is 10 seconds.
+            max_buffer (int): Maximum number of changes kept in the page between polls. Default is 1000.
+
+        Returns:
+            str: The watch id used by `poll_watch` and `stop_watch`.
+        """
+        self.logger.debug(f"Watching element with XPath: {xpath}")
+        element = self.wait_for_element(xpath, timeout)
+        watch_id = uuid.uuid4().hex
+        self.scripts.call(
+            "watchInstall", element, watch_id, attributes, text, max_buffer
         )
+        return watch_id
+
+    def poll_watch(self, watch_id: str, timeout: float = 5) -> list[dict] | None:
+        """
+        Long-polls a watch: returns buffered changes immediately, or waits in the page
+        for the next change, up to `timeout`.
+
+        Args:
+            watch_id (str): The id returned by `start_watch`.
+            timeout (float): Maximum time (in seconds) to wait for a change. Default is 5 seconds.
+
+        Returns:
+            list[dict] | None: The changes (possibly empty), or None if the watch no longer exists.
+        """
+        self._ensure_script_timeout(timeout)
+        return self.scripts.call_async("watchPoll", watch_id, int(timeout * 1000))
+
+    def stop_watch(self, watch_id: str) -> None:
+        """
+        Disconnects the MutationObserver of a watch and drops its buffer.
+
+        Args:
+            watch_id (str): The id returned by `start_watch`.
+        """
+        self.scripts.call("watchStop", watch_id)
+
+    def read_table(
+        self, xpath: str, chunk_rows: int = 2000, timeout: int = 10
+    ) -> tuple[list[str], list[list[str]]]:
+        """
+        Reads an HTML table or ARIA grid in chunks of rows, one script call per chunk.
+
+        Args:
+            xpath (str): The XPath locator string for the <table> or grid element.
+            chunk_rows (int): Number of rows transferred per script call. Default is 2000.
+            timeout (int): Maximum time (in seconds) to wait for the element to be located. Default is 10 seconds.
+
+        Returns:
+            tuple[list[str], list[list[str]]]: The header texts and the body rows' cell texts.
+        """
+        element = self.wait_for_element(xpath, timeout)
+        headers: list[str] = []
+        rows: list[list[str]] = []
+        total = None
+        while total is None or len(rows) < total:
+            chunk = self.scripts.call("tableChunk", element, len(rows), chunk_rows)
+            headers, total = chunk["headers"], chunk["total"]
+            if not chunk["rows"]:
+                break
+            rows.extend(chunk["rows"])
+        self.logger.debug(f"Read {len(rows)} row(s) from table: {xpath}")
+        return headers, rows
+
+    def read_virtualized_table(
+        self, xpath: str, max_scrolls: int = 10000, timeout: int = 10
+    ) -> tuple[list[str], list[list[str]]]:
+        """
+        Reads a virtualised grid (only the visible rows exist in the DOM) by scrolling it one
+        viewport at a time and deduplicating rows. Rows are keyed by 'aria-rowindex',
+        'data-row-index' or 'data-index' when present, otherwise by their cell texts.
+
+        Args:
+            xpath (str): The XPath locator string for the grid element.
+            max_scrolls (int): Upper bound on the number of scroll steps. Default is 10000.
+            timeout (int): Maximum time (in seconds) to wait for the element to be located. Default is 10 seconds.
+
+        Returns:
+            tuple[list[str], list[list[str]]]: The header texts and the body rows' cell texts.
+        """
+        element = self.wait_for_element(xpath, timeout)
+        headers: list[str] = []
+        rows: dict[object, list[str]] = {}
+        for step in range(max_scrolls):
+            batch = self.scripts.call_async("tableScroll", element, step == 0)
+            headers = batch["headers"] or headers
+            for row in batch["rows"]:
+                key = row["key"] if row["key"] is not None else tuple(row["cells"])
+                rows.setdefault(key, row["cells"])
+            if batch["atEnd"]:
+                break
+        else:
+            self.logger.warning(f"Stopped reading {xpath} after {max_scrolls} scrolls.")
+
+        ordered = rows.items()
+        if all(isinstance(key, str) and key.isdigit() for key in rows):
+            ordered = sorted(ordered, key=lambda item: int(item[0]))
+        self.logger.debug(f"Read {len(rows)} row(s) from virtualised table: {xpath}")
+        return headers, [cells for _, cells in ordered]
+
+    def _ensure_script_timeout(self, timeout: float) -> None:
+        """
+        Raises the driver's script timeout when an in-page wait may outlast it.
+        The command is only sent when the current timeout is too short.
+        """
+        required = timeout + 5
+        if required > self._script_timeout:
+            self.driver.set_script_timeout(required)
+            self._script_timeout = required
 
     def wait_for_all_elements(self, xpath: str, timeout: int = 10) -> list:
         """
@@ -368,8 +1359,8 @@ class BrowserController:
             TimeoutException: If no elements are found or visible within the given time.
         """
         self.logger.debug(f"Wait for all elements using the following xpath: {xpath}")
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_all_elements_located((By.XPATH, xpath))
+        return self._wait(timeout).until(
+            EC.presence_of_all_elements_located(self._locator(xpath))
         )
 
     def upload_file(self, xpath: str, file_path: str, timeout: int = 10) -> None:
@@ -386,19 +1377,68 @@ class BrowserController:
             TimeoutException: If the element is not present within the given time.
             ValueError: If the provided file_path is not an absolute path.
         """
+        self.upload_files(xpath, [file_path], timeout)
+
+    def upload_files(
+        self, xpath: str, file_paths: list[str], timeout: int = 10
+    ) -> None:
+        """
+        Uploads one or more files to a file input element (several files need the `multiple` attribute).
+
+        Local drivers read the files in place. For remote drivers, the files are streamed to the
+        remote host in parallel (one connection each, up to `config.http_pool_maxsize`), without
+        loading them into memory; the transfer is not bound by `timeout`, only by `config.http_timeout`
+        per socket operation.
+
+        Args:
+            xpath (str): The XPath locator string for the file input element.
+            file_paths (list[str]): The absolute paths of the files to upload.
+            timeout (int): Maximum time (in seconds) to wait for the element to be present. Default is 10 seconds.
+
+        Raises:
+            FileNotFoundError: If one of the files does not exist.
+            TimeoutException: If the element is not present within the given time.
+            ValueError: If a path is not absolute, or several files are sent to an input without `multiple`.
+        """
         self.logger.debug(
-            f"Uploading file '{file_path}' to element with XPath: {xpath}"
+            f"Uploading {len(file_paths)} file(s) to element with XPath: {xpath}"
         )
-        if not os.path.isabs(file_path):
-            raise ValueError("File path for upload must be an absolute path.")
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"The file to upload was not found at: {file_path}")
+        if not file_paths:
+            raise ValueError("At least one file path is required for upload.")
+        for file_path in file_paths:
+            if not os.path.isabs(file_path):
+                raise ValueError("File path for upload must be an absolute path.")
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(
+                    f"The file to upload was not found at: {file_path}"
+                )
 
         # We wait for presence, not visibility, as file inputs can be hidden for styling.
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((By.XPATH, xpath))
+        element = self._wait(timeout).until(
+            EC.presence_of_element_located(self._locator(xpath))
         )
-        element.send_keys(file_path)
+        if len(file_paths) > 1 and element.get_attribute("multiple") is None:
+            raise ValueError(
+                f"Element with XPath '{xpath}' does not accept multiple files."
+            )
+        if not self.remote_url:
+            # A multiple input would get the files twice if this were repeated.
+            mark_applied()
+            element.send_keys("\n".join(file_paths))
+            return
+
+        workers = min(len(file_paths), config.http_pool_maxsize)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="minima-upload"
+        ) as pool:
+            remote_paths = list(
+                pool.map(lambda path: upload_to_remote(self.driver, path), file_paths)
+            )
+        # Without a file detector, send_keys would upload the files a second time if the
+        # remote paths also exist locally.
+        mark_applied()
+        with self.driver.file_detector_context(UselessFileDetector):
+            element.send_keys("\n".join(remote_paths))
 
     def _get_select_object(self, xpath: str, timeout: int = 10) -> Select:
         """Finds a <select> element and returns a Select object."""
@@ -508,7 +1548,7 @@ class BrowserController:
         Raises:
             ValueError: If the specified `browser_type` is not supported.
         """
-        self.logger.debug("Init driver")
+        self.logger.debug(f"Init driver (profile: {self.profile_name})")
 
         if self.os_type == "Windows":
             firefox_bin = FIREFOX_BIN_WINDOWS
@@ -524,21 +1564,51 @@ class BrowserController:
             op.set_preference("detach", not self.kill_browser)
             options = webdriver.firefox.options.Options()
             options.binary_location = firefox_bin
+            options.page_load_strategy = self.page_load_strategy
             if self.headless:
                 options.add_argument("--headless")
+            for name, value in self.profile["firefox_preferences"].items():
+                options.set_preference(name, value)
+            if self.download_dir:
+                options.set_preference("browser.download.folderList", 2)
+                options.set_preference("browser.download.dir", self.download_dir)
+                options.set_preference("browser.download.useDownloadDir", True)
+                options.set_preference(
+                    "browser.download.manager.showWhenStarting", False
+                )
 
-            firefox_service = FirefoxService(executable_path=firefox_driver_bin)
-            driver = webdriver.Firefox(service=firefox_service, options=options)
+            if self.remote_url:
+                driver = self._initialize_remote_driver(options)
+            else:
+                firefox_service = FirefoxService(executable_path=firefox_driver_bin)
+                driver = webdriver.Firefox(service=firefox_service, options=options)
 
         elif self.browser_type == "chrome":
             chrome_options = webdriver.ChromeOptions()
             chrome_options.binary_location = chrome_bin
             chrome_options.add_experimental_option("detach", not self.kill_browser)
+            chrome_options.page_load_strategy = self.page_load_strategy
             if self.headless:
                 chrome_options.add_argument("--headless")
+            for argument in self.profile["chrome_arguments"]:
+                chrome_options.add_argument(argument)
+            if self.download_dir:
+                chrome_options.add_experimental_option(
+                    "prefs",
+                    {
+                        "download.default_directory": self.download_dir,
+                        "download.prompt_for_download": False,
+                        "download.directory_upgrade": True,
+                    },
+                )
 
-            chrome_service = ChromeService()
-            driver = webdriver.Chrome(service=chrome_service, options=chrome_options)
+            if self.remote_url:
+                driver = self._initialize_remote_driver(chrome_options)
+            else:
+                chrome_service = ChromeService()
+                driver = webdriver.Chrome(
+                    service=chrome_service, options=chrome_options
+                )
 
         else:
             raise ValueError(f"Unsupported browser type: {self.browser_type}")
@@ -547,3 +1617,22 @@ class BrowserController:
             driver.maximize_window()
 
         return driver
+
+    def _initialize_remote_driver(self, options: Any) -> WebDriver:
+        """
+        Starts a session on the remote WebDriver server at `remote_url`, with the HTTP settings
+        from `config` applied to the connection.
+
+        Args:
+            options (Any): The browser options describing the requested capabilities.
+
+        Returns:
+            WebDriver: The remote WebDriver instance.
+        """
+        self.logger.debug(f"Connecting to remote WebDriver: {self.remote_url}")
+        options.binary_location = ""
+        return webdriver.Remote(
+            command_executor=self.remote_url,
+            options=options,
+            client_config=build_client_config(self.remote_url),
+        )
@@ -0,0 +1,195 @@
+import socket
+import threading
+import time
+from contextvars import ContextVar
+
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager
+from urllib3.exceptions import HTTPError
+
+from pyminima.settings.exceptions import (
+    CommandCancelledException,
+    CommandTimeoutException,
+)
+
+current_deadline: ContextVar["Deadline | None"] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+class Deadline:
+    """
+    Time budget shared by every driver command issued inside its scope (lookup, wait and action).
+
+    Each HTTP request to the driver is sent with a socket timeout clamped to the remaining
+    budget. `cancel()` may be called from any thread: it shuts down the sockets of the
+    requests in flight, so they fail immediately instead of being abandoned, and any
+    later command in the scope fails before being sent.
+    """
+
+    def __init__(self, seconds: float | None, parent: "Deadline | None" = None) -> None:
+        """
+        Initializes the deadline.
+
+        Args:
+            seconds (float | None): The budget in seconds, or None for no time limit (cancellation only).
+            parent (Deadline | None): An enclosing deadline; the earlier of both expiries applies
+                and cancelling the parent cancels this one. Default is None.
+        """
+        self.budget = seconds
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+        self.parent = parent
+        if parent is not None and parent.expires_at is not None:
+            if self.expires_at is None or parent.expires_at < self.expires_at:
+                self.expires_at = parent.expires_at
+                self.budget = parent.budget
+        self._cancelled = threading.Event()
+        self._connections: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether this deadline or an enclosing one was cancelled."""
+        return self._cancelled.is_set() or (
+            self.parent is not None and self.parent.cancelled
+        )
+
+    def remaining(self) -> float | None:
+        """Returns the seconds left, or None if there is no time limit."""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def clamp(self, timeout: float | None) -> float | None:
+        """Returns `timeout` reduced to the remaining budget."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+    def check(self) -> None:
+        """
+        Raises:
+            CommandCancelledException: If the deadline was cancelled.
+            CommandTimeoutException: If the budget is spent.
+        """
+        if self.cancelled:
+            raise CommandCancelledException()
+        if self.remaining() == 0:
+            raise CommandTimeoutException(self.budget)
+
+    def cancel(self) -> None:
+        """
+        Cancels the deadline and aborts the driver requests currently in flight under it.
+        Safe to call from any thread.
+        """
+        self._cancelled.set()
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            _abort(connection)
+
+    def _attach(self, connection: object) -> None:
+        with self._lock:
+            self._connections.add(connection)
+        if self.cancelled:
+            _abort(connection)
+
+    def _detach(self, connection: object) -> None:
+        with self._lock:
+            self._connections.discard(connection)
+
+    def _owners(self) -> list["Deadline"]:
+        owners, deadline = [], self
+        while deadline is not None:
+            owners.append(deadline)
+            deadline = deadline.parent
+        return owners
+
+
+def _abort(connection: object) -> None:
+    sock = getattr(connection, "sock", None)
+    if sock is None:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+class _DeadlineMixin:
+    """
+    Connection pool hooks applying the deadline of the calling context to each request.
+    """
+
+    def urlopen(self, method, url, *args, **kwargs):
+        deadline = current_deadline.get()
+        if deadline is None:
+            return super().urlopen(method, url, *args, **kwargs)
+        deadline.check()
+        kwargs["timeout"] = deadline.clamp(kwargs.get("timeout"))
+        kwargs["retries"] = False
+        try:
+            return super().urlopen(method, url, *args, **kwargs)
+        except (HTTPError, OSError):
+            deadline.check()
+            raise
+
+    def _get_conn(self, timeout=None):
+        connection = super()._get_conn(timeout)
+        deadline = current_deadline.get()
+        if deadline is not None:
+            for owner in deadline._owners():
+                owner._attach(connection)
+        return connection
+
+    def _put_conn(self, connection):
+        deadline = current_deadline.get()
+        if deadline is not None and connection is not None:
+            for owner in deadline._owners():
+                owner._detach(connection)
+        return super()._put_conn(connection)
+
+
+class DeadlineHTTPConnectionPool(_DeadlineMixin, HTTPConnectionPool):
+    pass
+
+
+class DeadlineHTTPSConnectionPool(_DeadlineMixin, HTTPSConnectionPool):
+    pass
+
+
+def _use_deadline_pools(manager: object) -> object:
+    """Switches the connection pools of a urllib3 pool manager to the deadline-aware ones."""
+    if isinstance(manager, PoolManager):
+        manager.pool_classes_by_scheme = {
+            "http": DeadlineHTTPConnectionPool,
+            "https": DeadlineHTTPSConnectionPool,
+        }
+    return manager
+
+
+def install_deadline_pools(command_executor: object) -> None:
+    """
+    Makes a driver's remote connection honour `current_deadline`, by switching the
+    connection pools of its pool manager to the deadline-aware ones.
+
+    Without keep-alive, Selenium builds a new pool manager for each request through
+    `_get_connection_manager`, so that factory is wrapped as well.
+
+    Args:
+        command_executor (object): The driver's `command_executor` (a Selenium RemoteConnection).
+    """
+    build_manager = getattr(command_executor, "_get_connection_manager", None)
+    if build_manager is not None and not getattr(
+        command_executor, "_deadline_pools", False
+    ):
+        command_executor._get_connection_manager = lambda: _use_deadline_pools(
+            build_manager()
+        )
+        command_executor._deadline_pools = True
+    manager = getattr(command_executor, "_conn", None)
+    if isinstance(manager, PoolManager):
+        _use_deadline_pools(manager)
+        manager.clear()
@@ -0,0 +1,94 @@
+import hashlib
+import os
+import time
+
+from pyminima.settings.exceptions import DownloadTimeoutException
+
+# Suffixes of files browsers write while a download is in progress (Chromium, Firefox).
+PARTIAL_SUFFIXES = (".crdownload", ".part", ".download", ".tmp")
+POLL_INTERVAL = 0.05
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class Download:
+    """
+    A file downloaded into the session's download directory. Filled in when the
+    `expect_download` block exits and the download has completed.
+    """
+
+    def __init__(self) -> None:
+        self.path: str | None = None
+        self.size: int | None = None
+        self.sha256: str | None = None
+
+    @property
+    def filename(self) -> str | None:
+        return os.path.basename(self.path) if self.path else None
+
+    def __repr__(self) -> str:
+        return f"Download(path='{self.path}', size={self.size}, sha256='{self.sha256}')"
+
+
+class DownloadWatcher:
+    """
+    Waits for a new file to finish downloading into a directory.
+
+    Files present when the watcher is created are ignored. A download is complete when a new
+    file without a partial suffix exists, no partial file is left for it, and its size has
+    not changed between two polls. The directory is polled; only entry names and sizes are
+    read until the file is complete.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Args:
+            directory (str): The download directory.
+        """
+        self.directory = directory
+        self._existing = set(os.listdir(directory))
+
+    def wait(self, timeout: float) -> str:
+        """
+        Blocks until a new download completes.
+
+        Args:
+            timeout (float): Maximum seconds to wait.
+
+        Returns:
+            str: The path of the downloaded file.
+
+        Raises:
+            DownloadTimeoutException: If no download completes within the timeout.
+        """
+        expires_at = time.monotonic() + timeout
+        sizes: dict[str, int] = {}
+        while time.monotonic() < expires_at:
+            names = set(os.listdir(self.directory)) - self._existing
+            partials = {name for name in names if name.endswith(PARTIAL_SUFFIXES)}
+            for name in sorted(names - partials):
+                if any(partial.startswith(name) for partial in partials):
+                    continue
+                try:
+                    size = os.path.getsize(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                if sizes.get(name) == size:
+                    return os.path.join(self.directory, name)
+                sizes[name] = size
+            time.sleep(POLL_INTERVAL)
+        raise DownloadTimeoutException(self.directory, timeout)
+
+
+def describe(path: str, download: Download) -> Download:
+    """
+    Fills in a Download for a completed file. The SHA-256 digest is computed in fixed-size
+    chunks, so large files are never read into memory.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as downloaded:
+        for chunk in iter(lambda: downloaded.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    download.path = path
+    download.size = os.path.getsize(path)
+    download.sha256 = digest.hexdigest()
+    return download
@@ -0,0 +1,93 @@
+import threading
+
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from urllib3.exceptions import HTTPError
+
+DRIVER_CRASHES = "minima_driver_crashes_total"
+DRIVER_RECOVERIES = "minima_driver_recoveries_total"
+DRIVER_RECOVERY_FAILURES = "minima_driver_recovery_failures_total"
+DRIVER_RECOVERY_DURATION = "minima_driver_recovery_seconds"
+
+# Exceptions a failed driver command can raise: protocol errors, and connection errors
+# when the driver process itself is gone.
+DRIVER_ERRORS = (WebDriverException, OSError, HTTPError)
+
+PROBE_SCRIPT = "return document.readyState"
+
+# Fragments of the driver error messages reported when the browser or a tab is gone.
+CRASH_MARKERS = (
+    "not reachable",
+    "crashed",
+    "disconnected",
+    "session deleted",
+    "no such session",
+    "browsing context has been discarded",
+)
+
+
+def run_with_deadline(func, timeout: float) -> tuple[bool, object]:
+    """
+    Runs `func` on a daemon thread and waits at most `timeout` seconds for it.
+    A call stuck on a hung driver keeps its thread, but no longer blocks the caller.
+
+    Returns:
+        tuple[bool, object]: Whether the call finished in time, and its result or raised exception.
+    """
+    outcome: list = []
+
+    def target() -> None:
+        try:
+            outcome.append(func())
+        except Exception as e:
+            outcome.append(e)
+
+    thread = threading.Thread(target=target, name="minima-probe", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        return False, None
+    return True, outcome[0]
+
+
+def probe_driver(driver: WebDriver, timeout: float) -> bool:
+    """
+    Checks that the driver process is running and that the page answers a trivial script
+    within `timeout` seconds. A crashed browser fails fast; a hung renderer fails on the deadline.
+
+    Args:
+        driver (WebDriver): The driver to probe.
+        timeout (float): Maximum seconds to wait for the page to answer.
+
+    Returns:
+        bool: Whether the driver is healthy.
+    """
+    if driver_exited(driver):
+        return False
+    finished, result = run_with_deadline(
+        lambda: driver.execute_script(PROBE_SCRIPT), timeout
+    )
+    return finished and not (isinstance(result, Exception) and is_crash(result))
+
+
+def driver_exited(driver: WebDriver) -> bool:
+    """
+    Tells whether the process of a local driver has exited. Always False for remote drivers.
+    """
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    return process is not None and process.poll() is not None
+
+
+def is_crash(error: Exception) -> bool:
+    """
+    Tells whether an exception means the browser session is gone, as opposed to an ordinary
+    command failure (missing element, open alert, closed window) on a live browser.
+    Errors outside Selenium (e.g. connection refused by a dead driver process) count as crashes.
+    """
+    if isinstance(error, InvalidSessionIdException):
+        return True
+    if not isinstance(error, WebDriverException):
+        return True
+    message = (error.msg or "").lower()
+    return any(marker in message for marker in CRASH_MARKERS)
@@ -0,0 +1,63 @@
+import re
+from functools import lru_cache
+
+from selenium.webdriver.common.by import By
+
+# XPaths of the form built by UIElement: //*[@name='value' and @name='value' ...]
+_ATTRIBUTE_XPATH = re.compile(r"//\*\[(.+)\]")
+_CONDITION = re.compile(r"@([a-z][a-z0-9-]*)='([^']*)'")
+
+# HTML attributes whose values CSS attribute selectors match case-insensitively
+# (https://html.spec.whatwg.org/#selectors). XPath compares them case-sensitively,
+# so locators using them stay in XPath to keep the same results.
+CASE_INSENSITIVE_ATTRIBUTES = frozenset(
+    (
+        "accept", "accept-charset", "align", "alink", "axis", "bgcolor", "charset",
+        "checked", "clear", "codetype", "color", "compact", "declare", "defer", "dir",
+        "direction", "disabled", "enctype", "face", "frame", "hreflang", "http-equiv",
+        "lang", "language", "link", "media", "method", "multiple", "nohref", "noresize",
+        "noshade", "nowrap", "readonly", "rel", "rev", "rules", "scope", "scrolling",
+        "selected", "shape", "target", "text", "type", "valign", "valuetype", "vlink",
+    )
+)  # fmt: skip
+
+
+@lru_cache(maxsize=4096)
+def compile_locator(xpath: str) -> tuple[str, str]:
+    """
+    Picks the fastest lookup strategy that finds the same elements as an XPath.
+
+    XPaths matching only exact attribute values (`//*[@id='a' and @class='b']`, as built by
+    UIElement) become a CSS attribute selector, or By.ID when `id` is the only attribute;
+    browsers resolve those natively instead of running a full-document XPath scan. Anything
+    else (text containment, axes, functions, case-insensitive attributes) stays XPath.
+
+    Args:
+        xpath (str): The XPath locator.
+
+    Returns:
+        tuple[str, str]: A Selenium `(By, value)` locator.
+    """
+    match = _ATTRIBUTE_XPATH.fullmatch(xpath)
+    if not match:
+        return By.XPATH, xpath
+
+    conditions = match.group(1).split(" and ")
+    attributes = []
+    for condition in conditions:
+        parsed = _CONDITION.fullmatch(condition)
+        if not parsed or parsed.group(1) in CASE_INSENSITIVE_ATTRIBUTES:
+            return By.XPATH, xpath
+        attributes.append((parsed.group(1), parsed.group(2)))
+
+    if len(attributes) == 1 and attributes[0][0] == "id":
+        return By.ID, attributes[0][1]
+    selector = "".join(
+        f'[{name}="{_escape_css_string(value)}"]' for name, value in attributes
+    )
+    return By.CSS_SELECTOR, selector
+
+
+def _escape_css_string(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return re.sub(r"[\n\r\f]", lambda char: f"\\{ord(char.group()):x} ", escaped)
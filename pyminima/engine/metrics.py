@@ -0,0 +1,251 @@
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+ACTION_DURATION = "minima_action_duration_seconds"
+ACTION_ERRORS = "minima_action_errors_total"
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+EXPORT_FORMATS = ("prometheus", "json")
+
+
+class Histogram:
+    """
+    HDR-style histogram of durations, recorded in microseconds.
+
+    Values below 2**sub_bucket_bits are counted exactly; above that, every power-of-two
+    range is split into 2**(sub_bucket_bits - 1) linear sub-buckets, so the relative
+    error stays below 1 / 2**(sub_bucket_bits - 1) (under 1% with the default of 8 bits)
+    from microseconds to hours, with counts kept in a sparse dict.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 8) -> None:
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self._counts: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """
+        Records a value in microseconds.
+
+        Args:
+            value (int): The value to record. Negative values are clamped to zero.
+        """
+        value = max(int(value), 0)
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.min = value if self.count == 0 else min(self.min, value)
+            self.max = max(self.max, value)
+            self.count += 1
+            self.total += value
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Returns the value at the given percentile (0-100), as the highest value equivalent
+        to the bucket holding it, capped at the recorded maximum.
+
+        Args:
+            percentile (float): The percentile to compute.
+
+        Returns:
+            int: The value in microseconds, or 0 if nothing was recorded.
+        """
+        with self._lock:
+            if not self.count:
+                return 0
+            target = max(math.ceil(self.count * percentile / 100), 1)
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= target:
+                    return min(self._highest_equivalent(index), self.max)
+            return self.max
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return shift * self._half_count + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < self._sub_bucket_count:
+            return index
+        offset = index - self._sub_bucket_count
+        shift = offset // self._half_count + 1
+        sub_bucket = offset % self._half_count + self._half_count
+        return ((sub_bucket + 1) << shift) - 1
+
+
+class MetricsRegistry:
+    """
+    In-process registry of duration histograms and counters, keyed by metric name and labels.
+    Exportable as Prometheus text format or JSON.
+    """
+
+    def __init__(self) -> None:
+        self._histograms: dict[tuple[str, tuple], Histogram] = {}
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """
+        Records a duration.
+
+        Args:
+            name (str): The metric name.
+            seconds (float): The duration in seconds.
+            **labels (str): The metric labels (e.g. action='click', element='Button').
+        """
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        histogram.record(seconds * 1_000_000)
+
+    def increment(self, name: str, amount: float = 1, **labels: str) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            name (str): The metric name.
+            amount (float): The increment. Default is 1.
+            **labels (str): The metric labels.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    @contextmanager
+    def time(self, name: str, **labels: str) -> Iterator[None]:
+        """
+        Context manager recording the duration of its block, and counting an error
+        in `minima_action_errors_total` when the block raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.increment(ACTION_ERRORS, **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Returns the current value of a counter."""
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def histogram(self, name: str, **labels: str) -> Histogram | None:
+        """Returns the histogram for a metric name and labels, if anything was recorded."""
+        return self._histograms.get((name, tuple(sorted(labels.items()))))
+
+    def reset(self) -> None:
+        """Drops every recorded metric."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def to_json(self) -> dict:
+        """
+        Returns a JSON-serializable snapshot. Durations are reported in seconds.
+        """
+        with self._lock:
+            histogram_items = sorted(self._histograms.items())
+            counter_items = sorted(self._counters.items())
+        histograms = []
+        for (name, labels), histogram in histogram_items:
+            histograms.append(
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": histogram.count,
+                    "sum": histogram.total / 1_000_000,
+                    "min": histogram.min / 1_000_000,
+                    "max": histogram.max / 1_000_000,
+                    "quantiles": {
+                        str(q): histogram.percentile(q * 100) / 1_000_000
+                        for q in QUANTILES
+                    },
+                }
+            )
+        counters = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in counter_items
+        ]
+        return {"histograms": histograms, "counters": counters}
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the metrics in Prometheus text exposition format. Histograms are exposed
+        as summaries (quantiles, `_sum` and `_count`).
+        """
+        with self._lock:
+            histogram_items = sorted(self._histograms.items())
+            counter_items = sorted(self._counters.items())
+        lines = []
+        typed = set()
+        for (name, labels), histogram in histogram_items:
+            if name not in typed:
+                lines.append(f"# TYPE {name} summary")
+                typed.add(name)
+            for q in QUANTILES:
+                value = histogram.percentile(q * 100) / 1_000_000
+                lines.append(
+                    f"{name}{_format_labels(labels + (('quantile', str(q)),))} {value}"
+                )
+            lines.append(
+                f"{name}_sum{_format_labels(labels)} {histogram.total / 1_000_000}"
+            )
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        for (name, labels), value in counter_items:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str, export_format: str = "prometheus") -> None:
+        """
+        Writes the metrics to a file.
+
+        Args:
+            path (str): The destination file.
+            export_format (str): 'prometheus' or 'json'. Default is 'prometheus'.
+
+        Raises:
+            ValueError: If the export format is not supported.
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported metrics export format: {export_format}")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as export_file:
+            if export_format == "json":
+                json.dump(self.to_json(), export_file, indent=2)
+            else:
+                export_file.write(self.to_prometheus())
+
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels:
+        value = (
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+registry = MetricsRegistry()
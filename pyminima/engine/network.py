@@ -0,0 +1,411 @@
+import base64
+import fnmatch
+import json
+import mimetypes
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from pyminima.engine.cache import ResponseStore
+from pyminima.engine.cdp import CDPSession
+from pyminima.logs.logger_utils import initialize_logger
+
+# Headers that describe the body as it was sent over the wire. Bodies read with
+# Fetch.getResponseBody are already decoded, so these are dropped from every response
+# that is stored or replayed.
+WIRE_HEADERS = ("content-encoding", "content-length")
+
+
+def header_list(
+    headers: dict[str, str] | list[dict[str, str]],
+) -> list[dict[str, str]]:
+    """
+    Returns headers as CDP/HAR `{"name", "value"}` pairs, without the `WIRE_HEADERS`.
+    Repeated headers (e.g. several Set-Cookie) are kept.
+
+    Args:
+        headers (dict[str, str] | list[dict[str, str]]): A header dict or a list of pairs.
+    """
+    if isinstance(headers, dict):
+        pairs = headers.items()
+    else:
+        pairs = ((header["name"], header["value"]) for header in headers)
+    return [
+        {"name": name, "value": str(value)}
+        for name, value in pairs
+        if name.lower() not in WIRE_HEADERS
+    ]
+
+
+class Route:
+    """
+    A canned response served for every request whose URL matches `pattern`.
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        body: bytes = b"",
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        self.pattern = pattern
+        self.body = body
+        self.status = status
+        self.headers = headers or {}
+        self.delay = delay
+
+    def matches(self, url: str) -> bool:
+        return fnmatch.fnmatchcase(url, self.pattern)
+
+
+class NetworkInterceptor:
+    """
+    Session-level request interception built on the CDP Fetch domain (Chromium only).
+
+    Requests can be answered from canned routes, a local fixture directory, a HAR
+    file or a response cache, delayed with artificial latency, or recorded into a HAR
+    file or the cache. Anything that is not handled continues to the real network.
+    """
+
+    def __init__(self, controller: object) -> None:
+        """
+        Initializes the interceptor for a BrowserController. Interception starts lazily
+        on the first registered rule.
+
+        Args:
+            controller (object): The BrowserController owning the WebDriver session.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.controller = controller
+        self.routes: list[Route] = []
+        self.fixtures: list[tuple[str, str]] = []
+        self.latency: list[tuple[str, float]] = []
+        self.har_entries: dict[tuple[str, str], list[dict]] = {}
+        self.offline = False
+        self.cache: ResponseStore | None = None
+        self.cache_mode: str | None = None
+        self.stats = {"fulfilled": 0, "continued": 0, "recorded": 0, "blocked": 0}
+        self._record_path: str | None = None
+        self._recorded: list[dict] = []
+        self._lock = threading.Lock()
+        self._cdp: CDPSession | None = None
+
+    # Rules
+    def route(
+        self,
+        pattern: str,
+        body: str | bytes = b"",
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        """
+        Serves a canned response for every URL matching a glob pattern.
+
+        Args:
+            pattern (str): Glob pattern matched against the full URL (e.g. '*/api/users*').
+            body (str | bytes): The response body.
+            status (int): The HTTP status code. Default is 200.
+            headers (dict[str, str] | None): Response headers.
+            delay (float): Seconds to wait before answering. Default is 0.
+        """
+        if isinstance(body, str):
+            body = body.encode()
+        self.routes.append(Route(pattern, body, status, headers, delay))
+        self.start()
+
+    def serve_fixtures(self, directory: str, url_prefix: str) -> None:
+        """
+        Serves files from a local directory for URLs under a prefix, e.g. 'https://app.test/static/'
+        maps 'https://app.test/static/js/app.js' to '<directory>/js/app.js'. Missing files go to the network.
+
+        Args:
+            directory (str): The fixture directory.
+            url_prefix (str): The URL prefix mapped onto the directory.
+        """
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Fixture directory not found: {directory}")
+        self.fixtures.append((url_prefix, os.path.abspath(directory)))
+        self.start()
+
+    def set_latency(self, seconds: float, pattern: str = "*") -> None:
+        """
+        Adds artificial latency to every request matching a glob pattern.
+
+        Args:
+            seconds (float): The delay applied before the request is answered or continued.
+            pattern (str): Glob pattern matched against the full URL. Default is every request.
+        """
+        self.latency.append((pattern, seconds))
+        self.start()
+
+    def replay_har(self, path: str, offline: bool = False) -> None:
+        """
+        Answers requests from the entries of a HAR file, matched by method and URL.
+
+        Args:
+            path (str): The HAR file to replay.
+            offline (bool): Whether requests missing from the HAR fail instead of reaching the network.
+        """
+        with open(path, encoding="utf-8") as har_file:
+            entries = json.load(har_file)["log"]["entries"]
+        for entry in entries:
+            key = (entry["request"]["method"], entry["request"]["url"])
+            self.har_entries.setdefault(key, []).append(entry)
+        self.offline = offline
+        self.start()
+
+    def record_har(self, path: str) -> None:
+        """
+        Records every response into a HAR file, written when the interceptor stops.
+
+        Args:
+            path (str): The HAR file to write.
+        """
+        self._record_path = path
+        self.start()
+
+    def use_cache(self, store: ResponseStore, mode: str) -> None:
+        """
+        Routes responses through a content-addressed on-disk cache.
+
+        Args:
+            store (ResponseStore): The store holding the cached responses.
+            mode (str): 'record' stores every response; 'replay' serves stored responses
+                and stores the ones that are still missing.
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cache mode: {mode}")
+        self.cache = store
+        self.cache_mode = mode
+        self.start()
+
+    # Lifecycle
+    def start(self) -> None:
+        """
+        Attaches to the browser and enables (or refreshes) the Fetch interception patterns.
+        """
+        if self._cdp is None:
+            self._cdp = CDPSession.attach(self.controller.driver)
+            self._cdp.on("Fetch.requestPaused", self._on_request_paused)
+
+        patterns = [{"urlPattern": "*", "requestStage": "Request"}]
+        if self._record_path or self.cache is not None:
+            patterns.append({"urlPattern": "*", "requestStage": "Response"})
+        self._cdp.send("Fetch.enable", {"patterns": patterns})
+        self.logger.debug(f"Request interception enabled for stages: {patterns}")
+
+    def stop(self) -> None:
+        """
+        Disables interception, writes the recorded HAR file and flushes the response cache, if any.
+        """
+        if self._cdp is None:
+            return
+        try:
+            self._cdp.send("Fetch.disable")
+        except Exception as e:
+            self.logger.debug(f"Could not disable Fetch domain. Error: {e}")
+        finally:
+            self._cdp.close()
+            self._cdp = None
+        if self._record_path:
+            self._write_har()
+        if self.cache is not None:
+            self.cache.flush()
+        self.logger.info(f"Request interception stopped. Stats: {self.stats}")
+
+    # Event handling
+    def _on_request_paused(self, event: dict) -> None:
+        request = event["request"]
+        url = request["url"]
+
+        if "responseStatusCode" in event or "responseErrorReason" in event:
+            self._record_response(event)
+            return
+
+        delay = sum(
+            seconds
+            for pattern, seconds in self.latency
+            if fnmatch.fnmatchcase(url, pattern)
+        )
+        response = self._find_response(request)
+        if response is not None:
+            status, headers, body, route_delay = response
+            time.sleep(delay + route_delay)
+            self._fulfill(event["requestId"], status, headers, body)
+            self._count("fulfilled")
+        elif self.offline:
+            self._cdp.send(
+                "Fetch.failRequest",
+                {
+                    "requestId": event["requestId"],
+                    "errorReason": "InternetDisconnected",
+                },
+            )
+            self._count("blocked")
+        else:
+            time.sleep(delay)
+            self._cdp.send("Fetch.continueRequest", {"requestId": event["requestId"]})
+            self._count("continued")
+
+    def _find_response(
+        self, request: dict
+    ) -> tuple[int, dict[str, str] | list[dict[str, str]], bytes, float] | None:
+        url = request["url"]
+        for route in reversed(self.routes):
+            if route.matches(url):
+                return route.status, route.headers, route.body, route.delay
+
+        for url_prefix, directory in self.fixtures:
+            if not url.startswith(url_prefix):
+                continue
+            relative = urlsplit(url[len(url_prefix) :]).path.lstrip("/") or "index.html"
+            file_path = os.path.normpath(os.path.join(directory, relative))
+            inside = os.path.commonpath([directory, file_path]) == directory
+            if inside and os.path.isfile(file_path):
+                with open(file_path, "rb") as fixture:
+                    body = fixture.read()
+                content_type = (
+                    mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+                )
+                return 200, {"Content-Type": content_type}, body, 0.0
+
+        entries = self.har_entries.get((request["method"], url))
+        if entries:
+            response = entries[0]["response"]
+            content = response.get("content", {})
+            text = content.get("text", "")
+            if content.get("encoding") == "base64":
+                body = base64.b64decode(text)
+            else:
+                body = text.encode()
+            return response["status"], response.get("headers", []), body, 0.0
+
+        if self.cache_mode == "replay":
+            cached = self.cache.get(request["method"], url)
+            if cached is not None:
+                status, headers, body = cached
+                return status, headers, body, 0.0
+        return None
+
+    def _fulfill(
+        self,
+        request_id: str,
+        status: int,
+        headers: dict[str, str] | list[dict[str, str]],
+        body: bytes,
+    ) -> None:
+        self._cdp.send(
+            "Fetch.fulfillRequest",
+            {
+                "requestId": request_id,
+                "responseCode": status,
+                "responseHeaders": header_list(headers),
+                "body": base64.b64encode(body).decode(),
+            },
+        )
+
+    def _record_response(self, event: dict) -> None:
+        """
+        Reads a paused response for the HAR file or the cache, then lets the original
+        response through unchanged (its body is not re-encoded or re-sent).
+        """
+        request_id = event["requestId"]
+        if "responseErrorReason" in event:
+            self._cdp.send("Fetch.continueRequest", {"requestId": request_id})
+            return
+
+        # The body can only be read while the response is paused.
+        try:
+            result = self._cdp.send("Fetch.getResponseBody", {"requestId": request_id})
+        finally:
+            self._cdp.send("Fetch.continueRequest", {"requestId": request_id})
+
+        if result.get("base64Encoded"):
+            body = base64.b64decode(result["body"])
+        else:
+            body = result["body"].encode()
+        headers = header_list(event.get("responseHeaders", []))
+        status = event["responseStatusCode"]
+
+        request = event["request"]
+        if (
+            self.cache is not None
+            and request["method"] == "GET"
+            and 200 <= status < 300
+        ):
+            self.cache.put(request["method"], request["url"], status, headers, body)
+        if not self._record_path:
+            return
+
+        mime_type = next(
+            (
+                header["value"]
+                for header in headers
+                if header["name"].lower() == "content-type"
+            ),
+            "application/octet-stream",
+        )
+        entry = {
+            "startedDateTime": datetime.now(timezone.utc).isoformat(),
+            "time": 0,
+            "request": {
+                "method": request["method"],
+                "url": request["url"],
+                "httpVersion": "HTTP/1.1",
+                "headers": [
+                    {"name": name, "value": value}
+                    for name, value in request.get("headers", {}).items()
+                ],
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": -1,
+            },
+            "response": {
+                "status": status,
+                "statusText": event.get("responseStatusText", ""),
+                "httpVersion": "HTTP/1.1",
+                "headers": headers,
+                "cookies": [],
+                "content": {
+                    "size": len(body),
+                    "mimeType": mime_type,
+                    "text": base64.b64encode(body).decode(),
+                    "encoding": "base64",
+                },
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": len(body),
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": 0, "receive": 0},
+        }
+        with self._lock:
+            self._recorded.append(entry)
+        self._count("recorded")
+
+    def _write_har(self) -> None:
+        with self._lock:
+            entries = list(self._recorded)
+        har = {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "pyminima", "version": "1.0.0"},
+                "entries": entries,
+            }
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self._record_path)), exist_ok=True)
+        with open(self._record_path, "w", encoding="utf-8") as har_file:
+            json.dump(har, har_file)
+        self.logger.info(
+            f"Recorded {len(entries)} response(s) to HAR: {self._record_path}"
+        )
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
@@ -0,0 +1,107 @@
+READINESS_LEVELS = ("none", "domcontentloaded", "load", "networkidle")
+
+# The WebDriver page load strategy matching each readiness level: where `driver.get`
+# returns, so navigations are not held until the load event when less is asked for.
+# Levels beyond the load event are finished by the readiness wait.
+PAGE_LOAD_STRATEGIES = {
+    "none": "none",
+    "domcontentloaded": "eager",
+    "load": "normal",
+    "networkidle": "normal",
+}
+
+# What an element must be before click, hover and drag act on it: 'clickable' (visible and
+# enabled, checked by the driver) or 'stable' (clickable, not moving and not covered; see
+# the `waitStable` helper in pyminima.engine.scripts).
+ELEMENT_READINESS_LEVELS = ("clickable", "stable")
+
+# Counts in-flight fetch/XHR requests and gives the document an id, so a wait started
+# after a click can tell the old document from the one it navigated to. Registered to
+# run on every new document where the browser supports it (Chromium, via CDP), and
+# injected on demand by the wait script otherwise.
+READINESS_TRACKER_SCRIPT = """
+(() => {
+    if (window.__minimaReadiness) return;
+    const state = window.__minimaReadiness = {
+        id: Math.random().toString(36).slice(2),
+        inflight: 0,
+        lastActivity: performance.now(),
+    };
+    const begin = () => { state.inflight++; state.lastActivity = performance.now(); };
+    const end = () => { state.inflight = Math.max(state.inflight - 1, 0); state.lastActivity = performance.now(); };
+
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function (...args) {
+            begin();
+            return originalFetch.apply(this, args).finally(end);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        begin();
+        this.addEventListener('loadend', end, {once: true});
+        return originalSend.apply(this, args);
+    };
+})();
+"""
+
+# Returns the id of the current document (see the tracker above), installing the tracker
+# if needed, so a wait started after a navigation can tell the old document apart.
+DOCUMENT_ID_SCRIPT = (
+    "/* minima:document-id */"
+    + READINESS_TRACKER_SCRIPT
+    + "return window.__minimaReadiness.id;"
+)
+
+# Polls until the document reaches the requested level, or the deadline expires.
+# With `previousId`, it first waits up to `navigationGraceMs` for a new document to
+# replace the one the click was performed on; if none shows up, the click is treated
+# as an in-page update and the current document is checked. The old document is never
+# reported ready once the deadline has expired.
+READINESS_WAIT_SCRIPT = (
+    "/* minima:readiness */"
+    + READINESS_TRACKER_SCRIPT
+    + """
+const [level, timeoutMs, idleMs, previousId, navigationGraceMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+const state = window.__minimaReadiness;
+
+function frames(count) {
+    if (document.hidden) return Promise.resolve();
+    return new Promise(resolve => {
+        const step = remaining => remaining ? requestAnimationFrame(() => step(remaining - 1)) : resolve();
+        step(count);
+    });
+}
+
+function isReady() {
+    const readyState = document.readyState;
+    if (level === 'domcontentloaded') return readyState !== 'loading';
+    if (readyState !== 'complete') return false;
+    if (level === 'networkidle') {
+        return state.inflight === 0 && performance.now() - state.lastActivity >= idleMs;
+    }
+    return true;
+}
+
+function report(ready) {
+    done({ready: ready, readyState: document.readyState, inflight: state.inflight, id: state.id});
+}
+
+function poll() {
+    const elapsed = performance.now() - started;
+    if (previousId && state.id === previousId) {
+        if (elapsed >= timeoutMs) return report(false);
+        if (elapsed < navigationGraceMs) return setTimeout(poll, 50);
+    }
+    if (isReady()) {
+        return frames(2).then(() => report(true));
+    }
+    if (elapsed >= timeoutMs) return report(false);
+    setTimeout(poll, 50);
+}
+poll();
+"""
+)
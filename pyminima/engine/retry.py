@@ -0,0 +1,143 @@
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    MoveTargetOutOfBoundsException,
+    StaleElementReferenceException,
+)
+
+from pyminima.engine.deadline import Deadline
+from pyminima.engine.metrics import registry
+from pyminima.logs.logger_utils import initialize_logger
+
+ACTION_RETRIES = "minima_action_retries_total"
+
+# Errors raised before the action took effect, which a repeat with the element located
+# again can get past: the element was re-rendered, was covered by another element, or
+# could not be interacted with yet. Anything else (timeouts, invalid locators, crashed
+# browsers) is fatal.
+TRANSIENT_ERRORS = (
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    MoveTargetOutOfBoundsException,
+)
+
+
+class _Attempt:
+    """One attempt of a retried call."""
+
+    def __init__(self) -> None:
+        # Whether the attempt has taken an effect a repeat would duplicate.
+        self.applied = False
+
+
+# The attempt running in this context, if any, so actions nested in it (e.g. the clicks
+# of a double-click) run once and the outermost action owns the retry budget.
+_attempt: ContextVar[_Attempt | None] = ContextVar("minima_attempt", default=None)
+
+
+def root_cause(error: BaseException) -> BaseException:
+    """
+    Returns the driver error behind Minima's wrapping exceptions (those with an
+    `original_exception`), or the error itself.
+    """
+    while getattr(error, "original_exception", None) is not None:
+        error = error.original_exception
+    return error
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether an error is worth retrying (see `TRANSIENT_ERRORS`)."""
+    return isinstance(root_cause(error), TRANSIENT_ERRORS)
+
+
+def mark_applied() -> None:
+    """
+    Records that the running action has taken an effect a repeat would duplicate (e.g.
+    the first click of a double-click, or keys sent to a field), so a failure from here
+    on is raised instead of retried. Does nothing outside a retried call.
+    """
+    attempt = _attempt.get()
+    if attempt is not None:
+        attempt.applied = True
+
+
+class RetryPolicy:
+    """
+    Retries a call that failed with a transient error, up to `max_retries` times, with
+    exponential backoff and full jitter (each delay is random between zero and the
+    exponential cap, so parallel sessions do not retry in lockstep). Fatal errors, and
+    errors after the attempt took an effect (see `mark_applied`), are raised at once.
+    Each retry is counted in `minima_action_retries_total`.
+    """
+
+    def __init__(
+        self, max_retries: int, backoff: float = 0.1, max_backoff: float = 1.0
+    ) -> None:
+        """
+        Args:
+            max_retries (int): How many times a call may be repeated after its first attempt.
+            backoff (float): The delay cap before the first retry, in seconds; doubled on each retry. Default is 0.1.
+            max_backoff (float): The largest delay cap, in seconds. Default is 1.0.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def delay(self, retry: int) -> float:
+        """Returns the jittered delay before the given retry (0-based), in seconds."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**retry))
+
+    def call(
+        self, func: Callable[[], Any], deadline: Deadline | None = None, **labels: str
+    ) -> Any:
+        """
+        Calls `func`, repeating it while it fails with a transient error and the budget
+        allows. Calls nested in another `call` run once.
+
+        Args:
+            func (Callable[[], Any]): The call to make. It must locate its elements itself,
+                so a repeat works on the element as currently rendered.
+            deadline (Deadline | None): The deadline bounding all attempts. No retry is
+                started once it has no time left for the backoff. Default is None.
+            **labels (str): Labels for the retry counter (e.g. action='click', element='Button').
+
+        Returns:
+            Any: The result of the first successful attempt.
+        """
+        if _attempt.get() is not None:
+            return func()
+        retry = 0
+        while True:
+            attempt = _Attempt()
+            token = _attempt.set(attempt)
+            try:
+                return func()
+            except Exception as e:
+                if retry >= self.max_retries or attempt.applied or not is_transient(e):
+                    raise
+                delay = self.delay(retry)
+                if deadline is not None:
+                    remaining = deadline.remaining()
+                    if deadline.cancelled or (
+                        remaining is not None and remaining <= delay
+                    ):
+                        raise
+                cause = root_cause(e)
+                registry.increment(
+                    ACTION_RETRIES, error=cause.__class__.__name__, **labels
+                )
+                retry += 1
+                self.logger.warning(
+                    f"Retrying after {cause.__class__.__name__} "
+                    f"({retry}/{self.max_retries}, in {delay * 1000:.0f} ms)."
+                )
+            finally:
+                _attempt.reset(token)
+            time.sleep(delay)
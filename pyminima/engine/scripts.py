@@ -0,0 +1,371 @@
+import hashlib
+from typing import Any
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pyminima.logs.logger_utils import initialize_logger
+
+# Minima's in-page helper library. It is installed once per document as
+# `window.__minima` and its helpers are then called by name, so each action sends a
+# short call stub instead of the helper's source. Helpers marked async take a `done`
+# callback as their last argument.
+HELPER_LIBRARY = """
+function isVisible(node) {
+    const style = window.getComputedStyle(node);
+    const rect = node.getBoundingClientRect();
+    return style.display !== 'none' && style.visibility !== 'hidden' && (rect.width > 0 || rect.height > 0);
+}
+
+function resolve(xpath, requireVisible) {
+    let node;
+    try {
+        node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } catch (e) {
+        return {element: null, status: 'invalid'};
+    }
+    if (!node) return {element: null, status: 'missing'};
+    if (requireVisible && !isVisible(node)) return {element: node, status: 'hidden'};
+    return {element: node, status: 'ready'};
+}
+
+// Shared helpers for HTML tables and ARIA grids: rows, cells and header detection.
+function rowsOf(root) {
+    if (root.tagName === 'TABLE') return Array.from(root.rows);
+    return Array.from(root.querySelectorAll('[role="row"]'));
+}
+function cellsOf(row) {
+    if (row.cells) return Array.from(row.cells);
+    return Array.from(row.querySelectorAll('[role="gridcell"],[role="cell"],[role="columnheader"],[role="rowheader"]'));
+}
+function isHeader(row) {
+    if (row.parentElement && row.parentElement.tagName === 'THEAD') return true;
+    const cells = cellsOf(row);
+    return cells.length > 0 && cells.every(c => c.tagName === 'TH' || c.getAttribute('role') === 'columnheader');
+}
+function cellText(cell) {
+    return cell.textContent.trim();
+}
+function splitRows(root) {
+    const all = rowsOf(root);
+    const headerRows = all.filter(isHeader);
+    return {
+        headers: headerRows.length ? cellsOf(headerRows[headerRows.length - 1]).map(cellText) : [],
+        body: all.filter(row => !isHeader(row)),
+    };
+}
+function scrollerOf(element) {
+    for (let node = element; node; node = node.parentElement) {
+        const overflow = window.getComputedStyle(node).overflowY;
+        if (node.scrollHeight > node.clientHeight + 1 && (overflow === 'auto' || overflow === 'scroll')) return node;
+    }
+    return document.scrollingElement;
+}
+
+const watches = {};
+
+const helpers = {
+    click(element) {
+        element.click();
+    },
+
+    // Clicks and returns the id of the document clicked on (see the readiness engine).
+    clickAndMark(element) {
+        element.click();
+        return window.__minimaReadiness ? window.__minimaReadiness.id : null;
+    },
+
+    focus(element) {
+        element.focus();
+    },
+
+    // Sets the value and dispatches 'change', so listeners run (sliders, custom inputs).
+    setValue(element, value) {
+        element.value = value;
+        element.dispatchEvent(new Event('change'));
+    },
+
+    scrollIntoView(element) {
+        element.scrollIntoView();
+    },
+
+    // Waits until the element is stable: its bounding box is the same in two consecutive
+    // animation frames and the topmost element at its center is the element itself or a
+    // descendant (not an overlay). Resolves with 'stable', or on timeout with the last
+    // reason: 'moving', 'covered' or 'detached'. Async.
+    waitStable(element, timeoutMs, done) {
+        let last = null;
+        let reason = 'moving';
+        let finished = false;
+        const finish = status => {
+            if (finished) return;
+            finished = true;
+            done(status);
+        };
+        // requestAnimationFrame does not run in hidden tabs: the timer still ends the wait.
+        setTimeout(() => finish(reason), timeoutMs);
+        const frame = () => {
+            if (finished) return;
+            if (!element.isConnected) return finish('detached');
+            const rect = element.getBoundingClientRect();
+            const x = rect.left + rect.width / 2;
+            const y = rect.top + rect.height / 2;
+            if (x < 0 || y < 0 || x >= window.innerWidth || y >= window.innerHeight) {
+                element.scrollIntoView({block: 'center', inline: 'center'});
+            }
+            const box = [rect.left, rect.top, rect.width, rect.height];
+            if (last && box.every((value, index) => value === last[index])) {
+                const root = element.getRootNode();
+                const hit = (root.elementFromPoint ? root : document).elementFromPoint(x, y);
+                if (hit && element.contains(hit)) return finish('stable');
+                reason = 'covered';
+            } else {
+                reason = 'moving';
+            }
+            last = box;
+            requestAnimationFrame(frame);
+        };
+        requestAnimationFrame(frame);
+    },
+
+    // Dispatches the full HTML5 drag-and-drop event sequence (geckodriver does not
+    // produce it from pointer actions).
+    dragAndDrop(source, target) {
+        const dataTransfer = new DataTransfer();
+        const fire = (node, type, withData) => node.dispatchEvent(new DragEvent(type, {
+            dataTransfer: withData ? dataTransfer : undefined, bubbles: true, cancelable: true,
+        }));
+        fire(source, 'dragstart', true);
+        fire(target, 'dragenter', true);
+        fire(target, 'dragover', true);
+        fire(target, 'drop', true);
+        fire(source, 'dragend', false);
+    },
+
+    // Evaluates every XPath in the page and polls until all of them are ready or the
+    // deadline expires, so N locators cost one round trip instead of N waits. Async.
+    resolveAll(xpaths, timeoutMs, requireVisible, done) {
+        const deadline = performance.now() + timeoutMs;
+        const poll = () => {
+            const results = xpaths.map(xpath => resolve(xpath, requireVisible));
+            if (results.every(r => r.status === 'ready' || r.status === 'invalid') || performance.now() >= deadline) {
+                done(results);
+            } else {
+                setTimeout(poll, 50);
+            }
+        };
+        poll();
+    },
+
+    // Polls several XPaths and returns as soon as any of them is ready, with the index
+    // of the first ready one in list order. Async.
+    firstOf(xpaths, timeoutMs, requireVisible, done) {
+        const deadline = performance.now() + timeoutMs;
+        const poll = () => {
+            for (let index = 0; index < xpaths.length; index++) {
+                const result = resolve(xpaths[index], requireVisible);
+                if (result.status === 'ready') return done({index: index, element: result.element});
+            }
+            if (performance.now() >= deadline) return done(null);
+            setTimeout(poll, 50);
+        };
+        poll();
+    },
+
+    // Installs a MutationObserver on an element. Changes are buffered in the page until
+    // watchPoll drains them.
+    watchInstall(element, watchId, attributes, watchText, maxBuffer) {
+        const watch = {buffer: [], waiter: null, text: element.textContent};
+        const push = change => {
+            watch.buffer.push(change);
+            if (watch.buffer.length > maxBuffer) watch.buffer.shift();
+        };
+        watch.observer = new MutationObserver(records => {
+            const now = Date.now();
+            for (const record of records) {
+                if (record.type === 'attributes' && record.target === element) {
+                    push({type: 'attribute', name: record.attributeName, old_value: record.oldValue,
+                          value: element.getAttribute(record.attributeName), time: now});
+                }
+            }
+            if (watchText && element.textContent !== watch.text) {
+                push({type: 'text', name: null, old_value: watch.text, value: element.textContent, time: now});
+                watch.text = element.textContent;
+            }
+            if (watch.buffer.length && watch.waiter) watch.waiter();
+        });
+        const options = {};
+        if (attributes !== null) {
+            options.attributes = true;
+            options.attributeOldValue = true;
+            if (attributes.length) options.attributeFilter = attributes;
+        }
+        if (watchText) {
+            options.characterData = true;
+            options.childList = true;
+            options.subtree = true;
+        }
+        watch.observer.observe(element, options);
+        watches[watchId] = watch;
+    },
+
+    // Long-poll: returns buffered changes at once, or waits in the page until the next
+    // change or the poll timeout. Returns null when the watch is gone. Async.
+    watchPoll(watchId, timeoutMs, done) {
+        const watch = watches[watchId];
+        if (!watch) return done(null);
+        if (watch.buffer.length) return done(watch.buffer.splice(0));
+        const timer = setTimeout(() => { watch.waiter = null; done([]); }, timeoutMs);
+        watch.waiter = () => { clearTimeout(timer); watch.waiter = null; done(watch.buffer.splice(0)); };
+    },
+
+    watchStop(watchId) {
+        const watch = watches[watchId];
+        if (!watch) return;
+        watch.observer.disconnect();
+        if (watch.waiter) watch.waiter();
+        delete watches[watchId];
+    },
+
+    // Reads one chunk of body rows, so a large table is transferred in a few calls.
+    tableChunk(root, start, count) {
+        const {headers, body} = splitRows(root);
+        return {
+            headers: headers,
+            total: body.length,
+            rows: body.slice(start, start + count).map(row => cellsOf(row).map(cellText)),
+        };
+    },
+
+    // For virtualised grids: waits for rendering to settle, reads the rendered rows with
+    // their row keys, then scrolls the grid's scroll container by about one viewport. Async.
+    tableScroll(root, reset, done) {
+        const scroller = scrollerOf(root);
+        if (reset) scroller.scrollTop = 0;
+        requestAnimationFrame(() => requestAnimationFrame(() => {
+            const {headers, body} = splitRows(root);
+            const rows = body.map(row => ({
+                key: row.getAttribute('aria-rowindex') || row.getAttribute('data-row-index') || row.getAttribute('data-index'),
+                cells: cellsOf(row).map(cellText),
+            }));
+            const before = scroller.scrollTop;
+            scroller.scrollTop = before + Math.max(Math.floor(scroller.clientHeight * 0.9), 1);
+            done({headers: headers, rows: rows, atEnd: scroller.scrollTop === before});
+        }));
+    },
+
+    // Runs several synchronous helpers in one round trip: calls is a list of [name, args].
+    batch(calls) {
+        return calls.map(([name, args]) => helpers[name](...args));
+    },
+};
+"""
+
+LIBRARY_VERSION = hashlib.sha1(HELPER_LIBRARY.encode()).hexdigest()[:12]
+
+LIBRARY_SCRIPT = (
+    "(() => {\nif (window.__minima && window.__minima.version === '%s') return;\n"
+    % LIBRARY_VERSION
+    + HELPER_LIBRARY
+    + "window.__minima = {version: '%s', helpers: helpers};\n})();\n" % LIBRARY_VERSION
+)
+
+# Returned by the call stubs when the document has no (current) library yet.
+MISSING = "__minima:missing__"
+
+CALL_SCRIPT = """/* minima:call */
+const minima = window.__minima;
+if (!minima || minima.version !== '%s') return '%s';
+return minima.helpers[arguments[0]](...Array.prototype.slice.call(arguments, 1));
+""" % (
+    LIBRARY_VERSION,
+    MISSING,
+)
+
+CALL_ASYNC_SCRIPT = """/* minima:call */
+const done = arguments[arguments.length - 1];
+const minima = window.__minima;
+if (!minima || minima.version !== '%s') return done('%s');
+minima.helpers[arguments[0]](...Array.prototype.slice.call(arguments, 1, -1), done);
+""" % (
+    LIBRARY_VERSION,
+    MISSING,
+)
+
+
+class ScriptRegistry:
+    """
+    Calls Minima's in-page helpers by name.
+
+    The helper library is registered to run on every new document where the browser
+    supports it (Chromium, via CDP), and installed lazily otherwise: when a call finds
+    no library in the document, the library and the call are sent together once, and
+    later calls in that document send only the short call stub.
+    """
+
+    def __init__(self, driver: WebDriver, supports_cdp: bool) -> None:
+        """
+        Args:
+            driver (WebDriver): The WebDriver session.
+            supports_cdp (bool): Whether the driver accepts CDP commands.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.driver = driver
+        self.installs = 0
+        if supports_cdp:
+            try:
+                driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument", {"source": LIBRARY_SCRIPT}
+                )
+            except WebDriverException as e:
+                self.logger.debug(f"Helper library not registered. Error: {e}")
+
+    def call(self, name: str, *args: Any) -> Any:
+        """
+        Calls a synchronous helper.
+
+        Args:
+            name (str): The helper name.
+            *args: The helper's arguments (WebElements allowed).
+
+        Returns:
+            Any: The helper's result.
+        """
+        result = self.driver.execute_script(CALL_SCRIPT, name, *args)
+        if result == MISSING:
+            self.installs += 1
+            result = self.driver.execute_script(
+                LIBRARY_SCRIPT + CALL_SCRIPT, name, *args
+            )
+        return result
+
+    def call_async(self, name: str, *args: Any) -> Any:
+        """
+        Calls an asynchronous helper; the driver's script timeout bounds the wait.
+
+        Args:
+            name (str): The helper name.
+            *args: The helper's arguments (WebElements allowed).
+
+        Returns:
+            Any: The value the helper passed to its `done` callback.
+        """
+        result = self.driver.execute_async_script(CALL_ASYNC_SCRIPT, name, *args)
+        if result == MISSING:
+            self.installs += 1
+            result = self.driver.execute_async_script(
+                LIBRARY_SCRIPT + CALL_ASYNC_SCRIPT, name, *args
+            )
+        return result
+
+    def batch(self, calls: list[tuple[str, list]]) -> list:
+        """
+        Runs several synchronous helpers in one round trip.
+
+        Args:
+            calls (list[tuple[str, list]]): (helper name, arguments) pairs, run in order.
+
+        Returns:
+            list: The helpers' results, in order.
+        """
+        return self.call("batch", [[name, list(args)] for name, args in calls])
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+from pyminima.logs.logger_utils import initialize_logger
+
+# Reads the storage of the current document's origin.
+STORAGE_SNAPSHOT_SCRIPT = """
+const dump = storage => {
+    const items = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+};
+return {
+    origin: location.origin,
+    localStorage: dump(window.localStorage),
+    sessionStorage: dump(window.sessionStorage),
+};
+"""
+
+# Seeds the storage of the current document's origin from snapshot entries, formatted in
+# as a JSON literal (or `arguments[0]` when run with execute_script). Registered to run on
+# every new document: the `__minimaStateRestored` flag (kept in sessionStorage, so per tab
+# and origin) makes it seed each origin once, and later app changes stand.
+STORAGE_RESTORE_SCRIPT = """
+(origins => {
+    const entry = origins.find(candidate => candidate.origin === location.origin);
+    if (!entry) return;
+    try {
+        if (window.sessionStorage.getItem('__minimaStateRestored')) return;
+        for (const [key, value] of Object.entries(entry.localStorage || {})) {
+            window.localStorage.setItem(key, value);
+        }
+        for (const [key, value] of Object.entries(entry.sessionStorage || {})) {
+            window.sessionStorage.setItem(key, value);
+        }
+        window.sessionStorage.setItem('__minimaStateRestored', '1');
+    } catch (e) {
+        // Storage is not available for this document (e.g. sandboxed frame).
+    }
+})(%s);
+"""
+
+
+def origin_of(url: str) -> str | None:
+    """
+    Returns the web origin (`scheme://host[:port]`) of an http(s) URL, or None for other URLs.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc.rsplit('@', 1)[-1].lower()}"
+
+
+def cookie_matches(cookie: dict, origin: str) -> bool:
+    """
+    Whether a cookie is sent to the given origin (domain matching only).
+    """
+    host = urlsplit(origin).hostname or ""
+    domain = cookie.get("domain", host).lstrip(".").lower()
+    return host == domain or host.endswith(f".{domain}")
+
+
+def cookie_from_cdp(cookie: dict) -> dict:
+    """
+    Converts a DevTools protocol cookie to the WebDriver cookie format used in snapshots.
+    """
+    converted = {
+        key: cookie[key]
+        for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        if key in cookie
+    }
+    if not cookie.get("session") and cookie.get("expires", -1) > 0:
+        converted["expiry"] = int(cookie["expires"])
+    return converted
+
+
+def cookie_to_cdp(cookie: dict) -> dict:
+    """
+    Converts a WebDriver-format cookie to a DevTools protocol `CookieParam`.
+    """
+    converted = {
+        key: cookie[key]
+        for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        if key in cookie
+    }
+    if "expiry" in cookie:
+        converted["expires"] = cookie["expiry"]
+    return converted
+
+
+def live_cookies(cookies: list[dict], now: float | None = None) -> list[dict]:
+    """
+    Drops the cookies whose expiry has passed. Session cookies (without expiry) are kept.
+    """
+    now = time.time() if now is None else now
+    return [cookie for cookie in cookies if cookie.get("expiry", now + 1) > now]
+
+
+def read_state(path: str) -> dict:
+    """
+    Reads a storage-state snapshot written by `write_state`.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    with open(path, encoding="utf-8") as snapshot:
+        return json.load(snapshot)
+
+
+def write_state(path: str, state: dict) -> None:
+    """
+    Writes a storage-state snapshot atomically. The file holds session cookies, so it is
+    created readable by its owner only.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+        json.dump(state, tmp)
+    os.replace(tmp_path, path)
+
+
+class StateCache:
+    """
+    On-disk cache of storage-state snapshots keyed by user and origin.
+
+    Each entry is one snapshot file named after a digest of its key. An entry older than
+    `ttl` seconds is a miss, so the setup that produced it (usually a login) runs again
+    once per cache lifetime instead of once per scenario.
+    """
+
+    def __init__(self, root: str, ttl: float) -> None:
+        """
+        Opens (or creates) a cache rooted at the given directory.
+
+        Args:
+            root (str): The cache directory.
+            ttl (float): How long a snapshot stays valid, in seconds.
+        """
+        self.logger = initialize_logger(self.__class__.__name__)
+        self.root = os.path.abspath(root)
+        self.ttl = ttl
+        os.makedirs(self.root, exist_ok=True)
+
+    def get(self, user: str, origin: str) -> dict | None:
+        """
+        Looks up a fresh snapshot.
+
+        Args:
+            user (str): The user the snapshot was taken for.
+            origin (str): The origin the session starts on.
+
+        Returns:
+            dict | None: The snapshot, or None if it is missing, unreadable or expired.
+        """
+        path = self.path(user, origin)
+        try:
+            state = read_state(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if time.time() - state.get("saved_at", 0) > self.ttl:
+            self.logger.debug(f"Storage state for {user}@{origin} expired")
+            return None
+        return state
+
+    def put(self, user: str, origin: str, state: dict) -> None:
+        """
+        Stores a snapshot, replacing the previous one for the same user and origin.
+
+        Args:
+            user (str): The user the snapshot was taken for.
+            origin (str): The origin the session starts on.
+            state (dict): The snapshot, as returned by `BrowserController.save_state`.
+        """
+        write_state(self.path(user, origin), state)
+
+    def path(self, user: str, origin: str) -> str:
+        digest = hashlib.sha256(f"{user}\n{origin}".encode()).hexdigest()
+        return os.path.join(self.root, f"{digest}.json")
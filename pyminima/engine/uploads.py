@@ -0,0 +1,75 @@
+import base64
+import json
+import os
+import tempfile
+import zipfile
+from typing import Iterator
+from urllib.parse import urlparse
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pyminima.engine.connection import connection_manager, remote_client_config
+
+# Read size of the zipped file; a multiple of 3, so the base64 of each chunk concatenates
+# into valid base64 of the whole archive.
+UPLOAD_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def upload_to_remote(driver: WebDriver, file_path: str) -> str:
+    """
+    Copies a local file to the remote end's file upload endpoint (`POST /session/{id}/se/file`,
+    as Selenium Grid implements it) and returns the file's path on the remote host.
+
+    Selenium zips and base64-encodes the whole file in memory and sends it as one JSON
+    string. Here the archive is written to a temporary file and the request body is
+    streamed from it with chunked transfer encoding, so memory use does not grow with
+    the file size.
+
+    Args:
+        driver (WebDriver): A remote WebDriver session.
+        file_path (str): The absolute path of the local file.
+
+    Returns:
+        str: The path of the uploaded file on the remote host.
+
+    Raises:
+        WebDriverException: If the remote end rejects the upload.
+    """
+    executor = driver.command_executor
+    client_config = remote_client_config(executor)
+    url = f"{client_config.remote_server_addr.rstrip('/')}/session/{driver.session_id}/se/file"
+    headers = executor.get_remote_connection_headers(
+        urlparse(url), client_config.keep_alive
+    )
+    headers.update(client_config.get_auth_header() or {})
+    connection = connection_manager(executor)
+
+    with tempfile.TemporaryFile() as archive:
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zipped:
+            zipped.write(file_path, os.path.basename(file_path))
+        archive.seek(0)
+        response = connection.request(
+            "POST",
+            url,
+            body=_json_body(archive),
+            headers=headers,
+            chunked=True,
+            retries=False,
+            timeout=client_config.timeout,
+        )
+    try:
+        payload = json.loads(response.data or b"{}")
+    finally:
+        response.close()
+    if response.status >= 400:
+        driver.error_handler.check_response(
+            {"status": response.status, "value": payload.get("value")}
+        )
+    return payload["value"]
+
+
+def _json_body(archive) -> Iterator[bytes]:
+    yield b'{"file": "'
+    while chunk := archive.read(UPLOAD_CHUNK_SIZE):
+        yield base64.b64encode(chunk)
+    yield b'"}'
@@ -2,6 +2,116 @@ from selenium.webdriver import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
 
+KEY_ALIASES = {
+    "ctrl": Keys.CONTROL,
+    "cmd": Keys.COMMAND,
+    "esc": Keys.ESCAPE,
+    "del": Keys.DELETE,
+    "arrow_down": Keys.ARROW_DOWN,
+    "arrow_up": Keys.ARROW_UP,
+    "arrow_left": Keys.ARROW_LEFT,
+    "arrow_right": Keys.ARROW_RIGHT,
+}
+
+
+def resolve_key(key: str) -> str:
+    """
+    Resolves a key name (e.g. 'ctrl', 'arrow_down', 'F5') to its WebDriver key code.
+    Single characters and values already taken from `Keys` are returned unchanged.
+
+    Args:
+        key (str): The key name or character.
+
+    Returns:
+        str: The WebDriver key code.
+
+    Raises:
+        ValueError: If the key name is not known.
+    """
+    if len(key) == 1:
+        return key
+    name = key.lower()
+    if name in KEY_ALIASES:
+        return KEY_ALIASES[name]
+    try:
+        return getattr(Keys, name.upper())
+    except AttributeError:
+        raise ValueError(f"Unknown key name: '{key}'")
+
+
+class KeySequence:
+    """
+    Collects text, key presses, chords and repeats so they can be compiled into a
+    single W3C actions payload and performed with one WebDriver command.
+
+    Example:
+        KeySequence().chord("ctrl", "a").press("backspace").type("hello").press("arrow_down", times=50)
+    """
+
+    def __init__(self) -> None:
+        self._steps: list[tuple[str, tuple[str, ...]]] = []
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def type(self, text: str) -> "KeySequence":
+        """
+        Types the given text, one key press per character.
+
+        Args:
+            text (str): The text to type.
+        """
+        self._steps.append(("type", (text,)))
+        return self
+
+    def press(self, key: str, times: int = 1) -> "KeySequence":
+        """
+        Presses a single key, optionally several times in a row.
+
+        Args:
+            key (str): The key name (e.g. 'enter', 'arrow_down') or character.
+            times (int): How many times the key is pressed. Default is 1.
+        """
+        if times < 1:
+            raise ValueError("Key repeat count must be at least 1.")
+        self._steps.append(("press", (resolve_key(key),) * times))
+        return self
+
+    def chord(self, *keys: str) -> "KeySequence":
+        """
+        Holds every key but the last one while the last key is pressed (e.g. Ctrl+A).
+
+        Args:
+            *keys (str): The modifier keys followed by the key to press.
+        """
+        if len(keys) < 2:
+            raise ValueError("A chord needs at least one modifier and one key.")
+        self._steps.append(("chord", tuple(resolve_key(key) for key in keys)))
+        return self
+
+    def compile(self, driver: WebDriver) -> ActionChains:
+        """
+        Compiles the whole sequence into a fresh ActionChains, ready to be performed once.
+
+        Args:
+            driver (WebDriver): The active WebDriver instance.
+
+        Returns:
+            ActionChains: The action chain holding every step of the sequence.
+        """
+        actions = ActionChains(driver)
+        for kind, keys in self._steps:
+            if kind == "chord":
+                *modifiers, key = keys
+                for modifier in modifiers:
+                    actions.key_down(modifier)
+                actions.send_keys(key)
+                for modifier in reversed(modifiers):
+                    actions.key_up(modifier)
+            else:
+                actions.send_keys(*keys)
+        return actions
+
 
 class KeyboardController:
     def __init__(self, session_driver: WebDriver) -> None:
@@ -11,7 +121,7 @@ class KeyboardController:
         Args:
             session_driver (WebDriver): The active WebDriver instance.
         """
-        self._actions = ActionChains(session_driver)
+        self._driver = session_driver
 
     def send_keys(self, key: str) -> None:
         """
@@ -20,7 +130,38 @@ class KeyboardController:
         Args:
             key (str): The key to be pressed.
         """
-        self._actions.send_keys(key).perform()
+        ActionChains(self._driver).send_keys(key).perform()
+
+    def type_sequence(self, sequence: KeySequence | str) -> None:
+        """
+        Performs a whole key sequence with a single WebDriver actions command.
+
+        Args:
+            sequence (KeySequence | str): The sequence to perform. Plain strings are typed as text.
+        """
+        if isinstance(sequence, str):
+            sequence = KeySequence().type(sequence)
+        if len(sequence):
+            sequence.compile(self._driver).perform()
+
+    def press_chord(self, *keys: str) -> None:
+        """
+        Presses a key combination such as Ctrl+A in one actions command.
+
+        Args:
+            *keys (str): The modifier keys followed by the key to press.
+        """
+        self.type_sequence(KeySequence().chord(*keys))
+
+    def press_repeated(self, key: str, times: int) -> None:
+        """
+        Presses the same key several times in one actions command.
+
+        Args:
+            key (str): The key name or character.
+            times (int): How many times the key is pressed.
+        """
+        self.type_sequence(KeySequence().press(key, times=times))
 
     def press_enter(self) -> None:
         """Simulates pressing the Enter key."""
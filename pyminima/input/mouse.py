@@ -4,6 +4,86 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
+from pyminima.input.keyboard import resolve_key
+
+Point = tuple[int, int]
+
+
+class Gesture:
+    """
+    Acumula operações de ponteiro (movimentos, cliques, teclas modificadoras) e as
+    compila em um único pedido de ações W3C, executado com um só comando.
+
+    Os deslocamentos relativos a um elemento partem do centro do elemento,
+    como no ActionChains do Selenium 4.
+    """
+
+    def __init__(self, move_duration: int = 16) -> None:
+        """
+        Inicializa o gesto vazio.
+
+        Args:
+            move_duration (int): Duração de cada movimento do ponteiro em milissegundos. Padrão 16ms (um quadro).
+        """
+        self.move_duration = move_duration
+        self._steps: list[tuple[str, tuple]] = []
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def move_to(self, web_element: WebElement, x: int = 0, y: int = 0) -> "Gesture":
+        """Move o ponteiro para o elemento, com deslocamento opcional a partir do centro."""
+        self._steps.append(("move_to_element_with_offset", (web_element, x, y)))
+        return self
+
+    def move_by(self, x: int, y: int) -> "Gesture":
+        """Move o ponteiro relativamente à posição atual."""
+        self._steps.append(("move_by_offset", (x, y)))
+        return self
+
+    def path(self, web_element: WebElement, points: list[Point]) -> "Gesture":
+        """Percorre uma lista de pontos (deslocamentos a partir do centro do elemento)."""
+        for x, y in points:
+            self.move_to(web_element, x, y)
+        return self
+
+    def press(self) -> "Gesture":
+        """Pressiona o botão principal na posição atual do ponteiro."""
+        self._steps.append(("click_and_hold", (None,)))
+        return self
+
+    def release(self) -> "Gesture":
+        """Solta o botão principal na posição atual do ponteiro."""
+        self._steps.append(("release", (None,)))
+        return self
+
+    def click(self, web_element: WebElement | None = None) -> "Gesture":
+        """Clica no elemento informado ou na posição atual do ponteiro."""
+        self._steps.append(("click", (web_element,)))
+        return self
+
+    def key_down(self, key: str) -> "Gesture":
+        """Mantém pressionada uma tecla (ex: 'ctrl', 'shift') até `key_up`."""
+        self._steps.append(("key_down", (resolve_key(key),)))
+        return self
+
+    def key_up(self, key: str) -> "Gesture":
+        """Solta uma tecla pressionada com `key_down`."""
+        self._steps.append(("key_up", (resolve_key(key),)))
+        return self
+
+    def pause(self, seconds: float) -> "Gesture":
+        """Aguarda dentro do próprio pedido de ações, sem ida e volta extra."""
+        self._steps.append(("pause", (seconds,)))
+        return self
+
+    def compile(self, driver: WebDriver) -> ActionChains:
+        """Compila o gesto em um novo ActionChains pronto para um único `perform()`."""
+        actions = ActionChains(driver, duration=self.move_duration)
+        for method, args in self._steps:
+            getattr(actions, method)(*args)
+        return actions
+
 
 class Mouse:
     """
@@ -46,3 +126,35 @@ class Mouse:
         """Clica e segura um WebElement e o solta em cima de outro WebElement."""
         self.logger.debug("Executando drag and drop.")
         self._get_actions().drag_and_drop(source_element, target_element).perform()
+
+    def perform(self, gesture: Gesture) -> None:
+        """Executa um gesto composto com um único pedido de ações W3C."""
+        self.logger.debug(f"Executando gesto com {len(gesture)} passo(s).")
+        if len(gesture):
+            gesture.compile(self.driver).perform()
+
+    def hover_path(self, web_element: WebElement, points: list[Point]) -> None:
+        """Passa o ponteiro por uma sequência de pontos relativos ao centro do WebElement."""
+        self.perform(Gesture().path(web_element, points))
+
+    def draw(
+        self, web_element: WebElement, points: list[Point], move_duration: int = 0
+    ) -> None:
+        """
+        Desenha sobre o WebElement (ex: <canvas>): pressiona no primeiro ponto,
+        percorre os demais com o botão pressionado e solta no último.
+        """
+        if not points:
+            return
+        first, *rest = points
+        gesture = Gesture(move_duration=move_duration).move_to(web_element, *first)
+        self.perform(gesture.press().path(web_element, rest).release())
+
+    def multi_select(
+        self, web_elements: list[WebElement], modifier: str = "ctrl"
+    ) -> None:
+        """Clica em vários WebElements mantendo uma tecla modificadora pressionada."""
+        gesture = Gesture().key_down(modifier)
+        for web_element in web_elements:
+            gesture.click(web_element)
+        self.perform(gesture.key_up(modifier))
@@ -1,9 +1,135 @@
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 from pyminima.settings.settings import config
 
+_listeners: dict[Optional[str], tuple[QueueHandler, QueueListener]] = {}
+# `pyminima.engine.context.current_session`, imported on first use: the engine imports
+# this module, so it cannot be imported at load time.
+_current_session = None
+
+
+class SessionContextFilter(logging.Filter):
+    """
+    Adds the id of the active browser session (from `current_session`) to every record
+    as `session_id`, so logs from parallel sessions can be correlated. It runs on the
+    calling thread, where the session context variable is visible.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        global _current_session
+        if _current_session is None:
+            from pyminima.engine.context import current_session
+
+            _current_session = current_session
+        session = _current_session.get(None)
+        record.session_id = getattr(session, "session_id", None)
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "session_id": getattr(record, "session_id", None),
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _TextQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps the traceback apart from the message. The stock `prepare`
+    merges it into `msg`, so the listener's formatters could not tell them apart (the
+    JSON formatter would never emit `exception`).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+def _build_handlers(log_to_file: Optional[str]) -> list[logging.Handler]:
+    """
+    Builds the handlers that actually write the records (console and, optionally, a rotating file).
+    """
+    if config.log_format == "json":
+        formatter = JsonLinesFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+
+    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    if log_to_file:
+        handlers.append(
+            RotatingFileHandler(
+                log_to_file,
+                maxBytes=config.log_max_bytes,
+                backupCount=config.log_backup_count,
+                encoding="utf-8",
+            )
+        )
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def _get_queue_handler(log_to_file: Optional[str]) -> QueueHandler:
+    """
+    Returns the QueueHandler feeding the background listener for the given destination,
+    starting the listener on first use. Loggers sharing a destination share one listener.
+    """
+    if log_to_file not in _listeners:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = _TextQueueHandler(log_queue)
+        queue_handler.addFilter(SessionContextFilter())
+        listener = QueueListener(
+            log_queue, *_build_handlers(log_to_file), respect_handler_level=True
+        )
+        listener.start()
+        _listeners[log_to_file] = (queue_handler, listener)
+    return _listeners[log_to_file][0]
+
+
+def shutdown_async_logging() -> None:
+    """
+    Flushes every queued record and stops the background listeners.
+    Registered with `atexit`, so records are not lost when the interpreter exits.
+    """
+    while _listeners:
+        _, (_, listener) = _listeners.popitem()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_async_logging)
+
 
 def initialize_logger(
     logger_name: str = "minima",
@@ -13,33 +139,33 @@ def initialize_logger(
     """
     Initializes and configures the logger
 
+    With `config.log_async` enabled (the default), the logger only enqueues records;
+    a background QueueListener formats them and writes to the console and file, so
+    logging calls do not block on terminal or disk I/O.
+
     Args:
         logger_name (str): The name to use for the logger. Helps in identifying logs from different components.
         log_level (str): The minimum log level to capture. Default is "INFO".
-        log_to_file (Optional[str]): If provided, logs will be written to the specified file path. Default is None.
+        log_to_file (Optional[str]): If provided, logs will be written to the specified file path, rotated by size.
+            Defaults to `config.log_file`.
 
     Returns:
         logging.Logger: Configured logger instance with the specified name.
     """
     log_level = log_level or config.log_level
+    log_to_file = log_to_file or config.log_file
+    level = getattr(logging, log_level.upper(), logging.INFO)
 
     logger = logging.getLogger(logger_name)
-    logger.setLevel(getattr(logging, log_level.upper(), "INFO"))
+    logger.setLevel(level)
 
     if not logger.hasHandlers():
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, log_level.upper(), "INFO"))
-
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        if log_to_file:
-            file_handler = logging.FileHandler(log_to_file)
-            file_handler.setLevel(getattr(logging, log_level.upper(), "INFO"))
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+        if config.log_async:
+            logger.addHandler(_get_queue_handler(log_to_file))
+        else:
+            for handler in _build_handlers(log_to_file):
+                handler.setLevel(level)
+                handler.addFilter(SessionContextFilter())
+                logger.addHandler(handler)
 
     return logger
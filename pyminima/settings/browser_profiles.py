@@ -0,0 +1,70 @@
+# Named browser performance profiles, selected with `PYAUTOTK_BROWSER_PROFILE`
+# or the `profile` argument of `browser_session`.
+#
+# - default: the browser as launched before profiles existed.
+# - ci: headless, no GPU and no /dev/shm usage, for containers with a small shm.
+# - dense: everything in 'ci' plus capped renderer processes, disabled
+#   extensions/background services and small caches, to pack many sessions per host.
+
+CI_CHROME_ARGUMENTS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+DENSE_CHROME_ARGUMENTS = CI_CHROME_ARGUMENTS + [
+    "--renderer-process-limit=2",
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,BackForwardCache",
+    "--disk-cache-size=8388608",
+    "--media-cache-size=1048576",
+    "--js-flags=--max-old-space-size=256",
+]
+
+CI_FIREFOX_PREFERENCES = {
+    "layers.acceleration.disabled": True,
+    "gfx.webrender.software": True,
+    "media.hardware-video-decoding.enabled": False,
+    "browser.shell.checkDefaultBrowser": False,
+}
+
+DENSE_FIREFOX_PREFERENCES = {
+    **CI_FIREFOX_PREFERENCES,
+    "dom.ipc.processCount": 2,
+    "dom.ipc.processCount.webIsolated": 1,
+    "fission.autostart": False,
+    "extensions.enabledScopes": 0,
+    "extensions.update.enabled": False,
+    "app.update.auto": False,
+    "browser.cache.disk.enable": False,
+    "browser.cache.memory.capacity": 16384,
+    "browser.sessionhistory.max_total_viewers": 0,
+    "browser.sessionstore.resume_from_crash": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "toolkit.telemetry.enabled": False,
+}
+
+BROWSER_PROFILES = {
+    "default": {
+        "headless": False,
+        "chrome_arguments": [],
+        "firefox_preferences": {},
+    },
+    "ci": {
+        "headless": True,
+        "chrome_arguments": CI_CHROME_ARGUMENTS,
+        "firefox_preferences": CI_FIREFOX_PREFERENCES,
+    },
+    "dense": {
+        "headless": True,
+        "chrome_arguments": DENSE_CHROME_ARGUMENTS,
+        "firefox_preferences": DENSE_FIREFOX_PREFERENCES,
+    },
+}
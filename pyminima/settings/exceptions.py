@@ -1,3 +1,6 @@
+from selenium.common.exceptions import TimeoutException
+
+
 class ElementNotVisibleException(Exception):
     """
     Custom exception raised when an element is not visible within the specified timeout.
@@ -12,6 +15,20 @@ class ElementNotVisibleException(Exception):
         )
 
 
+class ElementNotStableException(TimeoutException):
+    """
+    Exception raised when an element keeps moving, or stays covered by another element,
+    for the whole of the specified timeout.
+    """
+
+    def __init__(self, xpath: str, timeout: float, reason: str):
+        self.xpath = xpath
+        self.reason = reason
+        super().__init__(
+            f"Element with XPath '{xpath}' not stable after {timeout} seconds ({reason})."
+        )
+
+
 class WidgetException(Exception):
     """
     Base exception for errors related to Widget operations.
@@ -27,6 +44,8 @@ class WidgetClickException(WidgetException):
     """
 
     def __init__(self, xpath: str, original_exception: Exception):
+        self.xpath = xpath
+        self.original_exception = original_exception
         message = f"Failed to click on element with XPath '{xpath}'. Error: {original_exception}"
         super().__init__(message)
 
@@ -37,6 +56,8 @@ class WidgetDoubleClickException(WidgetException):
     """
 
     def __init__(self, xpath: str, original_exception: Exception):
+        self.xpath = xpath
+        self.original_exception = original_exception
         message = f"Failed to double-click on element with XPath '{xpath}'. Error: {original_exception}"
         super().__init__(message)
 
@@ -47,16 +68,34 @@ class WidgetHoverException(WidgetException):
     """
 
     def __init__(self, xpath: str, original_exception: Exception):
+        self.xpath = xpath
+        self.original_exception = original_exception
         message = f"Failed to hover over element with XPath '{xpath}'. Error: {original_exception}"
         super().__init__(message)
 
 
+class WidgetDragException(WidgetException):
+    """
+    Exception raised when a drag (drag and drop, or drawing along a path) fails on the Widget.
+    """
+
+    def __init__(self, xpath: str, original_exception: Exception):
+        self.xpath = xpath
+        self.original_exception = original_exception
+        message = (
+            f"Failed to drag element with XPath '{xpath}'. Error: {original_exception}"
+        )
+        super().__init__(message)
+
+
 class WidgetEnterTextException(WidgetException):
     """
     Exception raised when entering text into a Widget element fails.
     """
 
     def __init__(self, xpath: str, text: str, original_exception: Exception):
+        self.xpath = xpath
+        self.original_exception = original_exception
         message = f"Failed to enter text '{text}' into element with XPath '{xpath}'. Error: {original_exception}"
         super().__init__(message)
 
@@ -67,6 +106,8 @@ class WidgetScrollException(WidgetException):
     """
 
     def __init__(self, xpath: str, original_exception: Exception):
+        self.xpath = xpath
+        self.original_exception = original_exception
         message = f"Failed to scroll to element with XPath '{xpath}'. Error: {original_exception}"
         super().__init__(message)
 
@@ -77,6 +118,8 @@ class WidgetWaitTimeoutException(WidgetException):
     """
 
     def __init__(self, xpath: str, timeout: int, original_exception: Exception):
+        self.xpath = xpath
+        self.original_exception = original_exception
         message = f"Element with XPath '{xpath}' not visible after {timeout} seconds. Error: {original_exception}"
         super().__init__(message)
 
@@ -87,6 +130,8 @@ class WidgetRetrievePropertiesException(WidgetException):
     """
 
     def __init__(self, xpath: str, original_exception: Exception):
+        self.xpath = xpath
+        self.original_exception = original_exception
         message = f"Failed to retrieve properties for element with XPath '{xpath}'. Error: {original_exception}"
         super().__init__(message)
 
@@ -97,6 +142,8 @@ class WidgetAttributeException(WidgetException):
     """
 
     def __init__(self, xpath: str, attribute_name: str, original_exception: Exception):
+        self.xpath = xpath
+        self.original_exception = original_exception
         message = f"Failed to retrieve attribute '{attribute_name}' from element with XPath '{xpath}'. Error: {original_exception}"
         super().__init__(message)
 
@@ -107,6 +154,7 @@ class WidgetExtractionException(WidgetException):
     """
 
     def __init__(self, attribute: str, original_exception: Exception):
+        self.original_exception = original_exception
         message = f"Failed to extract elements with attribute '{attribute}'. Error: {original_exception}"
         super().__init__(message)
 
@@ -119,3 +167,35 @@ class BrowserWaitForPageLoadException(WidgetException):
     def __init__(self, timeout: int):
         message = f"Page did not load completely within {timeout} seconds."
         super().__init__(message)
+
+
+class CommandTimeoutException(TimeoutException):
+    """
+    Exception raised when a driver command is aborted because the deadline of the
+    surrounding call expired.
+    """
+
+    def __init__(self, budget: float | None):
+        super().__init__(f"Command deadline of {budget} seconds expired.")
+
+
+class CommandCancelledException(Exception):
+    """
+    Exception raised when a driver command is aborted because its deadline was cancelled.
+    """
+
+    def __init__(self):
+        super().__init__("Command was cancelled.")
+
+
+class DownloadTimeoutException(TimeoutException):
+    """
+    Exception raised when no download completes in the session's download directory
+    within the specified timeout.
+    """
+
+    def __init__(self, directory: str, timeout: float):
+        self.directory = directory
+        super().__init__(
+            f"No download completed in '{directory}' within {timeout} seconds."
+        )
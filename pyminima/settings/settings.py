@@ -12,23 +12,99 @@ class _ConfigLoader:
         Initializes the configuration loader with environment variables or default values.
         """
         self.log_level = os.getenv("PYAUTOTK_LOG_LEVEL", "INFO")
+        self.log_format = os.getenv("PYAUTOTK_LOG_FORMAT", "text").lower()
+        self.log_async = os.getenv("PYAUTOTK_LOG_ASYNC", "True").lower() == "true"
+        self.log_file = os.getenv("PYAUTOTK_LOG_FILE")
+        self.log_max_bytes = int(
+            os.getenv("PYAUTOTK_LOG_MAX_BYTES", str(10 * 1024 * 1024))
+        )
+        self.log_backup_count = int(os.getenv("PYAUTOTK_LOG_BACKUP_COUNT", "5"))
         self.browser_type = os.getenv("PYAUTOTK_BROWSER_TYPE", "chrome")
+        self.isolation = os.getenv("PYAUTOTK_ISOLATION", "browser").lower()
+        self.remote_url = os.getenv("PYAUTOTK_REMOTE_URL")
+        self.browser_profile = os.getenv("PYAUTOTK_BROWSER_PROFILE", "default").lower()
         self.maximize_browser = (
             os.getenv("PYAUTOTK_MAXIMIZE_BROWSER", "False").lower() == "true"
         )
         self.headless_mode = (
             os.getenv("PYAUTOTK_HEADLESS_MODE", "False").lower() == "true"
         )
+        self.http_keep_alive = (
+            os.getenv("PYAUTOTK_HTTP_KEEP_ALIVE", "True").lower() == "true"
+        )
+        self.http_timeout = float(os.getenv("PYAUTOTK_HTTP_TIMEOUT", "120"))
+        self.http_pool_connections = int(
+            os.getenv("PYAUTOTK_HTTP_POOL_CONNECTIONS", "2")
+        )
+        self.http_pool_maxsize = int(os.getenv("PYAUTOTK_HTTP_POOL_MAXSIZE", "4"))
+        self.http_pool_block = (
+            os.getenv("PYAUTOTK_HTTP_POOL_BLOCK", "False").lower() == "true"
+        )
+        self.native_locators = (
+            os.getenv("PYAUTOTK_NATIVE_LOCATORS", "True").lower() == "true"
+        )
+        self.page_wait_until = os.getenv("PYAUTOTK_PAGE_WAIT_UNTIL", "load").lower()
+        self.page_load_timeout = float(os.getenv("PYAUTOTK_PAGE_LOAD_TIMEOUT", "30"))
+        self.network_idle_ms = int(os.getenv("PYAUTOTK_NETWORK_IDLE_MS", "500"))
+        self.navigation_grace_ms = int(os.getenv("PYAUTOTK_NAVIGATION_GRACE_MS", "300"))
+        self.element_wait_for = os.getenv(
+            "PYAUTOTK_ELEMENT_WAIT_FOR", "clickable"
+        ).lower()
+        self.health_check_timeout = float(
+            os.getenv("PYAUTOTK_HEALTH_CHECK_TIMEOUT", "5")
+        )
+        self.auto_recover = (
+            os.getenv("PYAUTOTK_AUTO_RECOVER", "False").lower() == "true"
+        )
+        self.max_recoveries = int(os.getenv("PYAUTOTK_MAX_RECOVERIES", "3"))
+        self.max_retries = int(os.getenv("PYAUTOTK_MAX_RETRIES", "3"))
+        self.retry_backoff = float(os.getenv("PYAUTOTK_RETRY_BACKOFF", "0.1"))
+        self.retry_max_backoff = float(os.getenv("PYAUTOTK_RETRY_MAX_BACKOFF", "1"))
         self.artifacts_path = os.getenv("PYAUTOTK_ARTIFACTS_PATH", "./logs")
+        self.capture_on_failure = (
+            os.getenv("PYAUTOTK_CAPTURE_ON_FAILURE", "True").lower() == "true"
+        )
+        self.capture_each_action = (
+            os.getenv("PYAUTOTK_CAPTURE_EACH_ACTION", "False").lower() == "true"
+        )
+        self.artifact_format = os.getenv("PYAUTOTK_ARTIFACT_FORMAT", "png")
+        self.artifact_queue_size = int(os.getenv("PYAUTOTK_ARTIFACT_QUEUE_SIZE", "32"))
+        self.artifact_drop_policy = os.getenv(
+            "PYAUTOTK_ARTIFACT_DROP_POLICY", "drop_newest"
+        )
+        self.metrics_export = os.getenv("PYAUTOTK_METRICS_EXPORT", "").lower()
+        self.cache_path = os.getenv("PYAUTOTK_CACHE_PATH", "./.minima_cache")
+        self.cache_max_bytes = int(
+            os.getenv("PYAUTOTK_CACHE_MAX_BYTES", str(512 * 1024 * 1024))
+        )
+        self.download_path = os.getenv("PYAUTOTK_DOWNLOAD_PATH", "./downloads")
+        self.download_timeout = float(os.getenv("PYAUTOTK_DOWNLOAD_TIMEOUT", "60"))
+        self.state_path = os.getenv("PYAUTOTK_STATE_PATH", "./.minima_state")
+        self.state_ttl = float(os.getenv("PYAUTOTK_STATE_TTL", "3600"))
 
     def __repr__(self):
         """
         Returns a string representation of the current configuration.
         """
         return (
-            f"ConfigLoader(log_level='{self.log_level}', browser_type='{self.browser_type}', "
+            f"ConfigLoader(log_level='{self.log_level}', log_format='{self.log_format}', "
+            f"log_async={self.log_async}, log_file='{self.log_file}', log_max_bytes={self.log_max_bytes}, "
+            f"log_backup_count={self.log_backup_count}, browser_type='{self.browser_type}', "
+            f"browser_profile='{self.browser_profile}', isolation='{self.isolation}', remote_url='{self.remote_url}', "
             f"maximize_browser={self.maximize_browser}, headless_mode={self.headless_mode}, "
-            f"artifacts_path='{self.artifacts_path}')"
+            f"http_keep_alive={self.http_keep_alive}, http_timeout={self.http_timeout}, "
+            f"http_pool_connections={self.http_pool_connections}, http_pool_maxsize={self.http_pool_maxsize}, "
+            f"http_pool_block={self.http_pool_block}, native_locators={self.native_locators}, "
+            f"page_wait_until='{self.page_wait_until}', page_load_timeout={self.page_load_timeout}, "
+            f"network_idle_ms={self.network_idle_ms}, navigation_grace_ms={self.navigation_grace_ms}, element_wait_for='{self.element_wait_for}', health_check_timeout={self.health_check_timeout}, auto_recover={self.auto_recover}, "
+            f"max_recoveries={self.max_recoveries}, max_retries={self.max_retries}, retry_backoff={self.retry_backoff}, "
+            f"retry_max_backoff={self.retry_max_backoff}, artifacts_path='{self.artifacts_path}', capture_on_failure={self.capture_on_failure}, "
+            f"capture_each_action={self.capture_each_action}, artifact_format='{self.artifact_format}', "
+            f"artifact_queue_size={self.artifact_queue_size}, artifact_drop_policy='{self.artifact_drop_policy}', "
+            f"metrics_export='{self.metrics_export}', cache_path='{self.cache_path}', "
+            f"cache_max_bytes={self.cache_max_bytes}, download_path='{self.download_path}', "
+            f"download_timeout={self.download_timeout}, state_path='{self.state_path}', "
+            f"state_ttl={self.state_ttl})"
         )
 
 
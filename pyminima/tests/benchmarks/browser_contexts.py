@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+
+from pyminima.engine.controller import BrowserController
+from pyminima.tests.benchmarks.profile_memory import process_tree_rss
+
+BENCH_PAGE = "data:text/html,<h1>minima</h1>" + "".join(
+    f"<p id='p{index}'>paragraph {index}</p>" for index in range(200)
+)
+SESSIONS = 5
+
+
+def measure_browsers(browser_type: str) -> tuple[float, int]:
+    """Time to start one isolated session, and RSS of all sessions, with one browser each."""
+    sessions = []
+    try:
+        start = time.perf_counter()
+        for _ in range(SESSIONS):
+            session = BrowserController(browser_type, maximize=False, headless=True)
+            session.open_url(BENCH_PAGE)
+            sessions.append(session)
+        elapsed = (time.perf_counter() - start) / SESSIONS
+        rss = sum(
+            process_tree_rss(session.driver.service.process.pid) for session in sessions
+        )
+        return elapsed, rss
+    finally:
+        for session in sessions:
+            session.close_browser()
+
+
+def measure_contexts(browser_type: str) -> tuple[float, int]:
+    """Same as `measure_browsers`, with one browser context each in a shared browser (counted in the RSS)."""
+    browser = BrowserController(browser_type, maximize=False, headless=True)
+    contexts = []
+    try:
+        start = time.perf_counter()
+        for _ in range(SESSIONS):
+            context = browser.new_context()
+            context.open_url(BENCH_PAGE)
+            contexts.append(context)
+        elapsed = (time.perf_counter() - start) / SESSIONS
+        return elapsed, process_tree_rss(browser.driver.service.process.pid)
+    finally:
+        for context in contexts:
+            context.close_browser()
+        browser.close_browser()
+
+
+def run_benchmark(browser_type: str = "chrome") -> None:
+    if not os.path.isdir("/proc"):
+        raise NotImplementedError("RSS measurement relies on /proc (Linux only).")
+
+    print(f"{SESSIONS} isolated {browser_type} sessions")
+    for name, measure in (
+        ("browsers", measure_browsers),
+        ("contexts", measure_contexts),
+    ):
+        elapsed, rss = measure(browser_type)
+        print(
+            f"{name:>9}: {elapsed * 1000:8.1f} ms/session to start, "
+            f"{rss / SESSIONS / 2**20:7.1f} MiB RSS/session"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark(*sys.argv[1:])
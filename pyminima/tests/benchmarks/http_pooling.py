@@ -0,0 +1,109 @@
+import http.server
+import socket
+import sys
+import threading
+import time
+import unittest.mock
+
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from pyminima.engine.connection import configure_connection
+from pyminima.settings.settings import config
+
+COMMANDS_PER_SESSION = 500
+SESSION_COUNTS = (1, 16)
+WORKERS_PER_SESSION = 2
+POOLS = {
+    "no keep-alive": {"http_keep_alive": False},
+    "keep-alive, 1 socket": {"http_keep_alive": True, "http_pool_maxsize": 1},
+    "keep-alive, 4 sockets": {"http_keep_alive": True, "http_pool_maxsize": 4},
+}
+
+
+class StandInDriver(http.server.BaseHTTPRequestHandler):
+    """
+    Minimal stand-in for a driver service: answers every command with a null value
+    over HTTP/1.1, and counts the TCP connections it accepts.
+    """
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with StandInDriver.lock:
+            StandInDriver.connections += 1
+
+    def do_GET(self):
+        body = b'{"value": null}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run_sessions(url: str, sessions: int) -> float:
+    connections = []
+    for _ in range(sessions):
+        connection = RemoteConnection(client_config=ClientConfig(url))
+        configure_connection(connection)
+        connections.append(connection)
+
+    def worker(connection: RemoteConnection) -> None:
+        for _ in range(COMMANDS_PER_SESSION // WORKERS_PER_SESSION):
+            connection.execute(Command.GET_TITLE, {"sessionId": "bench"})
+
+    threads = [
+        threading.Thread(target=worker, args=(connection,))
+        for connection in connections
+        for _ in range(WORKERS_PER_SESSION)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    for connection in connections:
+        connection.close()
+    return elapsed
+
+
+def run_benchmark(url: str | None = None) -> None:
+    server = None
+    if url is None:
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInDriver)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}"
+
+    print(
+        f"{COMMANDS_PER_SESSION} commands per session, "
+        f"{WORKERS_PER_SESSION} threads per session, against {url}"
+    )
+    for sessions in SESSION_COUNTS:
+        for name, settings in POOLS.items():
+            StandInDriver.connections = 0
+            with unittest.mock.patch.multiple(config, **settings):
+                elapsed = run_sessions(url, sessions)
+            total = sessions * COMMANDS_PER_SESSION
+            opened = f", {StandInDriver.connections} connections" if server else ""
+            print(
+                f"{sessions:>3} session(s), {name:>22}: "
+                f"{total / elapsed:8,.0f} commands/s{opened}"
+            )
+
+    if server is not None:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    run_benchmark(*sys.argv[1:])
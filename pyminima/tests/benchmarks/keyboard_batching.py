@@ -0,0 +1,53 @@
+import time
+
+from pyminima.engine.context import browser_session, current_session
+from pyminima.input.keyboard import KeySequence
+from pyminima.ui.browser import Browser
+from pyminima.ui.input_field import InputField
+
+BENCH_PAGE = "data:text/html,<textarea id='editor' rows='40'></textarea>"
+TEXT = "the quick brown fox jumps over the lazy dog " * 4
+ARROW_REPEATS = 50
+
+
+def per_key_perform() -> float:
+    keyboard = current_session.get().keyboard
+    start = time.perf_counter()
+    for char in TEXT:
+        keyboard.send_keys(char)
+    for _ in range(ARROW_REPEATS):
+        keyboard.press_arrow_up()
+    return time.perf_counter() - start
+
+
+def batched_perform() -> float:
+    start = time.perf_counter()
+    Browser.type_sequence(
+        KeySequence().type(TEXT).press("arrow_up", times=ARROW_REPEATS)
+    )
+    return time.perf_counter() - start
+
+
+def reset_editor() -> None:
+    editor = InputField(id="editor")
+    editor.click()
+    Browser.press_chord("ctrl", "a")
+    Browser.press_key("backspace")
+
+
+@browser_session(BENCH_PAGE, headless=True)
+def run_benchmark():
+    reset_editor()
+    per_key = per_key_perform()
+    reset_editor()
+    batched = batched_perform()
+
+    keys = len(TEXT) + ARROW_REPEATS
+    print(f"Keys per run: {keys}")
+    print(f"Per-key perform(): {per_key:.3f}s ({per_key / keys * 1000:.2f} ms/key)")
+    print(f"Batched sequence:  {batched:.3f}s ({batched / keys * 1000:.2f} ms/key)")
+    print(f"Speed-up: {per_key / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,61 @@
+import sys
+import time
+
+from pyminima.engine.context import browser_session, current_session
+from pyminima.engine.locators import compile_locator
+from pyminima.ui.ui_element import UIElement
+
+ROWS = 10_000  # 5 nodes per row: 50k nodes
+LOOKUPS = 200
+LOCATORS = {
+    "id only": {"id": f"cell-{ROWS - 1}"},
+    "id + class": {"id": f"cell-{ROWS - 1}", "class_": "cell last"},
+    "data attribute": {"data_row": str(ROWS - 1)},
+    "id + text": {"id": f"cell-{ROWS - 1}", "text": f"value {ROWS - 1}"},
+}
+
+BUILD_DOM_SCRIPT = """
+const rows = arguments[0];
+const fragment = document.createDocumentFragment();
+for (let i = 0; i < rows; i++) {
+    const row = document.createElement('div');
+    row.className = 'row';
+    row.setAttribute('data-row', i);
+    row.innerHTML = `<span>${i}</span><a href="#${i}">link</a><em>x</em>` +
+        `<b id="cell-${i}" class="cell${i === rows - 1 ? ' last' : ''}">value ${i}</b>`;
+    fragment.appendChild(row);
+}
+document.body.appendChild(fragment);
+return document.getElementsByTagName('*').length;
+"""
+
+
+def time_lookups(driver, locator: tuple[str, str]) -> float:
+    start = time.perf_counter()
+    for _ in range(LOOKUPS):
+        driver.find_element(*locator)
+    return (time.perf_counter() - start) / LOOKUPS
+
+
+def run_benchmark(browser_type: str = "chrome") -> None:
+    @browser_session("about:blank", browser_type=browser_type, headless=True)
+    def scenario():
+        driver = current_session.get().driver
+        nodes = driver.execute_script(BUILD_DOM_SCRIPT, ROWS)
+        print(f"{nodes:,} DOM nodes, {LOOKUPS} lookups per locator ({browser_type})")
+        for name, attributes in LOCATORS.items():
+            xpath = UIElement(**attributes).xpath
+            compiled = compile_locator(xpath)
+            xpath_time = time_lookups(driver, ("xpath", xpath))
+            compiled_time = time_lookups(driver, compiled)
+            print(
+                f"{name:>15}: xpath {xpath_time * 1000:7.3f} ms, "
+                f"{compiled[0]} {compiled_time * 1000:7.3f} ms "
+                f"({xpath_time / compiled_time:4.1f}x)"
+            )
+
+    scenario()
+
+
+if __name__ == "__main__":
+    run_benchmark(*sys.argv[1:])
@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock
+
+from pyminima.engine.context import current_session
+from pyminima.logs import logger_utils
+from pyminima.settings.settings import config
+
+SESSIONS = 16
+MESSAGES_PER_SESSION = 5000
+
+
+def run_sessions(logger_name: str, log_path: str) -> float:
+    logger = logger_utils.initialize_logger(logger_name, log_to_file=log_path)
+    logger.propagate = False
+    barrier = threading.Barrier(SESSIONS + 1)
+
+    def session_worker(index: int) -> None:
+        current_session.set(MagicMock(session_id=f"session-{index}"))
+        barrier.wait()
+        for step in range(MESSAGES_PER_SESSION):
+            logger.info(f"Attempting to click: //*[@id='btn-{step}'] (Timeout: 10s)")
+
+    threads = [
+        threading.Thread(target=session_worker, args=(index,))
+        for index in range(SESSIONS)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def run_benchmark() -> None:
+    total = SESSIONS * MESSAGES_PER_SESSION
+    real_stdout = sys.stdout
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        results = {}
+        for log_async in (False, True):
+            config.log_async = log_async
+            config.log_format = "json"
+            sys.stdout = devnull
+            try:
+                elapsed = run_sessions(
+                    f"bench-async-{log_async}",
+                    os.path.join(directory, f"async-{log_async}.jsonl"),
+                )
+            finally:
+                sys.stdout = real_stdout
+            results["QueueListener" if log_async else "synchronous"] = elapsed
+        logger_utils.shutdown_async_logging()
+
+    print(f"{SESSIONS} sessions x {MESSAGES_PER_SESSION} INFO records")
+    for backend, elapsed in results.items():
+        print(
+            f"{backend:>14}: {elapsed:.3f}s on the calling threads "
+            f"({total / elapsed:,.0f} records/s)"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
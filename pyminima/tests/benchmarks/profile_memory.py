@@ -0,0 +1,76 @@
+import os
+import sys
+
+from pyminima.engine.controller import BrowserController
+from pyminima.settings.browser_profiles import BROWSER_PROFILES
+
+BENCH_PAGE = "data:text/html,<h1>minima</h1>" + "".join(
+    f"<p id='p{index}'>paragraph {index}</p>" for index in range(200)
+)
+SESSIONS = 5
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _children_by_parent() -> dict[int, list[int]]:
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat_file:
+                fields = stat_file.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+    return children
+
+
+def process_tree_rss(root_pid: int) -> int:
+    """
+    Sums the resident set size, in bytes, of a process and all of its descendants (Linux only).
+    """
+    children = _children_by_parent()
+    pending, total = [root_pid], 0
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/statm") as statm:
+                total += int(statm.read().split()[1]) * PAGE_SIZE
+        except OSError:
+            continue
+    return total
+
+
+def measure_profile(profile: str, browser_type: str) -> int:
+    sessions = []
+    try:
+        for _ in range(SESSIONS):
+            session = BrowserController(
+                browser_type, maximize=False, headless=True, profile=profile
+            )
+            session.open_url(BENCH_PAGE)
+            sessions.append(session)
+        return sum(
+            process_tree_rss(session.driver.service.process.pid) for session in sessions
+        )
+    finally:
+        for session in sessions:
+            session.close_browser()
+
+
+def run_benchmark(browser_type: str = "chrome") -> None:
+    if not os.path.isdir("/proc"):
+        raise NotImplementedError("RSS measurement relies on /proc (Linux only).")
+
+    print(f"{SESSIONS} concurrent {browser_type} sessions per profile")
+    for profile in BROWSER_PROFILES:
+        per_session = measure_profile(profile, browser_type) / SESSIONS
+        print(
+            f"{profile:>8}: {per_session / 2**20:7.1f} MiB RSS/session "
+            f"({2**30 / per_session:5.1f} sessions/GiB)"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark(*sys.argv[1:])
@@ -0,0 +1,48 @@
+import time
+
+from pyminima.engine.context import browser_session
+from pyminima.tests.fake_webdriver import FakeWebDriver
+from pyminima.ui.button import Button
+from pyminima.ui.input_field import InputField
+from pyminima.ui.ui_element import UIElement
+
+BENCH_PAGE = (
+    "data:text/html,<title>bench</title>"
+    "<form><input id='query' name='q'><button id='search'>Search</button></form>"
+    + "".join(
+        f"<p class='row' id='row-{index}'>row {index}</p>" for index in range(500)
+    )
+)
+STEPS = 300
+
+
+def run_steps() -> None:
+    for step in range(STEPS // 3):
+        InputField(id="query").enter_text(f"term {step}")
+        Button(id="search").click()
+        UIElement(id=f"row-{step}").properties()
+
+
+def run_benchmark() -> None:
+    with FakeWebDriver() as server:
+        results = {}
+
+        @browser_session(BENCH_PAGE, headless=True, remote_url=server.url)
+        def scenario():
+            commands_before = next(server.commands)
+            start = time.perf_counter()
+            run_steps()
+            results["elapsed"] = time.perf_counter() - start
+            results["commands"] = next(server.commands) - commands_before - 1
+
+        scenario()
+
+    elapsed, commands = results["elapsed"], results["commands"]
+    print(f"{STEPS} scenario steps against an in-process fake WebDriver")
+    print(f"  {STEPS / elapsed:8,.0f} steps/s ({elapsed / STEPS * 1000:.2f} ms/step)")
+    print(f"  {commands / elapsed:8,.0f} driver commands/s")
+    print(f"  {commands / STEPS:8.1f} driver commands per step")
+
+
+if __name__ == "__main__":
+    run_benchmark()
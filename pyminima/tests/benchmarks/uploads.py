@@ -0,0 +1,120 @@
+import http.server
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from selenium import webdriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from pyminima.engine.connection import configure_connection
+from pyminima.engine.uploads import upload_to_remote
+
+SIZES = {"1KB": 2**10, "1MB": 2**20, "100MB": 100 * 2**20, "1GB": 2**30}
+WRITE_CHUNK = 16 * 2**20
+
+
+class UploadSink(http.server.BaseHTTPRequestHandler):
+    """
+    Stand-in for a remote WebDriver's upload endpoint: creates a session, then reads and
+    discards upload bodies (Content-Length or chunked) and answers with a fake remote path.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _drain(self) -> None:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            while size := int(self.rfile.readline().split(b";")[0], 16):
+                while size:
+                    size -= len(self.rfile.read(min(size, 2**16)))
+                self.rfile.readline()
+            self.rfile.readline()
+            return
+        remaining = int(self.headers.get("Content-Length") or 0)
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 2**16)))
+
+    def _reply(self, value) -> None:
+        body = json.dumps({"value": value}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self._drain()
+        if self.path == "/session":
+            self._reply(
+                {"sessionId": "bench", "capabilities": {"browserName": "chrome"}}
+            )
+        else:
+            self._reply("/remote/uploads/file.bin")
+
+    def do_DELETE(self):
+        self._reply(None)
+
+    def log_message(self, *args):
+        pass
+
+
+def write_file(directory: str, size: int) -> str:
+    path = os.path.join(directory, f"upload-{size}.bin")
+    with open(path, "wb") as file:
+        while size > 0:
+            file.write(os.urandom(min(size, WRITE_CHUNK)))
+            size -= WRITE_CHUNK
+    return path
+
+
+def measure(upload, path: str) -> tuple[float, int]:
+    """Latency and peak Python heap allocation of one upload."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    upload(path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run_benchmark(*sizes: str) -> None:
+    selected = {name: SIZES[name] for name in sizes} if sizes else SIZES
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), UploadSink)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    driver = webdriver.Remote(command_executor=url, options=webdriver.ChromeOptions())
+    configure_connection(driver.command_executor)
+    element = WebElement(driver, "bench-element")
+    strategies = {
+        "selenium": element._upload,
+        "streamed": lambda path: upload_to_remote(driver, path),
+    }
+
+    print(f"File upload to a remote driver (local stand-in at {url})")
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for name, size in selected.items():
+                path = write_file(directory, size)
+                results = [
+                    f"{strategy} {elapsed * 1000:9.1f} ms {peak / 2**20:8.1f} MiB peak"
+                    for strategy, upload in strategies.items()
+                    for elapsed, peak in [measure(upload, path)]
+                ]
+                print(f"{name:>7}: " + " | ".join(results))
+                os.remove(path)
+    finally:
+        driver.quit()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    run_benchmark(*sys.argv[1:])
@@ -57,8 +57,9 @@ def test_links():
     Browser.switch_to_new_tab()
     Browser.close_current_tab()
 
-    Textlink(id="download-link", text="Download").click()
-    time.sleep(0.5)
+    with Browser.expect_download() as download:
+        Textlink(id="download-link", text="Download").click()
+    assert download.size > 0
 
     navigate_next()
 
@@ -105,7 +106,7 @@ def test_modal():
 
     close_btn = Button(id="modal-close-btn", text="Fechar")
     assert close_btn.properties().get("displayed")
-    close_btn.click()
+    close_btn.click(wait_for="stable")
 
     navigate_next()
 
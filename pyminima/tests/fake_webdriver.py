@@ -0,0 +1,633 @@
+import base64
+import http.server
+import io
+import itertools
+import json
+import os
+import re
+import socket
+import tempfile
+import threading
+import uuid
+import zipfile
+from typing import Any, Callable
+from urllib.parse import unquote, urlsplit
+
+from lxml import etree, html
+from lxml.cssselect import CSSSelector
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+WINDOW_HANDLE = "fake-window-1"
+BLANK_PAGE = "<html><head><title></title></head><body></body></html>"
+# 1x1 transparent PNG, returned by the screenshot commands.
+SCREENSHOT = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+
+
+class WebDriverError(Exception):
+    """
+    A W3C WebDriver error, answered with its HTTP status and error code.
+    """
+
+    def __init__(self, status: int, error: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.error = error
+        self.message = message
+
+
+class FakeSession:
+    """
+    State of one fake browser session: the current document (parsed with lxml), the
+    element references handed out for it, cookies and per-origin storage.
+    """
+
+    def __init__(self, server: "FakeWebDriver", capabilities: dict) -> None:
+        self.server = server
+        self.session_id = uuid.uuid4().hex
+        self.capabilities = capabilities
+        self.url = "about:blank"
+        self.document_id = uuid.uuid4().hex
+        self.timeouts = {"implicit": 0, "pageLoad": 300000, "script": 30000}
+        self.actions: list[dict] = []
+        self.events: list[tuple[str, str]] = []
+        self.cookies: list[dict] = []
+        self.storage: dict[str, dict[str, dict[str, str]]] = {}
+        self._references: dict[str, Any] = {}
+        self._ids: dict[Any, str] = {}
+        self.document = html.document_fromstring(BLANK_PAGE)
+
+    def navigate(self, url: str) -> None:
+        self.url = url
+        self.document_id = uuid.uuid4().hex
+        if url.startswith("data:text/html,"):
+            source = unquote(url[len("data:text/html,") :])
+        else:
+            source = self.server.pages.get(url, BLANK_PAGE)
+        self.document = html.document_fromstring(source or BLANK_PAGE)
+        self._references.clear()
+        self._ids.clear()
+
+    @property
+    def origin(self) -> str:
+        parts = urlsplit(self.url)
+        if parts.scheme not in ("http", "https"):
+            return "null"
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def origin_storage(self) -> dict[str, dict[str, str]]:
+        """localStorage and sessionStorage of the current document's origin."""
+        return self.storage.setdefault(
+            self.origin, {"localStorage": {}, "sessionStorage": {}}
+        )
+
+    def reference(self, element: Any) -> dict:
+        if element not in self._ids:
+            element_id = uuid.uuid4().hex
+            self._ids[element] = element_id
+            self._references[element_id] = element
+        return {ELEMENT_KEY: self._ids[element]}
+
+    def element(self, element_id: str) -> Any:
+        try:
+            return self._references[element_id]
+        except KeyError:
+            raise WebDriverError(
+                404, "stale element reference", f"Unknown element {element_id}"
+            )
+
+    def find(self, using: str, value: str, root: Any = None) -> list:
+        root = self.document if root is None else root
+        try:
+            if using == "xpath":
+                found = root.xpath(value)
+            elif using == "css selector":
+                found = CSSSelector(value, translator="html")(root)
+            elif using == "tag name":
+                found = root.iter(value)
+            elif using in ("link text", "partial link text"):
+                found = [
+                    link
+                    for link in root.iter("a")
+                    if (
+                        text_of(link) == value
+                        if using == "link text"
+                        else value in text_of(link)
+                    )
+                ]
+            else:
+                raise WebDriverError(
+                    400, "invalid argument", f"Unknown strategy {using}"
+                )
+        except (etree.XPathError, SyntaxError, ValueError) as e:
+            raise WebDriverError(400, "invalid selector", str(e))
+        return [node for node in found if isinstance(node, etree.ElementBase)]
+
+    def resolve(self, value: Any) -> Any:
+        """Replaces element references in script arguments by the elements."""
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return self.element(value[ELEMENT_KEY])
+        if isinstance(value, list):
+            return [self.resolve(item) for item in value]
+        return value
+
+    def serialize(self, value: Any) -> Any:
+        """Replaces elements in script results by element references."""
+        if isinstance(value, etree.ElementBase):
+            return self.reference(value)
+        if isinstance(value, (list, tuple)):
+            return [self.serialize(item) for item in value]
+        return value
+
+
+def text_of(element: Any) -> str:
+    """Visible text of an element, with whitespace collapsed."""
+    if not is_displayed(element):
+        return ""
+    return " ".join("".join(element.itertext()).split())
+
+
+def is_displayed(element: Any) -> bool:
+    """Approximates the WebDriver visibility check with the hidden attribute and inline styles."""
+    if element.tag == "input" and element.get("type") == "hidden":
+        return False
+    node = element
+    while node is not None:
+        style = (node.get("style") or "").replace(" ", "").lower()
+        if node.get("hidden") is not None or "display:none" in style:
+            return False
+        if "visibility:hidden" in style:
+            return False
+        node = node.getparent()
+    return True
+
+
+def get_attribute(element: Any, name: str) -> Any:
+    """Approximates Selenium's getAttribute atom (property first, then attribute)."""
+    if name == "value" and element.tag == "textarea":
+        return element.text or ""
+    if name in ("checked", "selected", "disabled", "readonly", "required", "multiple"):
+        return "true" if element.get(name) is not None else None
+    if name == "class":
+        return element.get("class")
+    if name == "value" and element.tag in ("input", "option", "button"):
+        return element.get("value", "" if element.tag == "input" else None)
+    return element.get(name)
+
+
+def _click(session: FakeSession, args: list) -> None:
+    element = args[0]
+    session.events.append(("click", element.get("id") or element.tag))
+    if element.tag == "input" and element.get("type") in ("checkbox", "radio"):
+        if element.get("checked") is None:
+            element.set("checked", "checked")
+        elif element.get("type") == "checkbox":
+            del element.attrib["checked"]
+
+
+def _click_and_mark(session: FakeSession, args: list) -> str:
+    document_id = session.document_id
+    _click(session, args)
+    return document_id
+
+
+def _set_value(session: FakeSession, args: list) -> None:
+    _write_value(args[0], str(args[1]))
+    session.events.append(("change", args[0].get("id") or args[0].tag))
+
+
+def _write_value(element: Any, value: str) -> None:
+    if element.tag == "textarea":
+        element.text = value
+    else:
+        element.set("value", value)
+
+
+def _storage_snapshot(session: FakeSession, args: list) -> dict:
+    return {"origin": session.origin, **session.origin_storage()}
+
+
+def _storage_restore(session: FakeSession, args: list) -> None:
+    for entry in args[0]:
+        if entry["origin"] == session.origin:
+            for area in ("localStorage", "sessionStorage"):
+                session.origin_storage()[area].update(entry.get(area) or {})
+
+
+# Minima's in-page helpers (see pyminima.engine.scripts), by name. The fake answers
+# helper calls as if the helper library were installed in every document.
+HELPERS: dict[str, Callable[[FakeSession, list], Any]] = {
+    "click": _click,
+    "clickAndMark": _click_and_mark,
+    "setValue": _set_value,
+    "focus": lambda session, args: None,
+    "scrollIntoView": lambda session, args: None,
+    "waitStable": lambda session, args: "stable",
+}
+
+
+def _call_helper(session: FakeSession, args: list) -> Any:
+    name, helper_args = args[0], args[1:]
+    if name == "batch":
+        return [
+            _call_helper(session, [call_name, *call_args])
+            for call_name, call_args in helper_args[0]
+        ]
+    handler = HELPERS.get(name)
+    return handler(session, helper_args) if handler else None
+
+
+# Scripts recognised by a marker substring. Handlers receive the session and the
+# resolved arguments and return a JSON-serializable result (elements allowed).
+DEFAULT_SCRIPTS: dict[str, Callable[[FakeSession, list], Any]] = {
+    "/* minima:call */": _call_helper,
+    "/* isDisplayed */": lambda session, args: is_displayed(args[0]),
+    "/* getAttribute */": lambda session, args: get_attribute(args[0], args[1]),
+    "/* minima:readiness */": lambda session, args: {
+        "ready": True,
+        "readyState": "complete",
+        "inflight": 0,
+        "id": session.document_id,
+    },
+    "/* minima:document-id */": lambda session, args: session.document_id,
+    "localStorage: dump(": _storage_snapshot,
+    "__minimaStateRestored": _storage_restore,
+    "document.readyState": lambda session, args: "complete",
+}
+
+
+class FakeWebDriver:
+    """
+    In-process fake W3C WebDriver server backed by an lxml DOM model.
+
+    It answers the commands BrowserController uses (sessions, navigation, element lookup
+    by XPath/CSS, element state, clicks, typing, actions, cookies, file uploads, screenshots), so scenarios can
+    run without a browser and measure the framework's own overhead. JavaScript is not
+    executed: scripts are matched against registered markers (see `DEFAULT_SCRIPTS` and
+    `register_script`); unknown scripts return null.
+
+    Usage:
+        with FakeWebDriver() as server:
+            controller = BrowserController("chrome", False, True, remote_url=server.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.pages: dict[str, str] = {}
+        self.scripts = dict(DEFAULT_SCRIPTS)
+        self.sessions: dict[str, FakeSession] = {}
+        self.commands = itertools.count()
+        self._server = http.server.ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._uploads = tempfile.TemporaryDirectory(prefix="fake-webdriver-")
+        self.upload_dir = self._uploads.name
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeWebDriver":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-webdriver", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._uploads.cleanup()
+
+    def __enter__(self) -> "FakeWebDriver":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def add_page(self, url: str, source: str) -> None:
+        """Serves `source` when a session navigates to `url`."""
+        self.pages[url] = source
+
+    def register_script(
+        self, marker: str, handler: Callable[[FakeSession, list], Any]
+    ) -> None:
+        """Answers scripts containing `marker` with `handler(session, arguments)`."""
+        self.scripts[marker] = handler
+
+    def dispatch(self, method: str, path: str, body: dict) -> Any:
+        next(self.commands)
+        for route_method, pattern, handler in ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.fullmatch(path)
+            if match:
+                params = match.groupdict()
+                session = None
+                if "session_id" in params:
+                    session = self.sessions.get(params.pop("session_id"))
+                    if session is None:
+                        raise WebDriverError(
+                            404, "invalid session id", "No such session"
+                        )
+                with self._lock:
+                    return handler(self, session, body, **params)
+        raise WebDriverError(404, "unknown command", f"{method} {path}")
+
+
+def _new_session(server: FakeWebDriver, _session: None, body: dict) -> dict:
+    requested = body.get("capabilities", {}).get("alwaysMatch", {})
+    capabilities = {
+        "browserName": requested.get("browserName", "chrome"),
+        "browserVersion": "fake",
+        "platformName": "any",
+        "setWindowRect": True,
+        "timeouts": {"implicit": 0, "pageLoad": 300000, "script": 30000},
+    }
+    session = FakeSession(server, capabilities)
+    server.sessions[session.session_id] = session
+    return {"sessionId": session.session_id, "capabilities": capabilities}
+
+
+def _delete_session(server: FakeWebDriver, session: FakeSession, _body: dict) -> None:
+    server.sessions.pop(session.session_id, None)
+
+
+def _navigate(server: FakeWebDriver, session: FakeSession, body: dict) -> None:
+    session.navigate(body["url"])
+
+
+def _find(
+    server, session: FakeSession, body: dict, element_id: str | None = None
+) -> dict:
+    root = session.element(element_id) if element_id else None
+    found = session.find(body["using"], body["value"], root)
+    if not found:
+        raise WebDriverError(
+            404, "no such element", f"Unable to locate {body['using']}={body['value']}"
+        )
+    return session.reference(found[0])
+
+
+def _find_all(
+    server, session: FakeSession, body: dict, element_id: str | None = None
+) -> list:
+    root = session.element(element_id) if element_id else None
+    return [
+        session.reference(node)
+        for node in session.find(body["using"], body["value"], root)
+    ]
+
+
+def _execute(server: FakeWebDriver, session: FakeSession, body: dict) -> Any:
+    script = body.get("script", "")
+    for marker, handler in server.scripts.items():
+        if marker in script:
+            return session.serialize(
+                handler(session, session.resolve(body.get("args", [])))
+            )
+    return None
+
+
+def _element_value(server, session: FakeSession, body: dict, element_id: str) -> None:
+    element = session.element(element_id)
+    current = get_attribute(element, "value") or ""
+    _write_value(element, current + body.get("text", ""))
+
+
+def _element_clear(server, session: FakeSession, body: dict, element_id: str) -> None:
+    _write_value(session.element(element_id), "")
+
+
+def _element_click(server, session: FakeSession, body: dict, element_id: str) -> None:
+    element = session.element(element_id)
+    if not is_displayed(element):
+        raise WebDriverError(400, "element not interactable", "Element is not visible")
+    _click(session, [element])
+
+
+def _element_rect(server, session: FakeSession, body: dict, element_id: str) -> dict:
+    index = list(session.document.iter()).index(session.element(element_id))
+    return {"x": 0, "y": index * 20, "width": 100, "height": 20}
+
+
+def _element_selected(
+    server, session: FakeSession, body: dict, element_id: str
+) -> bool:
+    element = session.element(element_id)
+    return element.get("checked") is not None or element.get("selected") is not None
+
+
+def _actions(server, session: FakeSession, body: dict) -> None:
+    session.actions.extend(body.get("actions", []))
+
+
+def _set_timeouts(server, session: FakeSession, body: dict) -> None:
+    session.timeouts.update(body)
+
+
+def _page_source(server, session: FakeSession, body: dict) -> str:
+    return html.tostring(session.document, encoding="unicode")
+
+
+def _title(server, session: FakeSession, body: dict) -> str:
+    return session.document.findtext(".//title") or ""
+
+
+def _add_cookie(server, session: FakeSession, body: dict) -> None:
+    cookie = {"path": "/", "domain": urlsplit(session.url).hostname, **body["cookie"]}
+    session.cookies = [
+        existing
+        for existing in session.cookies
+        if (existing["name"], existing["domain"]) != (cookie["name"], cookie["domain"])
+    ]
+    session.cookies.append(cookie)
+
+
+def _get_cookies(server, session: FakeSession, body: dict) -> list[dict]:
+    host = urlsplit(session.url).hostname or ""
+    return [
+        cookie
+        for cookie in session.cookies
+        if host == cookie["domain"].lstrip(".")
+        or host.endswith("." + cookie["domain"].lstrip("."))
+    ]
+
+
+def _upload_file(server: FakeWebDriver, session: FakeSession, body: dict) -> str:
+    """Unpacks a zipped, base64-encoded upload (Selenium Grid's `se/file`) and returns its path."""
+    directory = tempfile.mkdtemp(dir=server.upload_dir)
+    with zipfile.ZipFile(io.BytesIO(base64.b64decode(body["file"]))) as archive:
+        (name,) = archive.namelist()
+        archive.extract(name, directory)
+    return os.path.join(directory, name)
+
+
+def _route(method: str, path: str, handler: Callable) -> tuple:
+    pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path)
+    return method, re.compile(pattern), handler
+
+
+_SESSION = "/session/{session_id}"
+_ELEMENT = _SESSION + "/element/{element_id}"
+
+ROUTES = [
+    _route("POST", "/session", _new_session),
+    _route(
+        "GET",
+        "/status",
+        lambda server, session, body: {"ready": True, "message": "fake"},
+    ),
+    _route("DELETE", _SESSION, _delete_session),
+    _route("POST", _SESSION + "/url", _navigate),
+    _route("GET", _SESSION + "/url", lambda server, session, body: session.url),
+    _route("GET", _SESSION + "/title", _title),
+    _route(
+        "POST",
+        _SESSION + "/refresh",
+        lambda server, session, body: session.navigate(session.url),
+    ),
+    _route("POST", _SESSION + "/timeouts", _set_timeouts),
+    _route(
+        "GET", _SESSION + "/timeouts", lambda server, session, body: session.timeouts
+    ),
+    _route("GET", _SESSION + "/window", lambda server, session, body: WINDOW_HANDLE),
+    _route(
+        "GET",
+        _SESSION + "/window/handles",
+        lambda server, session, body: [WINDOW_HANDLE],
+    ),
+    _route("POST", _SESSION + "/window", lambda server, session, body: None),
+    _route(
+        "POST",
+        _SESSION + "/window/maximize",
+        lambda server, session, body: {"x": 0, "y": 0, "width": 1920, "height": 1080},
+    ),
+    _route(
+        "GET",
+        _SESSION + "/window/rect",
+        lambda server, session, body: {"x": 0, "y": 0, "width": 1920, "height": 1080},
+    ),
+    _route("POST", _SESSION + "/element", _find),
+    _route("POST", _SESSION + "/elements", _find_all),
+    _route("POST", _ELEMENT + "/element", _find),
+    _route("POST", _ELEMENT + "/elements", _find_all),
+    _route(
+        "GET",
+        _ELEMENT + "/text",
+        lambda server, session, body, element_id: text_of(session.element(element_id)),
+    ),
+    _route(
+        "GET",
+        _ELEMENT + "/name",
+        lambda server, session, body, element_id: session.element(element_id).tag,
+    ),
+    _route(
+        "GET",
+        _ELEMENT + "/attribute/{name}",
+        lambda server, session, body, element_id, name: session.element(element_id).get(
+            name
+        ),
+    ),
+    _route(
+        "GET",
+        _ELEMENT + "/property/{name}",
+        lambda server, session, body, element_id, name: get_attribute(
+            session.element(element_id), name
+        ),
+    ),
+    _route(
+        "GET",
+        _ELEMENT + "/css/{name}",
+        lambda server, session, body, element_id, name: "",
+    ),
+    _route("GET", _ELEMENT + "/rect", _element_rect),
+    _route(
+        "GET",
+        _ELEMENT + "/enabled",
+        lambda server, session, body, element_id: session.element(element_id).get(
+            "disabled"
+        )
+        is None,
+    ),
+    _route("GET", _ELEMENT + "/selected", _element_selected),
+    _route(
+        "GET",
+        _ELEMENT + "/displayed",
+        lambda server, session, body, element_id: is_displayed(
+            session.element(element_id)
+        ),
+    ),
+    _route("POST", _ELEMENT + "/click", _element_click),
+    _route("POST", _ELEMENT + "/clear", _element_clear),
+    _route("POST", _ELEMENT + "/value", _element_value),
+    _route(
+        "GET",
+        _ELEMENT + "/screenshot",
+        lambda server, session, body, element_id: SCREENSHOT,
+    ),
+    _route("POST", _SESSION + "/execute/sync", _execute),
+    _route("POST", _SESSION + "/execute/async", _execute),
+    _route("GET", _SESSION + "/cookie", _get_cookies),
+    _route("POST", _SESSION + "/cookie", _add_cookie),
+    _route(
+        "DELETE",
+        _SESSION + "/cookie",
+        lambda server, session, body: session.cookies.clear(),
+    ),
+    _route("POST", _SESSION + "/se/file", _upload_file),
+    _route("POST", _SESSION + "/actions", _actions),
+    _route("DELETE", _SESSION + "/actions", lambda server, session, body: None),
+    _route("GET", _SESSION + "/screenshot", lambda server, session, body: SCREENSHOT),
+    _route("GET", _SESSION + "/source", _page_source),
+]
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _handle(self, method: str) -> None:
+        raw = self._read_body()
+        try:
+            body = json.loads(raw) if raw else {}
+            status, value = 200, self.server.fake.dispatch(method, self.path, body)
+        except WebDriverError as e:
+            status = e.status
+            value = {"error": e.error, "message": e.message, "stacktrace": ""}
+        except Exception as e:
+            status = 500
+            value = {"error": "unknown error", "message": str(e), "stacktrace": ""}
+        payload = json.dumps({"value": value}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while size := int(self.rfile.readline().split(b";")[0], 16):
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            self.rfile.readline()
+            return b"".join(chunks)
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+    def log_message(self, *args) -> None:
+        pass
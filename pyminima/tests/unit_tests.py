@@ -1,6 +1,81 @@
+import asyncio
+import base64
+import hashlib
+import http.server
+import io
+import itertools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
 import unittest
+import unittest.mock
 from unittest.mock import MagicMock
 
+from PIL import Image as PILImage
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    InvalidSelectorException,
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webelement import WebElement
+
+from pyminima.engine.artifacts import ArtifactWriter
+from pyminima.engine.cache import ResponseStore
+from pyminima.engine.cdp import CDPSession
+from pyminima.engine.connection import configure_connection
+from pyminima.engine.context import browser_session, current_session
+from pyminima.engine.controller import DEFAULT_SCRIPT_TIMEOUT, BrowserController
+from pyminima.engine.deadline import (
+    Deadline,
+    DeadlineHTTPConnectionPool,
+    current_deadline,
+    install_deadline_pools,
+)
+from pyminima.engine.health import DRIVER_CRASHES, DRIVER_RECOVERIES, probe_driver
+from pyminima.engine.locators import compile_locator
+from pyminima.engine.metrics import (
+    ACTION_DURATION,
+    Histogram,
+    MetricsRegistry,
+    registry,
+)
+from pyminima.engine.network import NetworkInterceptor
+from pyminima.engine.readiness import DOCUMENT_ID_SCRIPT
+from pyminima.engine.retry import ACTION_RETRIES, RetryPolicy
+from pyminima.engine.scripts import CALL_SCRIPT, LIBRARY_SCRIPT, MISSING, ScriptRegistry
+from pyminima.engine.storage_state import StateCache
+from pyminima.input.keyboard import KeyboardController, KeySequence
+from pyminima.input.mouse import Gesture, Mouse
+from pyminima.logs import logger_utils
+from pyminima.settings.exceptions import (
+    BrowserWaitForPageLoadException,
+    CommandCancelledException,
+    CommandTimeoutException,
+    DownloadTimeoutException,
+    ElementNotStableException,
+    WidgetClickException,
+    WidgetDoubleClickException,
+    WidgetDragException,
+    WidgetEnterTextException,
+)
+from pyminima.settings.settings import config
+from pyminima.tests.fake_webdriver import FakeWebDriver
+from pyminima.ui.browser import Browser
+from pyminima.ui.button import Button
+from pyminima.ui.file_manager import FileManager
+from pyminima.ui.input_field import InputField
+from pyminima.ui.table import Table
 from pyminima.ui.ui_element import UIElement
 
 
@@ -27,3 +102,1257 @@ class TestWidgetXPath(unittest.TestCase):
             expected_xpath,
             "XPath generation failed for multiple attributes.",
         )
+
+
+class TestKeySequence(unittest.TestCase):
+    def setUp(self):
+        self.driver = MagicMock()
+
+    def test_sequence_is_performed_in_one_command(self):
+        keyboard = KeyboardController(self.driver)
+        keyboard.type_sequence(
+            KeySequence().chord("ctrl", "a").type("abc").press("arrow_down", times=50)
+        )
+        self.assertEqual(self.driver.execute.call_count, 1)
+
+    def test_chord_holds_modifier_around_key(self):
+        KeySequence().chord("ctrl", "a").compile(self.driver).perform()
+        payload = self.driver.execute.call_args[0][1]
+        key_actions = [
+            device for device in payload["actions"] if device["type"] == "key"
+        ][0]["actions"]
+        self.assertEqual(
+            [(action["type"], action["value"]) for action in key_actions],
+            [
+                ("keyDown", Keys.CONTROL),
+                ("keyDown", "a"),
+                ("keyUp", "a"),
+                ("keyUp", Keys.CONTROL),
+            ],
+        )
+
+    def test_unknown_key_name(self):
+        with self.assertRaises(ValueError):
+            KeySequence().press("not_a_key")
+
+
+class TestGesture(unittest.TestCase):
+    def setUp(self):
+        self.driver = MagicMock()
+
+    def test_draw_is_performed_in_one_command(self):
+        canvas = MagicMock(spec=WebElement)
+        points = [(x, x // 2) for x in range(300)]
+        Mouse(self.driver).draw(canvas, points)
+        self.assertEqual(self.driver.execute.call_count, 1)
+        payload = self.driver.execute.call_args[0][1]
+        pointer_actions = [
+            device for device in payload["actions"] if device["type"] == "pointer"
+        ][0]["actions"]
+        moves = [
+            action for action in pointer_actions if action["type"] == "pointerMove"
+        ]
+        self.assertEqual(len(moves), len(points))
+        self.assertEqual(pointer_actions[-1]["type"], "pointerUp")
+
+    def test_multi_select_wraps_clicks_with_modifier(self):
+        Mouse(self.driver).multi_select(
+            [MagicMock(spec=WebElement), MagicMock(spec=WebElement)], "shift"
+        )
+        self.assertEqual(self.driver.execute.call_count, 1)
+
+    def test_empty_gesture_sends_nothing(self):
+        Mouse(self.driver).perform(Gesture())
+        self.driver.execute.assert_not_called()
+
+
+class TestNetworkInterceptor(unittest.TestCase):
+    def setUp(self):
+        self.interceptor = NetworkInterceptor(MagicMock())
+        self.interceptor._cdp = MagicMock()
+        self.interceptor._cdp.send.return_value = {}
+
+    def pause(self, url, method="GET", **extra):
+        event = {"requestId": "r1", "request": {"url": url, "method": method}}
+        event.update(extra)
+        self.interceptor._on_request_paused(event)
+        return self.interceptor._cdp.send.call_args[0]
+
+    def test_route_fulfills_matching_request(self):
+        self.interceptor.route("*/api/users*", body='{"users": []}')
+        method, params = self.pause("https://app.test/api/users?page=1")
+        self.assertEqual(method, "Fetch.fulfillRequest")
+        self.assertEqual(base64.b64decode(params["body"]), b'{"users": []}')
+
+    def test_unmatched_request_continues_or_fails_offline(self):
+        method, _ = self.pause("https://app.test/index.html")
+        self.assertEqual(method, "Fetch.continueRequest")
+        self.interceptor.offline = True
+        method, _ = self.pause("https://app.test/index.html")
+        self.assertEqual(method, "Fetch.failRequest")
+
+    def test_fixture_directory_is_served(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "app.js"), "w") as fixture:
+                fixture.write("console.log(1);")
+            self.interceptor.serve_fixtures(directory, "https://app.test/static/")
+            method, params = self.pause("https://app.test/static/app.js?v=3")
+        self.assertEqual(method, "Fetch.fulfillRequest")
+        self.assertEqual(params["responseHeaders"][0]["name"], "Content-Type")
+        self.assertTrue(params["responseHeaders"][0]["value"].endswith("javascript"))
+
+    def test_fixture_lookup_stays_inside_directory(self):
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, "fix"))
+            os.makedirs(os.path.join(root, "fix-secret"))
+            with open(os.path.join(root, "fix-secret", "x"), "w") as secret:
+                secret.write("secret")
+            self.interceptor.serve_fixtures(
+                os.path.join(root, "fix"), "https://app.test/static/"
+            )
+            method, _ = self.pause("https://app.test/static/../fix-secret/x")
+        self.assertEqual(method, "Fetch.continueRequest")
+
+    def test_timed_out_command_is_forgotten(self):
+        session = CDPSession.__new__(CDPSession)
+        session._ws = MagicMock()
+        session._ids = itertools.count(1)
+        session._send_lock = threading.Lock()
+        session._pending = {}
+        with self.assertRaises(TimeoutError):
+            session.send("Fetch.enable", timeout=0.01)
+        self.assertEqual(session._pending, {})
+
+    def test_cached_responses_drop_wire_headers(self):
+        store = MagicMock()
+        self.interceptor.use_cache(store, "record")
+        self.interceptor._cdp.send.return_value = {"body": "hi", "base64Encoded": False}
+        self.pause(
+            "https://app.test/app.js",
+            responseStatusCode=200,
+            responseHeaders=[
+                {"name": "Content-Encoding", "value": "br"},
+                {"name": "Content-Type", "value": "text/javascript"},
+            ],
+        )
+        store.put.assert_called_once_with(
+            "GET",
+            "https://app.test/app.js",
+            200,
+            [{"name": "Content-Type", "value": "text/javascript"}],
+            b"hi",
+        )
+
+    def test_recorded_har_can_be_replayed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            har_path = os.path.join(directory, "session.har")
+            self.interceptor.record_har(har_path)
+            self.interceptor._cdp.send.return_value = {
+                "body": base64.b64encode(b"<h1>hi</h1>").decode(),
+                "base64Encoded": True,
+            }
+            method, _ = self.pause(
+                "https://app.test/",
+                responseStatusCode=200,
+                responseHeaders=[
+                    {"name": "Content-Type", "value": "text/html"},
+                    {"name": "Content-Encoding", "value": "gzip"},
+                    {"name": "Content-Length", "value": "31"},
+                    {"name": "Set-Cookie", "value": "a=1"},
+                    {"name": "Set-Cookie", "value": "b=2"},
+                ],
+            )
+            self.assertEqual(method, "Fetch.continueRequest")
+            self.interceptor._write_har()
+
+            replay = NetworkInterceptor(MagicMock())
+            replay._cdp = MagicMock()
+            replay.replay_har(har_path, offline=True)
+            replay._on_request_paused(
+                {
+                    "requestId": "r2",
+                    "request": {"url": "https://app.test/", "method": "GET"},
+                }
+            )
+        method, params = replay._cdp.send.call_args[0]
+        self.assertEqual(method, "Fetch.fulfillRequest")
+        self.assertEqual(base64.b64decode(params["body"]), b"<h1>hi</h1>")
+        self.assertEqual(
+            params["responseHeaders"],
+            [
+                {"name": "Content-Type", "value": "text/html"},
+                {"name": "Set-Cookie", "value": "a=1"},
+                {"name": "Set-Cookie", "value": "b=2"},
+            ],
+        )
+
+
+class TestResponseStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_identical_bodies_are_stored_once(self):
+        store = ResponseStore(self.directory.name, max_bytes=1024)
+        store.put("GET", "https://a.test/app.js", 200, {}, b"x" * 100)
+        store.put("GET", "https://b.test/app.js", 200, {}, b"x" * 100)
+        self.assertEqual(store.total_bytes, 100)
+
+    def test_replay_in_new_store_counts_hits(self):
+        headers = [{"name": "Content-Type", "value": "text/html"}]
+        store = ResponseStore(self.directory.name, max_bytes=1024)
+        store.put("GET", "https://a.test/", 200, headers, b"ok")
+
+        reopened = ResponseStore(self.directory.name, max_bytes=1024)
+        self.assertEqual(reopened.get("GET", "https://a.test/"), (200, headers, b"ok"))
+        self.assertIsNone(reopened.get("GET", "https://a.test/missing"))
+        self.assertEqual(reopened.hit_ratio, 0.5)
+        self.assertEqual(reopened.stats["bytes_saved"], 2)
+
+    def test_parallel_stores_keep_each_others_entries(self):
+        first = ResponseStore(self.directory.name, max_bytes=1024)
+        second = ResponseStore(self.directory.name, max_bytes=1024)
+        first.put("GET", "https://a.test/1", 200, [], b"1")
+        second.put("GET", "https://a.test/2", 200, [], b"2")
+        first.flush()
+        second.flush()
+        self.assertEqual(first.get("GET", "https://a.test/2"), (200, [], b"2"))
+
+        reopened = ResponseStore(self.directory.name, max_bytes=1024)
+        self.assertIsNotNone(reopened.get("GET", "https://a.test/1"))
+        self.assertIsNotNone(reopened.get("GET", "https://a.test/2"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        store = ResponseStore(self.directory.name, max_bytes=250)
+        store.put("GET", "https://a.test/1", 200, {}, b"1" * 100)
+        store.put("GET", "https://a.test/2", 200, {}, b"2" * 100)
+        store.get("GET", "https://a.test/1")
+        store.put("GET", "https://a.test/3", 200, {}, b"3" * 100)
+        self.assertIsNone(store.get("GET", "https://a.test/2"))
+        self.assertIsNotNone(store.get("GET", "https://a.test/1"))
+        self.assertEqual(store.stats["evicted"], 1)
+
+
+class TestArtifactWriter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_artifacts_are_written_in_background(self):
+        writer = ArtifactWriter(self.directory.name, image_format="webp")
+        png = io.BytesIO()
+        PILImage.new("RGB", (8, 8), "red").save(png, format="PNG")
+        writer.submit_screenshot("Button.click", base64.b64encode(png.getvalue()))
+        writer.submit_text("failure page", "<html></html>")
+        writer.close()
+        self.assertEqual(
+            sorted(os.listdir(self.directory.name)),
+            ["0001-Button.click.webp", "0002-failure-page.html"],
+        )
+        self.assertEqual(writer.stats["written"], 2)
+
+    def test_full_queue_applies_drop_policy(self):
+        for policy, kept in [("drop_newest", "first"), ("drop_oldest", "second")]:
+            writer = ArtifactWriter(
+                self.directory.name, max_queue=1, drop_policy=policy
+            )
+            writer._ensure_thread = lambda: None
+            writer.submit_text("first", "1")
+            writer.submit_text("second", "2")
+            self.assertEqual(writer.stats["dropped"], 1)
+            self.assertEqual(
+                writer._queue.get_nowait()[2], "1" if kept == "first" else "2"
+            )
+
+
+class TestAsyncLogging(unittest.TestCase):
+    def test_json_lines_carry_session_id(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "minima.jsonl")
+            with unittest.mock.patch.multiple(
+                logger_utils.config, log_async=True, log_format="json"
+            ):
+                logger = logging.getLogger("TestAsyncLogging")
+                logger.setLevel(logging.INFO)
+                logger.addHandler(logger_utils._get_queue_handler(log_path))
+                token = current_session.set(MagicMock(session_id="abc123"))
+                try:
+                    logger.info("clicked")
+                finally:
+                    current_session.reset(token)
+                _, listener = logger_utils._listeners.pop(log_path)
+                listener.stop()
+                for handler in listener.handlers:
+                    handler.close()
+
+            with open(log_path, encoding="utf-8") as log_file:
+                entry = json.loads(log_file.readline())
+        self.assertEqual(entry["message"], "clicked")
+        self.assertEqual(entry["session_id"], "abc123")
+        self.assertEqual(entry["logger"], "TestAsyncLogging")
+
+    def test_json_lines_keep_exception_apart(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "minima.jsonl")
+            with unittest.mock.patch.multiple(
+                logger_utils.config, log_async=True, log_format="json"
+            ):
+                logger = logging.getLogger("TestAsyncLoggingErrors")
+                logger.setLevel(logging.INFO)
+                handler = logger_utils._get_queue_handler(log_path)
+                logger.addHandler(handler)
+                try:
+                    raise ValueError("boom")
+                except ValueError:
+                    logger.error("click failed", exc_info=True)
+                logger.removeHandler(handler)
+                _, listener = logger_utils._listeners.pop(log_path)
+                listener.stop()
+                for listener_handler in listener.handlers:
+                    listener_handler.close()
+
+            with open(log_path, encoding="utf-8") as log_file:
+                entry = json.loads(log_file.readline())
+        self.assertEqual(entry["message"], "click failed")
+        self.assertIn("ValueError: boom", entry["exception"])
+
+
+class TestMetrics(unittest.TestCase):
+    def test_histogram_percentiles_within_one_percent(self):
+        histogram = Histogram()
+        for value in range(1, 100_001):
+            histogram.record(value * 10)
+        for percentile in (50, 99, 99.9):
+            expected = percentile / 100 * 1_000_000
+            self.assertAlmostEqual(
+                histogram.percentile(percentile), expected, delta=expected * 0.01
+            )
+
+    def test_prometheus_export(self):
+        metrics = MetricsRegistry()
+        metrics.observe(ACTION_DURATION, 0.25, action="click", element="Button")
+        metrics.increment("minima_retries_total", action="click")
+        text = metrics.to_prometheus()
+        self.assertIn(f"# TYPE {ACTION_DURATION} summary", text)
+        self.assertIn(
+            f'{ACTION_DURATION}_count{{action="click",element="Button"}} 1', text
+        )
+        self.assertIn('minima_retries_total{action="click"} 1', text)
+
+    def test_element_actions_are_timed(self):
+        registry.reset()
+        controller = MagicMock()
+        Button(controller, id="submit").click()
+        Button(controller, id="submit").properties()
+        self.assertEqual(
+            registry.histogram(ACTION_DURATION, action="click", element="Button").count,
+            1,
+        )
+        self.assertIsNotNone(
+            registry.histogram(ACTION_DURATION, action="properties", element="Button")
+        )
+
+
+def make_controller(browser_type="chrome"):
+    controller = BrowserController.__new__(BrowserController)
+    controller.logger = MagicMock()
+    controller.browser_type = browser_type
+    controller.driver = MagicMock()
+    controller._script_timeout = DEFAULT_SCRIPT_TIMEOUT
+    controller.last_url = None
+    controller.visited_origins = {}
+    controller._restored_state = None
+    controller.supports_cdp = browser_type == "chrome"
+    controller.parent = None
+    controller.download_dir = None
+    controller.page_load_strategy = "normal"
+    controller._network = None
+    controller.scripts = ScriptRegistry(controller.driver, False)
+    controller.browser_context_id = None
+    controller.recoveries = 0
+    controller._active_deadlines = set()
+    controller._deadlines_lock = threading.Lock()
+    controller.session_id = "0123456789"
+    return controller
+
+
+class TestResolveAll(unittest.TestCase):
+    def test_locators_are_resolved_in_one_script_call(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.return_value = [
+            {"element": "el-1", "status": "ready"},
+            {"element": None, "status": "missing"},
+        ]
+        results = Browser.resolve_all(
+            [Button(controller, id="a"), Button(controller, id="b")],
+            timeout=2,
+            session=controller,
+        )
+        controller.driver.execute_async_script.assert_called_once()
+        controller.driver.set_script_timeout.assert_not_called()
+        self.assertEqual(
+            results,
+            [
+                {"xpath": "//*[@id='a']", "element": "el-1", "status": "ready"},
+                {"xpath": "//*[@id='b']", "element": None, "status": "missing"},
+            ],
+        )
+
+    def test_long_timeouts_raise_script_timeout_once(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.return_value = []
+        controller.resolve_all([], timeout=60)
+        controller.resolve_all([], timeout=60)
+        controller.driver.set_script_timeout.assert_called_once_with(65)
+
+
+class TestWatch(unittest.TestCase):
+    def test_changes_are_streamed_until_stopped(self):
+        controller = MagicMock()
+        controller.start_watch.return_value = "w1"
+        controller.poll_watch.side_effect = [
+            [],
+            [{"type": "text", "value": "está sobre"}, {"type": "text", "value": "x"}],
+        ]
+        changes = []
+        for change in UIElement(controller, id="hover-status").watch(text=True):
+            changes.append(change["value"])
+            if "está sobre" in change["value"]:
+                break
+        self.assertEqual(changes, ["está sobre"])
+        controller.start_watch.assert_called_once_with(
+            "//*[@id='hover-status']", None, True
+        )
+        controller.stop_watch.assert_called_once_with("w1")
+
+    def test_watch_ends_when_page_navigates(self):
+        controller = MagicMock()
+        controller.poll_watch.return_value = None
+        self.assertEqual(list(UIElement(controller, id="x").watch()), [])
+        self.assertEqual(controller.start_watch.call_args[0][1], [])
+
+
+class TestTable(unittest.TestCase):
+    def test_chunks_are_read_until_total(self):
+        controller = make_controller()
+        controller.wait_for_element = MagicMock()
+        controller.driver.execute_script.side_effect = [
+            {"headers": ["id"], "total": 3, "rows": [["1"], ["2"]]},
+            {"headers": ["id"], "total": 3, "rows": [["3"]]},
+        ]
+        headers, rows = controller.read_table("//table", chunk_rows=2)
+        self.assertEqual(headers, ["id"])
+        self.assertEqual(rows, [["1"], ["2"], ["3"]])
+        self.assertEqual(controller.driver.execute_script.call_count, 2)
+
+    def test_virtualized_rows_are_deduplicated_by_key(self):
+        controller = make_controller()
+        controller.wait_for_element = MagicMock()
+        controller.driver.execute_async_script.side_effect = [
+            {
+                "headers": ["n"],
+                "rows": [{"key": "2", "cells": ["b"]}, {"key": "1", "cells": ["a"]}],
+                "atEnd": False,
+            },
+            {
+                "headers": ["n"],
+                "rows": [{"key": "2", "cells": ["b"]}, {"key": "3", "cells": ["c"]}],
+                "atEnd": True,
+            },
+        ]
+        _, rows = controller.read_virtualized_table("//*[@role='grid']")
+        self.assertEqual(rows, [["a"], ["b"], ["c"]])
+
+    def test_dataframe_columns_are_typed(self):
+        controller = MagicMock()
+        controller.read_table.return_value = (
+            ["id", "price", "name"],
+            [["1", "1.234,50", "Ana"], ["2", "", "Bia"]],
+        )
+        frame = Table(controller, id="orders").to_dataframe(decimal=",", thousands=".")
+        self.assertEqual(str(frame["id"].dtype), "Int64")
+        self.assertEqual(frame["price"][0], 1234.5)
+        self.assertTrue(frame["price"].isna()[1])
+        self.assertEqual(str(frame["name"].dtype), "string")
+
+    def test_blank_and_repeated_headers_get_unique_names(self):
+        controller = MagicMock()
+        controller.read_table.return_value = (
+            ["Name", "", "", "Name"],
+            [["Ana", "Edit", "1", "A."], ["Bia", "Edit", "2", "B.", "extra"]],
+        )
+        frame = Table(controller, id="orders").to_dataframe()
+        self.assertEqual(
+            list(frame.columns),
+            ["Name", "column_1", "column_2", "Name_1", "column_4"],
+        )
+        self.assertEqual(str(frame["column_2"].dtype), "Int64")
+
+
+class TestBrowserProfiles(unittest.TestCase):
+    @unittest.mock.patch("pyminima.engine.controller.ChromeService")
+    @unittest.mock.patch("pyminima.engine.controller.webdriver.Chrome")
+    def test_dense_profile_applies_chrome_arguments(self, chrome, _service):
+        chrome.return_value.session_id = "0123456789"
+        controller = BrowserController("chrome", False, False, profile="dense")
+        arguments = chrome.call_args.kwargs["options"].arguments
+        self.assertFalse(os.path.exists(controller.download_dir))
+        self.assertTrue(controller.headless)
+        self.assertIn("--headless", arguments)
+        self.assertIn("--disable-dev-shm-usage", arguments)
+        self.assertIn("--renderer-process-limit=2", arguments)
+
+    def test_unknown_profile_is_rejected(self):
+        with self.assertRaises(ValueError):
+            BrowserController("chrome", False, False, profile="tiny")
+
+
+class TestDriverHealth(unittest.TestCase):
+    def test_probe_fails_when_driver_process_exited(self):
+        driver = MagicMock()
+        driver.service.process.poll.return_value = 1
+        self.assertFalse(probe_driver(driver, timeout=1))
+
+    def test_probe_fails_on_hung_page(self):
+        driver = MagicMock()
+        driver.service.process.poll.return_value = None
+        driver.execute_script.side_effect = lambda script: time.sleep(1)
+        start = time.perf_counter()
+        self.assertFalse(probe_driver(driver, timeout=0.05))
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_crashed_browser_is_restarted_at_last_url(self):
+        registry.reset()
+        controller = make_controller()
+        controller.last_url = "https://example.com/cart"
+        new_driver = MagicMock()
+        controller._initialize_driver = MagicMock(return_value=new_driver)
+        with unittest.mock.patch.object(config, "auto_recover", True):
+            recovered = controller.recover_from(
+                WebDriverException("chrome not reachable")
+            )
+        self.assertTrue(recovered)
+        self.assertIs(controller.driver, new_driver)
+        new_driver.get.assert_called_once_with("https://example.com/cart")
+        self.assertEqual(registry.counter(DRIVER_CRASHES, browser="chrome"), 1)
+        self.assertEqual(registry.counter(DRIVER_RECOVERIES, browser="chrome"), 1)
+
+    def test_failure_on_healthy_browser_is_not_recovered(self):
+        controller = make_controller()
+        controller.driver.service.process.poll.return_value = None
+        controller._initialize_driver = MagicMock()
+        with unittest.mock.patch.object(config, "auto_recover", True):
+            self.assertFalse(
+                controller.recover_from(WebDriverException("no such element"))
+            )
+        controller._initialize_driver.assert_not_called()
+
+    def test_routine_errors_do_not_probe_the_driver(self):
+        controller = make_controller()
+        controller.driver.service.process.poll.return_value = None
+        controller.is_healthy = MagicMock(return_value=True)
+        for error in (
+            StaleElementReferenceException("stale element reference"),
+            TimeoutException("wait timed out"),
+        ):
+            self.assertFalse(controller.recover_from(error))
+        controller.is_healthy.assert_not_called()
+        self.assertFalse(controller.recover_from(CommandTimeoutException(5)))
+        controller.is_healthy.assert_called_once()
+
+    def test_recovery_stops_request_interception(self):
+        controller = make_controller()
+        network = controller._network = MagicMock()
+        controller._initialize_driver = MagicMock(return_value=MagicMock())
+        controller.recover()
+        network.stop.assert_called_once()
+        self.assertIsNone(controller._network)
+
+    def test_action_is_retried_after_recovery(self):
+        controller = MagicMock()
+        controller.click_element.side_effect = [WebDriverException("tab crashed"), None]
+        controller.recover_from.return_value = True
+        Button(controller, id="submit").click()
+        self.assertEqual(controller.click_element.call_count, 2)
+
+
+class _HangingDriverHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(3)
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b'{"value": "late"}')
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        registry.reset()
+        patcher = unittest.mock.patch.object(config, "retry_backoff", 0.001)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.controller = make_controller()
+        self.controller.click_element = MagicMock()
+
+    def test_transient_error_is_retried_and_counted(self):
+        self.controller.click_element.side_effect = [
+            StaleElementReferenceException("stale element reference"),
+            None,
+        ]
+        button = Button(self.controller, id="submit")
+        button.click()
+        self.assertEqual(self.controller.click_element.call_count, 2)
+        self.controller.click_element.assert_called_with(
+            button.xpath, 10, None, wait_for=None
+        )
+        self.assertEqual(
+            registry.counter(
+                ACTION_RETRIES,
+                action="click",
+                element="Button",
+                error="StaleElementReferenceException",
+            ),
+            1,
+        )
+
+    def test_fatal_error_is_wrapped_without_retry(self):
+        error = InvalidSelectorException("invalid selector")
+        self.controller.click_element.side_effect = error
+        with self.assertRaises(WidgetClickException) as raised:
+            Button(self.controller, id="submit").click()
+        self.assertIs(raised.exception.original_exception, error)
+        self.assertEqual(self.controller.click_element.call_count, 1)
+
+    def test_retries_are_bounded(self):
+        self.controller.click_element.side_effect = ElementClickInterceptedException(
+            "element click intercepted"
+        )
+        with unittest.mock.patch.object(config, "max_retries", 2):
+            with self.assertRaises(WidgetClickException):
+                Button(self.controller, id="submit").click()
+        self.assertEqual(self.controller.click_element.call_count, 3)
+
+    def test_double_click_is_not_replayed_after_first_click(self):
+        self.controller.click_element.side_effect = [
+            None,
+            StaleElementReferenceException("stale element reference"),
+        ]
+        with self.assertRaises(WidgetDoubleClickException):
+            Button(self.controller, id="submit").double_click(delay=0)
+        self.assertEqual(self.controller.click_element.call_count, 2)
+
+    def test_double_click_is_one_action(self):
+        self.controller.after_action = MagicMock()
+        Button(self.controller, id="submit").double_click(delay=0)
+        self.assertEqual(self.controller.click_element.call_count, 2)
+        self.controller.after_action.assert_called_once_with("Button.double_click")
+
+    def test_multi_select_is_retried(self):
+        self.controller.multi_select_elements = MagicMock(
+            side_effect=[StaleElementReferenceException("stale"), None]
+        )
+        Button(self.controller, id="a").multi_select(Button(self.controller, id="b"))
+        self.assertEqual(self.controller.multi_select_elements.call_count, 2)
+
+    def test_drag_errors_are_wrapped(self):
+        error = InvalidSelectorException("invalid selector")
+        self.controller.drag_and_drop = MagicMock(side_effect=error)
+        with self.assertRaises(WidgetDragException) as raised:
+            Button(self.controller, id="a").drag_to(Button(self.controller, id="b"))
+        self.assertIs(raised.exception.original_exception, error)
+
+    def test_text_is_not_retyped_after_send_keys_fails(self):
+        element = MagicMock()
+        element.send_keys.side_effect = StaleElementReferenceException("stale")
+        self.controller.find_element = MagicMock(
+            side_effect=[StaleElementReferenceException("stale"), element]
+        )
+        with self.assertRaises(WidgetEnterTextException):
+            InputField(self.controller, id="query").enter_text("minima")
+        self.assertEqual(self.controller.find_element.call_count, 2)
+        element.send_keys.assert_called_once_with("minima")
+
+    def test_no_retry_without_time_left_for_backoff(self):
+        func = MagicMock(side_effect=StaleElementReferenceException("stale"))
+        with self.assertRaises(StaleElementReferenceException):
+            RetryPolicy(3, backoff=1).call(func, Deadline(0))
+        func.assert_called_once()
+
+
+class TestDeadline(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), _HangingDriverHandler
+        )
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.connection = RemoteConnection(
+            client_config=ClientConfig(
+                f"http://127.0.0.1:{self.server.server_port}", timeout=30
+            )
+        )
+        install_deadline_pools(self.connection)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _get_title_within(self, deadline):
+        token = current_deadline.set(deadline)
+        try:
+            self.connection.execute(Command.GET_TITLE, {"sessionId": "s1"})
+        finally:
+            current_deadline.reset(token)
+
+    def test_request_is_bounded_by_remaining_budget(self):
+        start = time.perf_counter()
+        with self.assertRaises(CommandTimeoutException):
+            self._get_title_within(Deadline(0.2))
+        self.assertLess(time.perf_counter() - start, 1)
+
+    def test_cancel_from_another_thread_aborts_request(self):
+        deadline = Deadline(None)
+        threading.Timer(0.2, deadline.cancel).start()
+        start = time.perf_counter()
+        with self.assertRaises(CommandCancelledException):
+            self._get_title_within(deadline)
+        self.assertLess(time.perf_counter() - start, 1)
+
+    def test_deadline_applies_without_keep_alive(self):
+        with unittest.mock.patch.object(config, "http_keep_alive", False):
+            configure_connection(self.connection)
+        self.assertFalse(self.connection._client_config.keep_alive)
+        start = time.perf_counter()
+        with self.assertRaises(CommandTimeoutException):
+            self._get_title_within(Deadline(0.2))
+        self.assertLess(time.perf_counter() - start, 1)
+
+    def test_nested_deadline_never_extends_parent(self):
+        parent = Deadline(1)
+        self.assertLessEqual(Deadline(60, parent=parent).remaining(), 1)
+        parent.cancel()
+        self.assertTrue(Deadline(60, parent=parent).cancelled)
+
+    def test_cancelling_async_task_cancels_deadline(self):
+        controller = make_controller()
+        seen = []
+
+        def blocking_call():
+            deadline = current_deadline.get()
+            seen.append(deadline)
+            while not deadline.cancelled:
+                time.sleep(0.01)
+
+        async def scenario():
+            task = asyncio.create_task(controller.run_async(blocking_call))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(scenario())
+        self.assertTrue(seen[0].cancelled)
+
+
+class TestConnectionSettings(unittest.TestCase):
+    def test_pool_settings_are_applied_to_driver_connection(self):
+        connection = RemoteConnection(
+            client_config=ClientConfig("http://127.0.0.1:4444")
+        )
+        with unittest.mock.patch.multiple(
+            config, http_pool_maxsize=8, http_timeout=15, http_keep_alive=True
+        ):
+            configure_connection(connection)
+        manager = connection._conn
+        self.assertEqual(manager.connection_pool_kw["maxsize"], 8)
+        self.assertEqual(manager.connection_pool_kw["timeout"], 15)
+        self.assertIs(
+            manager.connection_from_url("http://127.0.0.1:4444").__class__,
+            DeadlineHTTPConnectionPool,
+        )
+
+    def test_connection_without_selenium_internals_is_left_alone(self):
+        with self.assertLogs("Connection", "WARNING"):
+            configure_connection(object())
+
+
+class TestFakeWebDriver(unittest.TestCase):
+    PAGE = (
+        "data:text/html,<title>Fake</title><button id='go'>Go</button>"
+        "<input id='query'><p id='hint' style='display:none'>hidden</p>"
+    )
+
+    def setUp(self):
+        self.server = FakeWebDriver().start()
+        self.controller = BrowserController(
+            "chrome", False, True, remote_url=self.server.url
+        )
+        self.controller.open_url(self.PAGE)
+        self.session = self.server.sessions[self.controller.session_id]
+
+    def tearDown(self):
+        self.controller.close_browser()
+        self.server.stop()
+
+    def test_scenario_runs_against_lxml_dom(self):
+        Button(self.controller, id="go").click()
+        InputField(self.controller, id="query").enter_text("minima")
+        self.assertEqual(self.controller.driver.title, "Fake")
+        self.assertIn(("click", "go"), self.session.events)
+        self.assertEqual(
+            InputField(self.controller, id="query").get_attribute("value"), "minima"
+        )
+
+    def test_hidden_element_is_not_clickable(self):
+        with self.assertRaises(WidgetClickException) as raised:
+            Button(self.controller, id="hint").click(timeout=0.3)
+        self.assertIsInstance(raised.exception.original_exception, TimeoutException)
+
+
+class TestLocatorCompiler(unittest.TestCase):
+    LOCATORS = [
+        {"id": "submit"},
+        {"id": "submit", "class_": "btn primary"},
+        {"data_test": 'say "hi"'},
+        {"name": "q", "type": "text"},
+        {"title": "Terms and conditions"},
+        {"id": "submit", "text": "Send"},
+        {"class_": "btn"},
+    ]
+    PAGE = (
+        "data:text/html,<div id='submit' class='btn primary' data-test='say \"hi\"'>"
+        "<button id='submit' class='btn'>Send</button></div>"
+        "<input name='q' type='TEXT'><input name='q' type='text'>"
+        "<a title='Terms and conditions'>terms</a><span class='btn'>Send</span>"
+    )
+
+    def test_strategy_per_attribute_set(self):
+        self.assertEqual(Button(MagicMock(), id="submit").locator, (By.ID, "submit"))
+        self.assertEqual(
+            Button(MagicMock(), id="a", class_="b").locator,
+            (By.CSS_SELECTOR, '[id="a"][class="b"]'),
+        )
+        self.assertEqual(Button(MagicMock(), id="a", text="Go").locator[0], By.XPATH)
+        self.assertEqual(compile_locator("//*[@type='text']")[0], By.XPATH)
+
+    def test_native_lookup_finds_same_elements_as_xpath(self):
+        with FakeWebDriver() as server:
+            controller = BrowserController("chrome", False, True, remote_url=server.url)
+            try:
+                controller.open_url(self.PAGE)
+                for attributes in self.LOCATORS:
+                    xpath = UIElement(controller, **attributes).xpath
+                    expected = controller.driver.find_elements(By.XPATH, xpath)
+                    found = controller.driver.find_elements(*compile_locator(xpath))
+                    self.assertTrue(expected, xpath)
+                    self.assertEqual(
+                        [element.id for element in found],
+                        [element.id for element in expected],
+                        xpath,
+                    )
+            finally:
+                controller.close_browser()
+
+
+class TestExistenceChecks(unittest.TestCase):
+    def test_checks_do_not_wait(self):
+        with FakeWebDriver() as server:
+            controller = BrowserController("chrome", False, True, remote_url=server.url)
+            try:
+                controller.open_url(
+                    "data:text/html,<p class='row'>1</p><p class='row'>2</p>"
+                    "<div id='banner' style='display:none'>cookies</div>"
+                )
+                start = time.perf_counter()
+                self.assertEqual(UIElement(controller, class_="row").count(), 2)
+                self.assertTrue(UIElement(controller, id="banner").exists())
+                self.assertFalse(UIElement(controller, id="banner").is_visible())
+                self.assertFalse(UIElement(controller, id="missing").exists())
+                self.assertFalse(UIElement(controller, id="missing").is_visible())
+                self.assertLess(time.perf_counter() - start, 1)
+            finally:
+                controller.close_browser()
+
+    def test_first_of_returns_winning_element(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.return_value = {
+            "index": 1,
+            "element": "el-2",
+        }
+        banner, main = Button(controller, id="banner"), Button(controller, id="main")
+        self.assertIs(Browser.first_of([banner, main], session=controller), main)
+        controller.driver.execute_async_script.return_value = None
+        self.assertIsNone(Browser.first_of([banner, main], session=controller))
+
+
+class TestPageReadiness(unittest.TestCase):
+    def test_wait_retries_when_document_is_replaced(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.side_effect = [
+            JavascriptException("document unloaded while waiting for result"),
+            {"ready": True, "readyState": "complete", "inflight": 0, "id": "b"},
+        ]
+        controller.wait_for_page("networkidle", timeout=5)
+        self.assertEqual(controller.driver.execute_async_script.call_count, 2)
+        args = controller.driver.execute_async_script.call_args.args
+        self.assertEqual(args[1], "networkidle")
+        self.assertEqual(args[3], config.network_idle_ms)
+
+    def test_wait_raises_when_page_never_ready(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.return_value = {
+            "ready": False,
+            "readyState": "interactive",
+            "inflight": 2,
+            "id": "a",
+        }
+        with self.assertRaises(BrowserWaitForPageLoadException):
+            controller.wait_for_page("load", timeout=1)
+        with self.assertRaises(ValueError):
+            controller.wait_for_page("idle")
+
+    def test_wait_raises_when_driver_returns_no_state(self):
+        controller = make_controller()
+        controller.driver.execute_async_script.return_value = None
+        with self.assertRaises(WebDriverException):
+            controller.wait_for_page("load", timeout=1)
+
+    @unittest.mock.patch("pyminima.engine.controller.ChromeService")
+    @unittest.mock.patch("pyminima.engine.controller.webdriver.Chrome")
+    def test_page_load_strategy_follows_configured_level(self, chrome, _service):
+        chrome.return_value.session_id = "0123456789"
+        with unittest.mock.patch.object(config, "page_wait_until", "domcontentloaded"):
+            BrowserController("chrome", False, False)
+        options = chrome.call_args.kwargs["options"]
+        self.assertEqual(options.page_load_strategy, "eager")
+
+    def test_open_url_without_page_load_waits_for_new_document(self):
+        controller = make_controller()
+        controller.page_load_strategy = "none"
+        controller.driver.execute_script.return_value = "doc-a"
+        controller.driver.execute_async_script.return_value = {"ready": True}
+        controller.open_url("https://example.com/", "load", timeout=2)
+        controller.driver.execute_script.assert_called_once_with(DOCUMENT_ID_SCRIPT)
+        args = controller.driver.execute_async_script.call_args.args
+        self.assertEqual(args[4:], ("doc-a", config.navigation_grace_ms))
+
+    def test_navigating_click_waits_for_new_document(self):
+        controller = make_controller()
+        controller.find_element = MagicMock(return_value="el-1")
+        controller.driver.execute_script.return_value = "doc-a"
+        controller.driver.execute_async_script.return_value = {"ready": True}
+        controller.click_element("//*[@id='next']", wait_until="load")
+        self.assertEqual(
+            controller.driver.execute_async_script.call_args.args[4], "doc-a"
+        )
+        controller.click_element("//*[@id='next']")
+        controller.driver.execute_script.assert_called_with(
+            CALL_SCRIPT, "click", "el-1"
+        )
+
+    def test_stable_click_waits_for_element_to_settle(self):
+        controller = make_controller()
+        controller.wait_for_element = MagicMock()
+        controller._wait = MagicMock()
+        controller._wait.return_value.until.return_value = "el-1"
+        controller.driver.execute_async_script.return_value = "stable"
+        controller.click_element("//*[@id='tab']", timeout=3, wait_for="stable")
+        self.assertEqual(
+            controller.driver.execute_async_script.call_args.args[1:],
+            ("waitStable", "el-1", 3000),
+        )
+        controller.driver.execute_script.assert_called_with(
+            CALL_SCRIPT, "click", "el-1"
+        )
+
+        controller.driver.execute_async_script.return_value = "covered"
+        with self.assertRaises(ElementNotStableException) as raised:
+            controller.hover_element("//*[@id='tab']", timeout=3, wait_for="stable")
+        self.assertEqual(raised.exception.reason, "covered")
+        with self.assertRaises(ValueError):
+            controller.find_element("//*[@id='tab']", wait_for="idle")
+
+
+class TestStorageState(unittest.TestCase):
+    LOGIN_PAGE = "http://app.test/"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_cache_entries_expire_after_ttl(self):
+        cache = StateCache(self.tmp.name, ttl=60)
+        cache.put("alice", "https://app.test", {"saved_at": time.time(), "cookies": []})
+        self.assertIsNotNone(cache.get("alice", "https://app.test"))
+        self.assertIsNone(cache.get("bob", "https://app.test"))
+        cache.put("alice", "https://app.test", {"saved_at": time.time() - 61})
+        self.assertIsNone(cache.get("alice", "https://app.test"))
+
+    def test_restore_sets_cookies_in_bulk_over_cdp(self):
+        controller = make_controller()
+        controller.restore_state(
+            {
+                "cookies": [
+                    {"name": "sid", "value": "1", "domain": "app.test"},
+                    {"name": "old", "value": "2", "domain": "app.test", "expiry": 1},
+                ],
+                "origins": [
+                    {"origin": "https://app.test", "localStorage": {"token": "t"}}
+                ],
+            }
+        )
+        calls = controller.driver.execute_cdp_cmd.call_args_list
+        self.assertEqual(calls[0].args[0], "Storage.setCookies")
+        self.assertEqual([c["name"] for c in calls[0].args[1]["cookies"]], ["sid"])
+        self.assertEqual(calls[1].args[0], "Page.addScriptToEvaluateOnNewDocument")
+        self.assertIn('"token": "t"', calls[1].args[1]["source"])
+        controller.driver.get.assert_not_called()
+
+    def test_setup_runs_once_per_cache_lifetime(self):
+        logins, seen = [], []
+        with (
+            FakeWebDriver() as server,
+            unittest.mock.patch.object(config, "state_path", self.tmp.name),
+        ):
+            server.add_page(self.LOGIN_PAGE, "<input id='user'>")
+
+            def storage():
+                driver = current_session.get().driver
+                return server.sessions[driver.session_id].origin_storage()
+
+            def login():
+                current_session.get().driver.add_cookie({"name": "sid", "value": "1"})
+                storage()["localStorage"]["token"] = "t"
+                logins.append(True)
+
+            @browser_session(
+                self.LOGIN_PAGE, remote_url=server.url, setup=login, user="alice"
+            )
+            def scenario():
+                cookies = current_session.get().driver.get_cookies()
+                seen.append((cookies[0]["value"], storage()["localStorage"]))
+
+            scenario()
+            scenario()
+
+        self.assertEqual(len(logins), 1)
+        self.assertEqual(seen, [("1", {"token": "t"})] * 2)
+
+
+class TestBrowserContexts(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_context_is_bound_to_its_own_window(self):
+        browser = make_controller()
+        browser.original_window = "main"
+        browser.driver.window_handles = ["main"]
+
+        def execute_cdp_cmd(method, params):
+            if method == "Target.createTarget":
+                browser.driver.window_handles = ["main", "ctx-window"]
+                return {"targetId": "ctx-window"}
+            return {"browserContextId": "ctx-1"}
+
+        browser.driver.execute_cdp_cmd.side_effect = execute_cdp_cmd
+        with (
+            tempfile.TemporaryDirectory() as artifacts,
+            unittest.mock.patch.object(config, "artifacts_path", artifacts),
+        ):
+            context = browser.new_context()
+            self.assertIs(context.driver, browser.driver)
+            self.assertEqual(context.original_window, "ctx-window")
+            browser.driver.switch_to.window.assert_called_with("ctx-window")
+            self.assertFalse(context.recover_from(WebDriverException("gone")))
+
+            context.close_browser()
+        browser.driver.execute_cdp_cmd.assert_called_with(
+            "Target.disposeBrowserContext", {"browserContextId": "ctx-1"}
+        )
+        browser.driver.switch_to.window.assert_called_with("main")
+        browser.driver.quit.assert_not_called()
+
+    def test_context_session_restores_state_into_its_context(self):
+        browser = make_controller()
+        browser.original_window = "main"
+        browser.driver.window_handles = ["main"]
+
+        def execute_cdp_cmd(method, params):
+            if method == "Target.createTarget":
+                browser.driver.window_handles = ["main", "ctx-window"]
+                return {"targetId": "ctx-window"}
+            if method == "Storage.getCookies":
+                return {
+                    "cookies": [{"name": "sid", "value": "new", "domain": "app.test"}]
+                }
+            return {"browserContextId": "ctx-1"}
+
+        browser.driver.execute_cdp_cmd.side_effect = execute_cdp_cmd
+        browser.driver.execute_script.return_value = {"origin": "null"}
+        state = os.path.join(self.tmp.name, "state.json")
+        with open(state, "w") as snapshot:
+            json.dump(
+                {"cookies": [{"name": "sid", "value": "old"}], "origins": []}, snapshot
+            )
+
+        @browser_session("https://app.test/", isolation="context", state=state)
+        def scenario():
+            return current_session.get().save_state()
+
+        with (
+            unittest.mock.patch(
+                "pyminima.engine.context._shared_browser", return_value=browser
+            ),
+            unittest.mock.patch.object(config, "artifacts_path", self.tmp.name),
+            unittest.mock.patch.object(config, "page_wait_until", "none"),
+        ):
+            saved = scenario()
+
+        calls = browser.driver.execute_cdp_cmd.call_args_list
+        self.assertIn(
+            unittest.mock.call(
+                "Storage.setCookies",
+                {
+                    "cookies": [{"name": "sid", "value": "old"}],
+                    "browserContextId": "ctx-1",
+                },
+            ),
+            calls,
+        )
+        self.assertIn(
+            unittest.mock.call("Storage.getCookies", {"browserContextId": "ctx-1"}),
+            calls,
+        )
+        self.assertEqual(saved["cookies"][0]["value"], "new")
+
+    def test_contexts_need_cdp(self):
+        with self.assertRaises(NotImplementedError):
+            make_controller("firefox").new_context()
+
+
+class TestDownloads(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.controller = make_controller()
+        self.controller.download_dir = self.tmp.name
+
+    def _download(self, name, payload, partial_suffix=".crdownload"):
+        partial = os.path.join(self.tmp.name, name + partial_suffix)
+        with open(partial, "wb") as file:
+            file.write(payload[: len(payload) // 2])
+            file.flush()
+            time.sleep(0.2)
+            file.write(payload[len(payload) // 2 :])
+        os.replace(partial, os.path.join(self.tmp.name, name))
+
+    def test_waits_for_partial_file_to_complete(self):
+        with open(os.path.join(self.tmp.name, "old.txt"), "w") as old:
+            old.write("already here")
+        payload = os.urandom(300_000)
+        with self.controller.expect_download(timeout=5) as download:
+            writer = threading.Thread(
+                target=self._download, args=("report.bin", payload)
+            )
+            writer.start()
+        writer.join()
+        self.assertEqual(download.filename, "report.bin")
+        self.assertEqual(download.size, len(payload))
+        self.assertEqual(download.sha256, hashlib.sha256(payload).hexdigest())
+
+    def test_timeout_without_download(self):
+        with self.assertRaises(DownloadTimeoutException):
+            with self.controller.expect_download(timeout=0.3):
+                open(os.path.join(self.tmp.name, "big.iso.part"), "w").close()
+
+    def test_download_dir_is_created_on_use_and_removed_when_empty(self):
+        self.controller.download_dir = os.path.join(self.tmp.name, "session")
+        self.controller.artifacts = MagicMock()
+        with self.assertRaises(DownloadTimeoutException):
+            with self.controller.expect_download(timeout=0.1):
+                self.assertTrue(os.path.isdir(self.controller.download_dir))
+        self.controller.close_browser()
+        self.assertFalse(os.path.exists(self.controller.download_dir))
+
+    def test_remote_sessions_do_not_track_downloads(self):
+        with self.assertRaises(NotImplementedError):
+            with make_controller().expect_download():
+                pass
+
+
+class TestUploads(unittest.TestCase):
+    PAGE = (
+        "data:text/html,<input type='file' id='docs' multiple>"
+        "<input type='file' id='avatar'>"
+    )
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.files = {}
+        for name, size in (("a.bin", 10), ("b.bin", 1_000_000)):
+            path = os.path.join(self.tmp.name, name)
+            with open(path, "wb") as file:
+                file.write(os.urandom(size))
+            self.files[path] = size
+
+    def test_remote_multi_file_upload_is_streamed(self):
+        with FakeWebDriver() as server:
+            controller = BrowserController("chrome", False, True, remote_url=server.url)
+            try:
+                controller.open_url(self.PAGE)
+                FileManager(controller, id="docs").upload_files(list(self.files))
+                value = controller.driver.find_element(By.ID, "docs").get_attribute(
+                    "value"
+                )
+                remote_paths = value.split("\n")
+                self.assertEqual(len(remote_paths), 2)
+                self.assertEqual(len(os.listdir(server.upload_dir)), 2)
+                for local, remote in zip(self.files, remote_paths):
+                    self.assertTrue(remote.startswith(server.upload_dir))
+                    with open(local, "rb") as sent, open(remote, "rb") as received:
+                        self.assertEqual(sent.read(), received.read())
+
+                with self.assertRaises(ValueError):
+                    FileManager(controller, id="avatar").upload_files(list(self.files))
+            finally:
+                controller.close_browser()
+
+    def test_local_upload_sends_paths_in_place(self):
+        controller = make_controller()
+        controller.remote_url = None
+        element = MagicMock()
+        element.get_attribute.return_value = "true"
+        controller._wait = MagicMock()
+        controller._wait.return_value.until.return_value = element
+        controller.upload_files("//input", list(self.files))
+        element.send_keys.assert_called_once_with("\n".join(self.files))
+
+
+class TestScriptRegistry(unittest.TestCase):
+    def test_library_is_installed_lazily_once_per_document(self):
+        driver = MagicMock()
+        driver.execute_script.side_effect = [MISSING, None, None]
+        scripts = ScriptRegistry(driver, supports_cdp=False)
+        scripts.call("click", "el-1")
+        scripts.call("click", "el-2")
+        sent = [call.args[0] for call in driver.execute_script.call_args_list]
+        self.assertEqual(sent, [CALL_SCRIPT, LIBRARY_SCRIPT + CALL_SCRIPT, CALL_SCRIPT])
+        self.assertEqual(scripts.installs, 1)
+        self.assertLess(len(CALL_SCRIPT), len(LIBRARY_SCRIPT) / 20)
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_library_is_registered_on_new_documents_over_cdp(self):
+        driver = MagicMock()
+        ScriptRegistry(driver, supports_cdp=True).batch(
+            [("focus", ["el-1"]), ("setValue", ["el-1", "42"])]
+        )
+        driver.execute_cdp_cmd.assert_called_once_with(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": LIBRARY_SCRIPT}
+        )
+        driver.execute_script.assert_called_once_with(
+            CALL_SCRIPT, "batch", [["focus", ["el-1"]], ["setValue", ["el-1", "42"]]]
+        )
@@ -1,4 +1,26 @@
+from functools import wraps
+from typing import ContextManager
+
 from pyminima.engine.context import current_session
+from pyminima.engine.downloads import Download
+from pyminima.engine.metrics import ACTION_DURATION, registry
+from pyminima.input.keyboard import KeySequence
+from pyminima.ui.ui_element import UIElement, call_with_recovery
+
+
+def browser_call(func):
+    """
+    Decorator for Browser facade calls. Records the call duration in the metrics registry
+    and retries the call once if the browser had to be recovered.
+    """
+
+    @wraps(func)
+    def wrapper(cls, *args, **kwargs):
+        controller = kwargs.get("session") or current_session.get(None)
+        with registry.time(ACTION_DURATION, action=func.__name__, element=cls.__name__):
+            return call_with_recovery(controller, func, cls, *args, **kwargs)
+
+    return wrapper
 
 
 class Browser:
@@ -27,25 +49,157 @@ class Browser:
             )
 
     @classmethod
-    def open_url(cls, url: str, session: object | None = None) -> None:
-        cls._get_active_session(session).open_url(url)
+    @browser_call
+    def open_url(
+        cls, url: str, session: object | None = None, wait_until: str | None = None
+    ) -> None:
+        cls._get_active_session(session).open_url(url, wait_until)
+
+    @classmethod
+    @browser_call
+    def wait_for_page(
+        cls,
+        wait_until: str = "load",
+        timeout: float | None = None,
+        session: object | None = None,
+    ) -> None:
+        cls._get_active_session(session).wait_for_page(wait_until, timeout)
+
+    @classmethod
+    @browser_call
+    def save_state(cls, path: str, session: object | None = None) -> dict:
+        return cls._get_active_session(session).save_state(path)
+
+    @classmethod
+    def expect_download(
+        cls, timeout: float | None = None, session: object | None = None
+    ) -> ContextManager[Download]:
+        return cls._get_active_session(session).expect_download(timeout)
 
     @classmethod
+    @browser_call
     def accept_alert(cls, timeout: int = 5, session: object | None = None) -> None:
         cls._get_active_session(session).accept_alert(timeout)
 
     @classmethod
+    @browser_call
     def switch_to_new_tab(cls, session: object | None = None) -> None:
         cls._get_active_session(session).switch_to_new_tab()
 
     @classmethod
+    @browser_call
     def switch_to_original_tab(cls, session: object | None = None) -> None:
         cls._get_active_session(session).switch_to_original_tab()
 
     @classmethod
+    @browser_call
     def close_current_tab(cls, session: object | None = None) -> None:
         cls._get_active_session(session).close_current_tab()
 
     @classmethod
+    @browser_call
     def close_browser(cls, session: object | None = None) -> None:
         cls._get_active_session(session).close_browser()
+
+    @classmethod
+    @browser_call
+    def type_sequence(
+        cls, sequence: KeySequence | str, session: object | None = None
+    ) -> None:
+        cls._get_active_session(session).type_sequence(sequence)
+
+    @classmethod
+    @browser_call
+    def press_key(cls, key: str, times: int = 1, session: object | None = None) -> None:
+        cls._get_active_session(session).type_sequence(
+            KeySequence().press(key, times=times)
+        )
+
+    @classmethod
+    @browser_call
+    def press_chord(cls, *keys: str, session: object | None = None) -> None:
+        cls._get_active_session(session).type_sequence(KeySequence().chord(*keys))
+
+    @classmethod
+    @browser_call
+    def mock_route(
+        cls,
+        pattern: str,
+        body: str | bytes = b"",
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+        delay: float = 0.0,
+        session: object | None = None,
+    ) -> None:
+        cls._get_active_session(session).network.route(
+            pattern, body, status, headers, delay
+        )
+
+    @classmethod
+    @browser_call
+    def serve_fixtures(
+        cls, directory: str, url_prefix: str, session: object | None = None
+    ) -> None:
+        cls._get_active_session(session).network.serve_fixtures(directory, url_prefix)
+
+    @classmethod
+    @browser_call
+    def set_latency(
+        cls, seconds: float, pattern: str = "*", session: object | None = None
+    ) -> None:
+        cls._get_active_session(session).network.set_latency(seconds, pattern)
+
+    @classmethod
+    @browser_call
+    def record_har(cls, path: str, session: object | None = None) -> None:
+        cls._get_active_session(session).network.record_har(path)
+
+    @classmethod
+    @browser_call
+    def replay_har(
+        cls, path: str, offline: bool = False, session: object | None = None
+    ) -> None:
+        cls._get_active_session(session).network.replay_har(path, offline)
+
+    @classmethod
+    @browser_call
+    def cache_stats(cls, session: object | None = None) -> dict[str, float]:
+        cache = cls._get_active_session(session).network.cache
+        if cache is None:
+            return {}
+        return {**cache.stats, "hit_ratio": cache.hit_ratio}
+
+    @classmethod
+    @browser_call
+    def resolve_all(
+        cls,
+        elements: list[UIElement],
+        timeout: int = 10,
+        visible: bool = True,
+        session: object | None = None,
+    ) -> list[dict[str, object]]:
+        """
+        Resolves many UI elements with one in-page script instead of one wait per element.
+        Each result holds the 'xpath', the 'element' (WebElement or None) and its 'status'.
+        """
+        return cls._get_active_session(session).resolve_all(
+            [element.xpath for element in elements], timeout, visible
+        )
+
+    @classmethod
+    @browser_call
+    def first_of(
+        cls,
+        elements: list[UIElement],
+        timeout: int = 10,
+        visible: bool = True,
+        session: object | None = None,
+    ) -> UIElement | None:
+        """
+        Waits for whichever of several UI elements appears first, in one in-page polling loop,
+        and returns it (or None if none appeared within the timeout).
+        """
+        winner = cls._get_active_session(session).first_of(
+            [element.xpath for element in elements], timeout, visible
+        )
+        return None if winner is None else elements[winner[0]]
@@ -1,4 +1,4 @@
-from pyminima.ui.ui_element import UIElement
+from pyminima.ui.ui_element import UIElement, ui_action, ui_query
 
 
 class Dropdown(UIElement):
@@ -7,6 +7,7 @@ class Dropdown(UIElement):
     Provides methods for selecting and deselecting options.
     """
 
+    @ui_action
     def select_by_text(self, text: str, timeout: int = 10) -> None:
         """
         Selects an option from the dropdown by its visible text.
@@ -18,6 +19,7 @@ class Dropdown(UIElement):
         self.logger.info(f"Selecting '{text}' by text from: {self.xpath}")
         self.controller.select_option_by_text(self.xpath, text, timeout)
 
+    @ui_action
     def select_by_value(self, value: str, timeout: int = 10) -> None:
         """
         Selects an option from the dropdown by its 'value' attribute.
@@ -29,6 +31,7 @@ class Dropdown(UIElement):
         self.logger.info(f"Selecting value '{value}' from: {self.xpath}")
         self.controller.select_option_by_value(self.xpath, value, timeout)
 
+    @ui_action
     def select_by_index(self, index: int, timeout: int = 10) -> None:
         """
         Selects an option from the dropdown by its index (0-based).
@@ -40,6 +43,7 @@ class Dropdown(UIElement):
         self.logger.info(f"Selecting index {index} from: {self.xpath}")
         self.controller.select_option_by_index(self.xpath, index, timeout)
 
+    @ui_action
     def deselect_all(self, timeout: int = 10) -> None:
         """
         Deselects all options in a multi-select dropdown.
@@ -50,6 +54,7 @@ class Dropdown(UIElement):
         self.logger.info(f"Deselecting all options from: {self.xpath}")
         self.controller.deselect_all_options(self.xpath, timeout)
 
+    @ui_action
     def deselect_by_text(self, text: str, timeout: int = 10) -> None:
         """
         Deselects an option from a multi-select dropdown by its visible text.
@@ -61,6 +66,7 @@ class Dropdown(UIElement):
         self.logger.info(f"Deselecting '{text}' by text from: {self.xpath}")
         self.controller.deselect_option_by_text(self.xpath, text, timeout)
 
+    @ui_query
     def get_selected_texts(self, timeout: int = 10) -> list[str]:
         """
         Gets the text of all selected options from the dropdown.
@@ -1,4 +1,4 @@
-from pyminima.ui.ui_element import UIElement
+from pyminima.ui.ui_element import UIElement, ui_action
 
 
 class FileManager(UIElement):
@@ -6,6 +6,7 @@ class FileManager(UIElement):
     Class representing file upload inputs (e.g., <input type="file">).
     """
 
+    @ui_action
     def upload_file(self, file_path: str, timeout: int = 10) -> None:
         """
         Uploads a file to the element.
@@ -20,3 +21,19 @@ class FileManager(UIElement):
         except Exception as e:
             self.logger.error(f"Failed to upload file. Error: {e}")
             raise
+
+    @ui_action
+    def upload_files(self, file_paths: list[str], timeout: int = 10) -> None:
+        """
+        Uploads several files at once to an input with the `multiple` attribute.
+
+        Args:
+            file_paths (list[str]): The absolute paths of the files to upload.
+            timeout (int): Maximum time to wait for the element. Default is 10s.
+        """
+        self.logger.info(f"Uploading {len(file_paths)} files to: {self.xpath}")
+        try:
+            self.controller.upload_files(self.xpath, file_paths, timeout)
+        except Exception as e:
+            self.logger.error(f"Failed to upload files. Error: {e}")
+            raise
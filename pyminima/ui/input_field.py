@@ -1,4 +1,5 @@
-from pyminima.ui.ui_element import UIElement
+from pyminima.settings.exceptions import WidgetEnterTextException
+from pyminima.ui.ui_element import UIElement, ui_action
 
 
 class InputField(UIElement):
@@ -7,6 +8,7 @@ class InputField(UIElement):
     Provides specific methods for entering text and setting values.
     """
 
+    @ui_action
     def enter_text(self, text: str, timeout: int = 10) -> None:
         """
         Enters text into the input field.
@@ -20,8 +22,9 @@ class InputField(UIElement):
             self.controller.enter_text_safely(self.xpath, text, timeout)
         except Exception as e:
             self.logger.error(f"Failed to enter text. Error: {e}")
-            raise
+            raise WidgetEnterTextException(self.xpath, text, e) from e
 
+    @ui_action
     def set_value(self, value: str, timeout: int = 10) -> None:
         """
         Sets the value of an element directly using JavaScript.
@@ -0,0 +1,128 @@
+import pandas as pd
+
+from pyminima.ui.ui_element import UIElement, ui_query
+
+
+class Table(UIElement):
+    """
+    Class representing HTML tables (<table>) and ARIA grids (role="grid" / "table").
+    Provides bulk extraction into a pandas DataFrame.
+    """
+
+    @ui_query
+    def to_dataframe(
+        self,
+        chunk_rows: int = 2000,
+        virtualized: bool = False,
+        dtypes: dict[str, str] | None = None,
+        decimal: str = ".",
+        thousands: str | None = None,
+        timeout: int = 10,
+    ) -> pd.DataFrame:
+        """
+        Extracts the table into a DataFrame, transferring rows in chunks with one script call
+        per chunk instead of one `properties()` call per cell.
+
+        Columns are converted with vectorised pandas operations: a column becomes numeric when
+        every non-empty cell parses as a number; `dtypes` overrides the conversion per column
+        ('int', 'float', 'bool', 'str', 'category' or 'datetime').
+        Blank and repeated headers are made unique (`column_<index>`, `Name_1`).
+
+        Args:
+            chunk_rows (int): Number of rows transferred per script call. Default is 2000.
+            virtualized (bool): Whether the grid only renders visible rows and must be scrolled. Default is False.
+            dtypes (dict[str, str] | None): Explicit column types. Default is None.
+            decimal (str): Decimal separator used in numeric cells. Default is '.'.
+            thousands (str | None): Thousands separator used in numeric cells. Default is None.
+            timeout (int): Maximum time to wait for the element. Default is 10s.
+
+        Returns:
+            pd.DataFrame: The table content, one row per body row.
+        """
+        self.logger.info(f"Extracting table: {self.xpath}")
+        try:
+            if virtualized:
+                headers, rows = self.controller.read_virtualized_table(
+                    self.xpath, timeout=timeout
+                )
+            else:
+                headers, rows = self.controller.read_table(
+                    self.xpath, chunk_rows, timeout
+                )
+        except Exception as e:
+            self.logger.error(f"Failed to extract table. Error: {e}")
+            raise
+
+        return self._build_dataframe(headers, rows, dtypes or {}, decimal, thousands)
+
+    @staticmethod
+    def _build_dataframe(
+        headers: list[str],
+        rows: list[list[str]],
+        dtypes: dict[str, str],
+        decimal: str,
+        thousands: str | None,
+    ) -> pd.DataFrame:
+        """
+        Builds a typed DataFrame from the raw cell texts.
+        """
+        width = max([len(headers)] + [len(row) for row in rows])
+        columns = _column_names(headers, width)
+        padded = [row + [""] * (width - len(row)) for row in rows]
+        frame = pd.DataFrame(padded, columns=columns, dtype="string")
+
+        for column in frame.columns:
+            frame[column] = _convert_column(
+                frame[column], dtypes.get(column), decimal, thousands
+            )
+        return frame
+
+
+def _column_names(headers: list[str], width: int) -> list[str]:
+    """
+    Returns one unique name per column: blank and missing headers become `column_<index>`,
+    and repeated ones get a `_<n>` suffix (e.g. 'Name', 'Name_1').
+    """
+    names: list[str] = []
+    for index in range(width):
+        header = headers[index] if index < len(headers) else ""
+        base = header if header.strip() else f"column_{index}"
+        name, count = base, 0
+        while name in names:
+            count += 1
+            name = f"{base}_{count}"
+        names.append(name)
+    return names
+
+
+def _convert_column(
+    column: pd.Series, dtype: str | None, decimal: str, thousands: str | None
+) -> pd.Series:
+    """
+    Converts a column of cell texts, either to the requested dtype or to numbers when
+    every non-empty cell is numeric.
+    """
+    if dtype == "datetime":
+        return pd.to_datetime(column, errors="coerce")
+    if dtype in ("str", "string"):
+        return column
+    if dtype == "bool":
+        return column.str.strip().str.lower().isin(("true", "1", "yes"))
+    if dtype == "category":
+        return column.astype("category")
+
+    numeric_text = column
+    if thousands:
+        numeric_text = numeric_text.str.replace(thousands, "", regex=False)
+    if decimal != ".":
+        numeric_text = numeric_text.str.replace(decimal, ".", regex=False)
+    numeric = pd.to_numeric(numeric_text.replace("", pd.NA), errors="coerce")
+
+    if dtype is not None:
+        return numeric.astype("Int64" if dtype == "int" else dtype)
+    filled = column.ne("").sum()
+    if not filled or numeric.notna().sum() != filled:
+        return column
+    if (numeric.dropna() % 1 == 0).all():
+        return numeric.astype("Int64")
+    return numeric.astype("Float64")
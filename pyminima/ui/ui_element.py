@@ -1,9 +1,103 @@
+import inspect
 import re
 import time
+from contextlib import nullcontext
+from functools import wraps
+from typing import Iterator
 
 from pyminima.engine.context import current_session
+from pyminima.engine.locators import compile_locator
+from pyminima.engine.metrics import ACTION_DURATION, registry
+from pyminima.engine.retry import RetryPolicy, mark_applied, root_cause
 from pyminima.logs.logger_utils import initialize_logger
-from pyminima.settings.exceptions import ElementNotVisibleException
+from pyminima.settings.exceptions import (
+    ElementNotVisibleException,
+    WidgetAttributeException,
+    WidgetClickException,
+    WidgetDoubleClickException,
+    WidgetDragException,
+    WidgetEnterTextException,
+    WidgetHoverException,
+    WidgetRetrievePropertiesException,
+    WidgetScrollException,
+)
+from pyminima.settings.settings import config
+
+
+def call_with_recovery(controller: object, func, *args, **kwargs):
+    """
+    Calls `func`; if it fails because the browser crashed or hung, lets the controller
+    restart the session (see `BrowserController.recover_from`) and retries the call once.
+    """
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        if controller is None or not controller.recover_from(root_cause(e)):
+            raise
+    return func(*args, **kwargs)
+
+
+def ui_query(func):
+    """
+    Decorator for UI element reads (properties, waits). Records the call duration in the
+    metrics registry, keyed by action name and element class, and retries the call once
+    if the browser had to be recovered.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with registry.time(
+            ACTION_DURATION, action=func.__name__, element=self.__class__.__name__
+        ):
+            return call_with_recovery(self.controller, func, self, *args, **kwargs)
+
+    return wrapper
+
+
+def ui_action(func):
+    """
+    Decorator for UI element actions. Records the call duration and recovers like `ui_query`, and runs
+    the controller's `after_action` hook once the action succeeds (e.g. for per-action screenshots).
+
+    The action's `timeout` argument is a deadline for the whole attempt (lookup, wait and
+    action): every driver command it issues is bounded by the time left, and can be
+    cancelled with `BrowserController.cancel()`.
+
+    Transient failures (stale, covered or not yet interactable elements) are retried within
+    that deadline, with backoff (see `RetryPolicy`); each retry locates the element again.
+    """
+    signature = inspect.signature(func)
+
+    def budgeted(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        budget = bound.arguments.get("timeout")
+        deadline = getattr(self.controller, "deadline", None)
+        policy = RetryPolicy(
+            config.max_retries, config.retry_backoff, config.retry_max_backoff
+        )
+        with (
+            deadline(budget) if budget is not None and deadline else nullcontext()
+        ) as active:
+            return policy.call(
+                lambda: func(self, *args, **kwargs),
+                active,
+                action=func.__name__,
+                element=self.__class__.__name__,
+            )
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with registry.time(
+            ACTION_DURATION, action=func.__name__, element=self.__class__.__name__
+        ):
+            result = call_with_recovery(
+                self.controller, budgeted, self, *args, **kwargs
+            )
+        self.controller.after_action(f"{self.__class__.__name__}.{func.__name__}")
+        return result
+
+    return wrapper
 
 
 class UIElement:
@@ -44,9 +138,11 @@ class UIElement:
         self.controller = self.session
         self.attrs = kwargs
         self.xpath = self._build_xpath()
+        self.locator = compile_locator(self.xpath)
 
         self.logger.debug(
-            f"Constructed XPath for {self.__class__.__name__}: {self.xpath}"
+            f"Constructed XPath for {self.__class__.__name__}: {self.xpath} "
+            f"(lookup: {self.locator[0]} {self.locator[1]})"
         )
 
     def _build_xpath(self) -> str:
@@ -108,20 +204,33 @@ class UIElement:
         }
 
     # Core Action Methods
-    def click(self, timeout: int = 10) -> None:
+    @ui_action
+    def click(
+        self,
+        timeout: int = 10,
+        wait_until: str | None = None,
+        wait_for: str | None = None,
+    ) -> None:
         """
         Clicks on the element identified by the constructed XPath.
 
         Args:
             timeout (int): Maximum time to wait for the element to be present. Default is 10s.
+            wait_until (str | None): Readiness level to wait for after a click that navigates or loads
+                content ('domcontentloaded', 'load' or 'networkidle'). Default is None (no wait).
+            wait_for (str | None): What the element must be before the click: 'clickable' or 'stable'
+                (not moving and not covered, e.g. after a CSS transition). Default is `PYAUTOTK_ELEMENT_WAIT_FOR`.
         """
         self.logger.info(f"Attempting to click: {self.xpath} (Timeout: {timeout}s)")
         try:
-            self.controller.click_element(self.xpath, timeout)
+            self.controller.click_element(
+                self.xpath, timeout, wait_until, wait_for=wait_for
+            )
         except Exception as e:
             self.logger.error(f"Failed to click: {self.xpath}. Error: {e}")
-            raise
+            raise WidgetClickException(self.xpath, e) from e
 
+    @ui_action
     def double_click(self, delay: float = 0.1, timeout: int = 10) -> None:
         """
         Performs a double-click on the element.
@@ -133,26 +242,31 @@ class UIElement:
         self.logger.info(f"Performing double-click: {self.xpath}")
         try:
             for _ in range(2):
-                self.click(timeout)
+                self.controller.click_element(self.xpath, timeout)
+                # Repeating the pair after a click went through would click three times.
+                mark_applied()
                 time.sleep(delay)
         except Exception as e:
             self.logger.error(f"Failed to double-click. Error: {e}")
-            raise
+            raise WidgetDoubleClickException(self.xpath, e) from e
 
-    def hover(self, timeout: int = 10) -> None:
+    @ui_action
+    def hover(self, timeout: int = 10, wait_for: str | None = None) -> None:
         """
         Simulates a mouse hover action over the element.
 
         Args:
             timeout (int): Maximum time to wait for the element to be present. Default is 10s.
+            wait_for (str | None): 'clickable' or 'stable' (see `click`). Default is `PYAUTOTK_ELEMENT_WAIT_FOR`.
         """
         self.logger.info(f"Hovering over: {self.xpath}")
         try:
-            self.controller.hover_element(self.xpath)
+            self.controller.hover_element(self.xpath, timeout, wait_for)
         except Exception as e:
             self.logger.error(f"Failed to hover. Error: {e}")
-            raise
+            raise WidgetHoverException(self.xpath, e) from e
 
+    @ui_action
     def unhover(self, timeout: int = 10) -> None:
         """
         Moves the mouse away from the current element to remove the hover state.
@@ -165,8 +279,9 @@ class UIElement:
             self.controller.unhover_element(timeout)
         except Exception as e:
             self.logger.error(f"Failed to unhover. Error: {e}")
-            raise
+            raise WidgetHoverException(self.xpath, e) from e
 
+    @ui_action
     def scroll_to(self, timeout: int = 10) -> None:
         """
         Scrolls the browser view to the element.
@@ -179,24 +294,87 @@ class UIElement:
             self.controller.scroll_to_element(self.xpath, timeout)
         except Exception as e:
             self.logger.error(f"Failed to scroll. Error: {e}")
-            raise
+            raise WidgetScrollException(self.xpath, e) from e
 
-    def drag_to(self, target_widget: "Widget", timeout: int = 10) -> None:
+    @ui_action
+    def drag_to(
+        self, target_widget: "Widget", timeout: int = 10, wait_for: str | None = None
+    ) -> None:
         """
         Drags the current widget and drops it onto the target widget.
 
         Args:
             target_widget (UIElement): The widget instance to drop onto.
             timeout (int): Maximum time to wait for the elements. Default is 10s.
+            wait_for (str | None): 'clickable' or 'stable' (see `click`), for both elements.
+                Default is `PYAUTOTK_ELEMENT_WAIT_FOR`.
         """
         self.logger.info(f"Dragging '{self.xpath}' to '{target_widget.xpath}'.")
         try:
-            self.controller.drag_and_drop(self.xpath, target_widget.xpath, timeout)
+            self.controller.drag_and_drop(
+                self.xpath, target_widget.xpath, timeout, wait_for
+            )
         except Exception as e:
             self.logger.error(f"Failed to drag and drop. Error: {e}")
-            raise
+            raise WidgetDragException(self.xpath, e) from e
+
+    @ui_action
+    def hover_path(self, points: list[tuple[int, int]], timeout: int = 10) -> None:
+        """
+        Moves the pointer through a sequence of points over the element in one actions command.
+
+        Args:
+            points (list[tuple[int, int]]): (x, y) offsets from the element center.
+            timeout (int): Maximum time to wait for the element. Default is 10s.
+        """
+        self.logger.info(f"Hovering along {len(points)} point(s) over: {self.xpath}")
+        try:
+            self.controller.hover_path(self.xpath, points, timeout)
+        except Exception as e:
+            self.logger.error(f"Failed to hover along path. Error: {e}")
+            raise WidgetHoverException(self.xpath, e) from e
+
+    @ui_action
+    def draw(self, points: list[tuple[int, int]], timeout: int = 10) -> None:
+        """
+        Presses on the first point, drags through the remaining points and releases on the last one.
+        Useful for drawing on <canvas> elements and for smooth drag paths.
+
+        Args:
+            points (list[tuple[int, int]]): (x, y) offsets from the element center.
+            timeout (int): Maximum time to wait for the element. Default is 10s.
+        """
+        self.logger.info(f"Drawing {len(points)} point(s) on: {self.xpath}")
+        try:
+            self.controller.draw_on_element(self.xpath, points, timeout)
+        except Exception as e:
+            self.logger.error(f"Failed to draw. Error: {e}")
+            raise WidgetDragException(self.xpath, e) from e
+
+    @ui_action
+    def multi_select(
+        self, *others: "UIElement", modifier: str = "ctrl", timeout: int = 10
+    ) -> None:
+        """
+        Clicks this element and the given ones while holding a modifier key (e.g. Ctrl+click list items).
+
+        Args:
+            *others (UIElement): Additional elements to click, in order.
+            modifier (str): The modifier key to hold. Default is 'ctrl'.
+            timeout (int): Maximum time to wait for each element. Default is 10s.
+        """
+        xpaths = [self.xpath] + [other.xpath for other in others]
+        self.logger.info(
+            f"Multi-selecting {len(xpaths)} element(s) holding '{modifier}'."
+        )
+        try:
+            self.controller.multi_select_elements(xpaths, modifier, timeout)
+        except Exception as e:
+            self.logger.error(f"Failed to multi-select. Error: {e}")
+            raise WidgetClickException(self.xpath, e) from e
 
     # Core Data & Wait Methods
+    @ui_query
     def wait_for(self, timeout: int = 10) -> object:
         """
         Waits until the element identified by the XPath is visible.
@@ -217,6 +395,37 @@ class UIElement:
             self.logger.error(f"Failed to wait for: {self.xpath}. Error: {e}")
             raise ElementNotVisibleException(self.xpath, timeout, e)
 
+    @ui_query
+    def exists(self) -> bool:
+        """
+        Checks, without waiting, whether the element is present in the page.
+
+        Returns:
+            bool: Whether at least one element matches the locator.
+        """
+        return bool(self.controller.find_elements_now(self.xpath))
+
+    @ui_query
+    def is_visible(self) -> bool:
+        """
+        Checks, without waiting, whether the element is present and displayed.
+
+        Returns:
+            bool: Whether the first matching element is displayed.
+        """
+        return self.controller.is_element_visible(self.xpath)
+
+    @ui_query
+    def count(self) -> int:
+        """
+        Counts, without waiting, the elements matching the locator.
+
+        Returns:
+            int: The number of matching elements.
+        """
+        return len(self.controller.find_elements_now(self.xpath))
+
+    @ui_query
     def properties(self, timeout: int = 10) -> dict[str, object]:
         """
         Extracts and returns properties of the first element identified by the XPath.
@@ -232,8 +441,9 @@ class UIElement:
             return self._extract_element_properties(element)
         except Exception as e:
             self.logger.error(f"Failed to retrieve properties. Error: {e}")
-            raise
+            raise WidgetRetrievePropertiesException(self.xpath, e) from e
 
+    @ui_query
     def get_attribute(self, attribute_name: str, timeout: int = 10) -> str:
         """
         Retrieves the value of a specific attribute from the element.
@@ -250,7 +460,60 @@ class UIElement:
             return element.get_attribute(attribute_name)
         except Exception as e:
             self.logger.error(f"Failed to get attribute '{attribute_name}'. Error: {e}")
-            raise
+            raise WidgetAttributeException(self.xpath, attribute_name, e) from e
+
+    def watch(
+        self,
+        attributes: list[str] | None = None,
+        text: bool = False,
+        timeout: float | None = None,
+        poll_timeout: float = 5,
+    ) -> Iterator[dict[str, object]]:
+        """
+        Streams changes of the element, observed in the page by a MutationObserver.
+        Changes are buffered in the page and fetched in batches with a long-poll, so there
+        is no busy polling of `properties()`.
+
+        Example:
+            for change in Text(id="hover-status").watch(text=True, timeout=5):
+                if "está sobre" in change["value"]:
+                    break
+
+        Args:
+            attributes (list[str] | None): Attribute names to watch. Defaults to every attribute
+                when `text` is False, and to none when `text` is True.
+            text (bool): Whether to report changes to the element's text content. Default is False.
+            timeout (float | None): Stop streaming after this many seconds. Default is None (no limit).
+            poll_timeout (float): Maximum time each long-poll waits in the page. Default is 5s.
+
+        Yields:
+            dict[str, object]: A change with the keys 'type' ('attribute' or 'text'), 'name',
+                'old_value', 'value' and 'time' (page timestamp in milliseconds).
+        """
+        if attributes is None and not text:
+            attributes = []
+        self.logger.info(f"Watching changes on: {self.xpath}")
+        watch_id = self.controller.start_watch(self.xpath, attributes, text)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while True:
+                wait = poll_timeout
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        return
+                changes = self.controller.poll_watch(watch_id, wait)
+                if changes is None:
+                    self.logger.warning(
+                        f"Watch on {self.xpath} ended: the page navigated away."
+                    )
+                    return
+                yield from changes
+        finally:
+            try:
+                self.controller.stop_watch(watch_id)
+            except Exception as e:
+                self.logger.debug(f"Failed to stop watch. Error: {e}")
 
     def _all_properties(self, timeout: int = 10) -> list[dict[str, object]]:
         """
@@ -267,4 +530,4 @@ class UIElement:
             return [self._extract_element_properties(el) for el in elements]
         except Exception as e:
             self.logger.error(f"Failed to retrieve all properties. Error: {e}")
-            raise
+            raise WidgetRetrievePropertiesException(self.xpath, e) from e